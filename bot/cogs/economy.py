@@ -69,6 +69,33 @@ class Economy(commands.Cog):
             
         except Exception as e:
             logger.error(f"Failed to add wallet event: {e}")
+
+    async def add_wallet_events_bulk(self, events: list):
+        """Add many wallet transaction events in one round-trip
+
+        Each event is a (guild_id, discord_id, amount, event_type, description) tuple.
+        """
+        if not events:
+            return
+
+        try:
+            now = datetime.now(timezone.utc)
+            event_docs = [
+                {
+                    "guild_id": guild_id,
+                    "discord_id": discord_id,
+                    "amount": amount,
+                    "event_type": event_type,
+                    "description": description,
+                    "timestamp": now
+                }
+                for guild_id, discord_id, amount, event_type, description in events
+            ]
+
+            await self.bot.db_manager.db.wallet_events.insert_many(event_docs, ordered=False)
+
+        except Exception as e:
+            logger.error(f"Failed to add {len(events)} wallet events: {e}")
     
     @discord.slash_command(name="balance", description="Check your wallet balance")
     async def balance(self, ctx: discord.ApplicationContext):
@@ -305,7 +305,7 @@ class LeaderboardsFixed(commands.Cog):
                     'thumbnail_url': 'attachment://WeaponStats.png'
                 }
 
-                embed, file = await EmbedFactory.build('leaderboard', embed_data)
+                embed, file = EmbedFactory.build('leaderboard', embed_data)
                 return embed, file
 
             elif stat_type == 'factions':
@@ -396,7 +396,7 @@ class LeaderboardsFixed(commands.Cog):
                     'thumbnail_url': 'attachment://Faction.png'
                 }
 
-                embed, file = await EmbedFactory.build('leaderboard', embed_data)
+                embed, file = EmbedFactory.build('leaderboard', embed_data)
                 return embed, file
 
             else:
@@ -432,7 +432,7 @@ class LeaderboardsFixed(commands.Cog):
                 'thumbnail_url': thumbnail_map.get(stat_type, 'attachment://Leaderboard.png')
             }
 
-            embed, file = await EmbedFactory.build('leaderboard', embed_data)
+            embed, file = EmbedFactory.build('leaderboard', embed_data)
             return embed, file
 
         except Exception as e:
@@ -292,7 +292,7 @@ class Stats(commands.Cog):
                 'thumbnail_url': 'attachment://main.png'
             }
 
-            embed, file = await EmbedFactory.build('stats', embed_data)
+            embed, file = EmbedFactory.build('stats', embed_data)
 
             if file:
                 await ctx.followup.send(embed=embed, file=file)
@@ -357,7 +357,7 @@ class Stats(commands.Cog):
                 'requester': ctx.author.display_name
             }
 
-            embed, file_attachment = await EmbedFactory.build('comparison', embed_data)
+            embed, file_attachment = EmbedFactory.build('comparison', embed_data)
 
             if file_attachment:
                 await ctx.followup.send(embed=embed, file=file_attachment)
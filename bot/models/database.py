@@ -10,6 +10,7 @@ from typing import Optional, Dict, List, Any
 from datetime import datetime, timezone, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
 
 logger = logging.getLogger(__name__)
 
@@ -801,6 +802,50 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to save parser state: {e}")
 
+    async def bulk_save_parser_states(self, states: List[tuple], parser_type: str = "log_parser"):
+        """Save many (guild_id, server_id, state_data) parser states in one bulk write"""
+        if not states:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            operations = [
+                UpdateOne(
+                    {
+                        "guild_id": guild_id,
+                        "server_id": server_id,
+                        "parser_type": parser_type
+                    },
+                    {
+                        "$set": {
+                            "guild_id": guild_id,
+                            "server_id": server_id,
+                            "parser_type": parser_type,
+                            "last_updated": now,
+                            **state_data
+                        }
+                    },
+                    upsert=True
+                )
+                for guild_id, server_id, state_data in states
+            ]
+            await self.parser_states.bulk_write(operations, ordered=False)
+            logger.debug(f"Saved {len(operations)} parser states")
+        except Exception as e:
+            logger.error(f"Failed to bulk save parser states: {e}")
+
+    async def get_parser_states_by_type(self, parser_type: str = "log_parser") -> Dict[tuple, Dict[str, Any]]:
+        """Get every parser state of a type in one query, keyed by (guild_id, server_id)"""
+        try:
+            states = {}
+            async for state in self.parser_states.find({"parser_type": parser_type}):
+                server_id = state.get("server_id")
+                if server_id:
+                    states[(state.get("guild_id"), str(server_id))] = state
+            return states
+        except Exception as e:
+            logger.error(f"Failed to get parser states: {e}")
+            return {}
+
     async def get_all_parser_states(self, guild_id: int, parser_type: str = "log_parser") -> Dict[str, Dict[str, Any]]:
         """Get all parser states for a guild"""
         try:
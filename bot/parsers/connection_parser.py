@@ -366,7 +366,7 @@ class ConnectionLifecycleParser:
             'timestamp': datetime.now(timezone.utc)
         }
         
-        embed, file_attachment = await EmbedFactory.build('player_join', embed_data)
+        embed, file_attachment = EmbedFactory.build('player_join', embed_data)
         result = {'type': 'player_connection', 'embed': embed, 'file': file_attachment}
         
         # Mark as sent to prevent duplicates
@@ -399,7 +399,7 @@ class ConnectionLifecycleParser:
             'timestamp': datetime.now(timezone.utc)
         }
         
-        embed, file_attachment = await EmbedFactory.build('player_leave', embed_data)
+        embed, file_attachment = EmbedFactory.build('player_leave', embed_data)
         result = {'type': 'player_disconnection', 'embed': embed, 'file': file_attachment}
         
         # Mark as sent to prevent duplicates
@@ -10,12 +10,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-import aiofiles
 import asyncssh
 import discord
 from discord.ext import commands
 
-from .killfeed_parser import KillfeedParser
+from .killfeed_parser import KillfeedParser, _read_text_file
 
 logger = logging.getLogger(__name__)
 
@@ -63,9 +62,8 @@ class HistoricalParser:
             csv_files.sort()
 
             for csv_file in csv_files:
-                async with aiofiles.open(csv_file, 'r') as f:
-                    content = await f.read()
-                    all_lines.extend(content.splitlines())
+                content = await asyncio.to_thread(_read_text_file, csv_file)
+                all_lines.extend(content.splitlines())
 
             return all_lines
 
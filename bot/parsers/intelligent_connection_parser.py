@@ -135,6 +135,19 @@ class IntelligentConnectionParser:
             'server_max_players': re.compile(r'LogSFPS:.*playersmaxcount=(\d+)', re.IGNORECASE)
         }
 
+        # Patterns that parse_connection_event actually dispatches on
+        self.connection_event_patterns = (
+            'queue_join', 'beacon_join', 'player_joined', 'disconnect',
+            'disconnect_alt', 'beacon_disconnect', 'server_max_players'
+        )
+
+    def matches_connection_event(self, line: str) -> bool:
+        """Cheap synchronous check for lines parse_connection_event acts on"""
+        for pattern_name in self.connection_event_patterns:
+            if self.patterns[pattern_name].search(line):
+                return True
+        return False
+
     def initialize_server_tracking(self, server_key: str):
         """Initialize tracking structures for a server"""
         if server_key not in self.player_states:
@@ -368,7 +381,7 @@ class IntelligentConnectionParser:
                 'timestamp': datetime.now(timezone.utc)
             }
 
-            embed, file_attachment = await EmbedFactory.build('player_join', embed_data)
+            embed, file_attachment = EmbedFactory.build('player_join', embed_data)
 
             await self.bot.batch_sender.queue_embed(
                 channel_id=connections_channel_id,
@@ -403,7 +416,7 @@ class IntelligentConnectionParser:
                 'timestamp': datetime.now(timezone.utc)
             }
 
-            embed, file_attachment = await EmbedFactory.build('player_leave', embed_data)
+            embed, file_attachment = EmbedFactory.build('player_leave', embed_data)
 
             await self.bot.batch_sender.queue_embed(
                 channel_id=connections_channel_id,
@@ -8,11 +8,11 @@ import logging
 import os
 import re
 import hashlib
+from concurrent.futures import Executor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple
 
-import aiofiles
 import discord
 import asyncssh
 from discord.ext import commands
@@ -21,6 +21,50 @@ from bot.utils.embed_factory import EmbedFactory
 
 logger = logging.getLogger(__name__)
 
+
+# Lowercased substrings, one of which every analysis pattern needs - lines with none of them cannot match
+_LINE_KEYWORDS = (
+    b'log file open', b'bringing world', b'loadmap', b'playersmaxcount', b'join request',
+    b'beacon join', b'accepted from', b'notifyacceptedconnection', b'uchannel::close',
+    b'mission', b'vehicle', b'airdrop', b'helicrash', b'trader'
+)
+
+
+# Analysis event types posted to the guild events channel
+_GAME_EVENT_TYPES = frozenset({
+    'mission_ready', 'mission_in_progress', 'mission_completed', 'airdrop', 'helicrash', 'trader_spawn'
+})
+
+
+def _keyword_lines(data: bytes) -> List[str]:
+    """Decode only the lines of a raw buffer that contain at least one analysis keyword"""
+    lines = []
+    for line in data.splitlines():
+        lowered = line.lower()
+        if any(keyword in lowered for keyword in _LINE_KEYWORDS):
+            lines.append(line.decode('utf-8', errors='ignore'))
+    return lines
+
+
+def _read_lines_from(file_path: str, offset: int) -> Tuple[List[str], int]:
+    """Blocking read of all candidate lines after offset, run via asyncio.to_thread"""
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+        return _keyword_lines(data), offset + len(data)
+
+
+def _split_lines_from(content: bytes, offset: int) -> Tuple[List[str], int]:
+    """Candidate lines of an in-memory log buffer after offset, run via asyncio.to_thread"""
+    return _keyword_lines(content[offset:]), len(content)
+
+
+def _read_file_head(file_path: str, size: int) -> bytes:
+    """Blocking read of the first size bytes, run via asyncio.to_thread"""
+    with open(file_path, 'rb') as f:
+        return f.read(size)
+
+
 class IntelligentLogParser:
     """
     INTELLIGENT LOG PARSER - PHASE 1 COMPLETE IMPLEMENTATION
@@ -132,45 +176,87 @@ class IntelligentLogParser:
             # Get last position or start from beginning
             last_position = self.last_log_position.get(log_key, 0)
             
-            async with aiofiles.open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                await f.seek(last_position)
-                new_lines = await f.readlines()
-                new_position = await f.tell()
-            
-            if not new_lines:
-                return {'events_processed': 0}
-            
-            # Process each line with comprehensive pattern matching
-            events = []
-            for line_num, line in enumerate(new_lines, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Extract timestamp
-                timestamp = self._extract_timestamp(line)
-                
-                # Analyze line for all possible events
-                event_data = await self._analyze_line(line, timestamp, guild_id, server_id)
-                if event_data:
-                    events.extend(event_data)
-            
-            # Update log position
-            self.last_log_position[log_key] = new_position
-            
-            # Process and dispatch events
-            await self._dispatch_events(events, guild_id, server_id)
-            
-            return {
-                'events_processed': len(events),
-                'lines_analyzed': len(new_lines),
-                'server_status': self.server_status.get(f"{guild_id}_{server_id}", {})
-            }
+            new_lines, new_position = await asyncio.to_thread(_read_lines_from, file_path, last_position)
+            return await self._process_new_lines(new_lines, new_position, guild_id, server_id)
             
         except Exception as e:
             logger.error(f"Error parsing log file {file_path}: {e}")
             return {'error': str(e)}
 
+    async def parse_log_content(self, content: bytes, guild_id: int, server_id: str,
+                                executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """
+        Same exhaustive analysis as parse_log_file over an in-memory log buffer,
+        without a temporary file round trip. Line splitting runs on executor when
+        given (e.g. a process pool for large cold-start buffers), in a thread otherwise
+        """
+        try:
+            # Check for log rotation
+            current_hash = hashlib.md5(content[:1024]).hexdigest()
+            log_key = f"{guild_id}_{server_id}"
+
+            if log_key in self.log_file_hashes and self.log_file_hashes[log_key] != current_hash:
+                logger.info(f"Log rotation detected for {server_id}")
+                await self._handle_log_rotation(guild_id, server_id)
+
+            self.log_file_hashes[log_key] = current_hash
+
+            # Get last position or start from beginning
+            last_position = self.last_log_position.get(log_key, 0)
+            if last_position > len(content):
+                last_position = 0
+
+            new_lines, new_position = await self._split_content(content, last_position, executor)
+            return await self._process_new_lines(new_lines, new_position, guild_id, server_id)
+
+        except Exception as e:
+            logger.error(f"Error parsing log content for {server_id}: {e}")
+            return {'error': str(e)}
+
+    async def _split_content(self, content: bytes, offset: int, executor: Optional[Executor]) -> Tuple[List[str], int]:
+        """Run _split_lines_from on executor, falling back to a worker thread"""
+        if executor is not None:
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(executor, _split_lines_from, content, offset)
+            except Exception as e:
+                logger.warning(f"Executor line split failed, splitting in a thread: {e}")
+        return await asyncio.to_thread(_split_lines_from, content, offset)
+
+    async def _process_new_lines(self, new_lines: List[str], new_position: int, guild_id: int, server_id: str) -> Dict[str, Any]:
+        """Analyze new log lines, advance the stored position and dispatch the events found"""
+        log_key = f"{guild_id}_{server_id}"
+
+        if not new_lines:
+            return {'events_processed': 0}
+
+        # Process each line with comprehensive pattern matching
+        events = []
+        for line_num, line in enumerate(new_lines, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            # Extract timestamp
+            timestamp = self._extract_timestamp(line)
+
+            # Analyze line for all possible events
+            event_data = await self._analyze_line(line, timestamp, guild_id, server_id)
+            if event_data:
+                events.extend(event_data)
+
+        # Update log position
+        self.last_log_position[log_key] = new_position
+
+        # Process and dispatch events
+        await self._dispatch_events(events, guild_id, server_id)
+
+        return {
+            'events_processed': len(events),
+            'lines_analyzed': len(new_lines),
+            'server_status': self.server_status.get(f"{guild_id}_{server_id}", {})
+        }
+
     def _extract_timestamp(self, line: str) -> datetime:
         """Extract timestamp from log line"""
         match = self.patterns['timestamp'].search(line)
@@ -432,7 +518,7 @@ class IntelligentLogParser:
             'server_id': server_id
         }
         
-        if event_type in ['player_world_joined']:
+        if event_type == 'player_world_joined':
             # Player connections
             channel_id = channels.get('connections')
             embed_data.update({
@@ -440,9 +526,9 @@ class IntelligentLogParser:
                 'ip': data.get('ip', 'Unknown'),
                 'port': data.get('port', 'Unknown')
             })
-            embed, file = await EmbedFactory.build('player_connection', embed_data)
+            embed, file = EmbedFactory.build('player_connection', embed_data)
             
-        elif event_type in ['player_queue_left']:
+        elif event_type == 'player_queue_left':
             # Player disconnections
             channel_id = channels.get('disconnections')
             embed_data.update({
@@ -450,9 +536,9 @@ class IntelligentLogParser:
                 'ip': data.get('ip', 'Unknown'),
                 'port': data.get('port', 'Unknown')
             })
-            embed, file = await EmbedFactory.build('player_disconnection', embed_data)
+            embed, file = EmbedFactory.build('player_disconnection', embed_data)
             
-        elif event_type in ['mission_ready', 'mission_in_progress', 'mission_completed', 'airdrop', 'helicrash', 'trader_spawn']:
+        elif event_type in _GAME_EVENT_TYPES:
             # Game events
             channel_id = channels.get('events')
             
@@ -462,28 +548,28 @@ class IntelligentLogParser:
                     'state': event_type.replace('mission_', '').upper(),
                     'thumbnail_url': 'attachment://Mission.png'
                 })
-                embed, file = await EmbedFactory.build('mission_event', embed_data)
+                embed, file = EmbedFactory.build('mission_event', embed_data)
                 
             elif event_type == 'airdrop':
                 embed_data.update({
                     'location': data.get('location', 'Unknown'),
                     'thumbnail_url': 'attachment://Airdrop.png'
                 })
-                embed, file = await EmbedFactory.build('airdrop_event', embed_data)
+                embed, file = EmbedFactory.build('airdrop_event', embed_data)
                 
             elif event_type == 'helicrash':
                 embed_data.update({
                     'location': data.get('location', 'Unknown'),
                     'thumbnail_url': 'attachment://Helicrash.png'
                 })
-                embed, file = await EmbedFactory.build('helicrash_event', embed_data)
+                embed, file = EmbedFactory.build('helicrash_event', embed_data)
                 
             elif event_type == 'trader_spawn':
                 embed_data.update({
                     'location': data.get('location', 'Unknown'),
                     'thumbnail_url': 'attachment://Trader.png'
                 })
-                embed, file = await EmbedFactory.build('trader_event', embed_data)
+                embed, file = EmbedFactory.build('trader_event', embed_data)
         
         # Send embed to channel if we have one
         if channel_id and embed:
@@ -570,9 +656,8 @@ class IntelligentLogParser:
     async def _get_file_hash(self, file_path: str) -> str:
         """Get file hash for rotation detection"""
         try:
-            async with aiofiles.open(file_path, 'rb') as f:
-                content = await f.read(1024)  # Read first 1KB for hash
-                return hashlib.md5(content).hexdigest()
+            content = await asyncio.to_thread(_read_file_head, file_path, 1024)  # Read first 1KB for hash
+            return hashlib.md5(content).hexdigest()
         except Exception:
             return ""
 
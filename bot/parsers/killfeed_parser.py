@@ -14,13 +14,19 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
 
-import aiofiles
 import discord
 import asyncssh
 from discord.ext import commands
 
 logger = logging.getLogger(__name__)
 
+
+def _read_text_file(path) -> str:
+    """Blocking whole-file read, run via asyncio.to_thread"""
+    with open(path, 'r') as f:
+        return f.read()
+
+
 class KillfeedParser:
     """
     KILLFEED PARSER (FREE)
@@ -230,9 +236,8 @@ class KillfeedParser:
             # Check attached_assets first
             attached_csv = Path('./attached_assets/2025.04.30-00.00.00.csv')
             if attached_csv.exists():
-                async with aiofiles.open(attached_csv, 'r') as f:
-                    content = await f.read()
-                    return [line.strip() for line in content.splitlines() if line.strip()]
+                content = await asyncio.to_thread(_read_text_file, attached_csv)
+                return [line.strip() for line in content.splitlines() if line.strip()]
 
             # Fallback to dev_data
             csv_path = Path('./dev_data/csv')
@@ -240,9 +245,8 @@ class KillfeedParser:
                 csv_files = list(csv_path.glob('*.csv'))
                 if csv_files:
                     most_recent = max(csv_files, key=lambda f: f.stat().st_mtime)
-                    async with aiofiles.open(most_recent, 'r') as f:
-                        content = await f.read()
-                        return [line.strip() for line in content.splitlines() if line.strip()]
+                    content = await asyncio.to_thread(_read_text_file, most_recent)
+                    return [line.strip() for line in content.splitlines() if line.strip()]
 
             logger.warning("No CSV files found in attached_assets or dev_data/csv/")
             return []
@@ -370,7 +374,7 @@ class KillfeedParser:
                 }
 
             # Build embed using EmbedFactory
-            embed, file_attachment = await EmbedFactory.build(embed_type, embed_data)
+            embed, file_attachment = EmbedFactory.build(embed_type, embed_data)
 
             # Queue embed with batch sender to avoid rate limits
             await self.bot.batch_sender.queue_embed(
@@ -9,18 +9,408 @@ import logging
 import os
 import re
 import glob
+import hashlib
+import heapq
+import multiprocessing
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
 
-import aiofiles
 import discord
 import asyncssh
 from discord.ext import commands
 from .intelligent_connection_parser import IntelligentConnectionParser
 
+# Optional RE2 engine (google-re2, "fast-regex" extra) - linear-time matching, falls back to re
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+USE_RE2 = re2 is not None and os.getenv('LOG_PARSER_RE2', 'true').lower() == 'true'
+
+# Optional Hyperscan engine ("fast-regex" extra) - multi-pattern DFA that picks the event type in one pass
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+USE_HYPERSCAN = hyperscan is not None and os.getenv('LOG_PARSER_HYPERSCAN', 'true').lower() == 'true'
+
+# Optional Aho-Corasick automaton (pyahocorasick, "fast-regex" extra) - single pass keyword screen for individual lines
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional aiofile - kernel AIO / io_uring file reads without a thread pool hop (Linux)
+try:
+    from aiofile import async_open
+except ImportError:
+    async_open = None
+
+# Optional Arrow compute (pyarrow, "fast-regex" extra) - vectorized keyword filter over a whole block of lines
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+USE_ARROW = pa is not None and os.getenv('LOG_PARSER_ARROW', 'true').lower() == 'true'
+
 logger = logging.getLogger(__name__)
 
+# Event patterns whose keywords vary in case: written in lowercase and matched
+# case-insensitively (captured groups are case-insensitive data)
+_CASEFOLDED_EVENTS = frozenset({
+    'beacon_disconnect', 'player_disconnect_cleanup', 'player_session_end',
+    'player_beacon_disconnect', 'player_network_disconnect', 'player_queue_timeout',
+    'player_queue_failed', 'player_auth_failed', 'player_queue_join', 'player_world_connect',
+    'player_queue_disconnect', 'player_accepted_from', 'player_connection_cleanup',
+    'player_beacon_join', 'helicrash_initial', 'helicrash_spawned', 'helicrash_switched',
+    'airdrop_flying', 'airdrop_switched', 'trader_spawn', 'trader_switched',
+    'trader_available', 'construction_save', 'server_max_players', 'generic_mission',
+    'generic_vehicle', 'generic_player'
+})
+
+# Byte substrings (case-insensitive) that every event or connection pattern needs at
+# least one of; lines without any of them are skipped without being decoded
+_EVENT_KEYWORD_LIST = (
+    b'remoteaddr', b'accept', b'uchannel', b'unetconnection::close', b'logbeacon',
+    b'join request', b'successfully registered', b'created successfully', b'bringing world',
+    b'playersmaxcount', b'mission', b'_mis', b'encounter', b'patrolpoint', b'vehicle',
+    b'heli', b'drop', b'trader', b'constructibles', b'world_0'
+)
+_EVENT_KEYWORDS = re.compile(b'|'.join(re.escape(keyword) for keyword in _EVENT_KEYWORD_LIST), re.IGNORECASE)
+_EVENT_KEYWORDS_TEXT = re.compile('|'.join(re.escape(keyword.decode('ascii')) for keyword in _EVENT_KEYWORD_LIST),
+                                  re.IGNORECASE)
+# Same keywords as plain alternation for Arrow's RE2 engine (none contain metacharacters)
+_ARROW_KEYWORD_PATTERN = '|'.join(keyword.decode('ascii') for keyword in _EVENT_KEYWORD_LIST)
+
+# Dispatch rules: event types that produce an embed
+_OUTPUT_PLAYER_EVENTS = frozenset({
+    # Player events - connections and disconnections
+    'player_world_connect', 'player_world_spawn', 'player_online_status', 'player_session_start',
+    'player_queue_disconnect', 'player_disconnect_cleanup', 'player_session_end',
+    'player_beacon_disconnect', 'player_network_disconnect', 'player_accepted_from',
+    'player_connection_cleanup', 'player_beacon_join',
+    # Queue events - visibility into queue activity
+    'player_queue_accepted', 'player_queue_timeout', 'player_queue_failed', 'player_auth_failed'
+})
+_OUTPUT_GAME_EVENTS = frozenset({
+    'mission_ready',
+    'airdrop_flying', 'airdrop_switched',
+    'helicrash_initial', 'helicrash_spawned', 'helicrash_switched',
+    'trader_spawn', 'trader_switched', 'trader_available'
+})
+_OUTPUT_EVENTS = _OUTPUT_PLAYER_EVENTS | _OUTPUT_GAME_EVENTS
+
+# Event types whose captured fields are used: embeds, max player tracking, and the
+# generic mission state pattern (its state decides whether it becomes mission_ready)
+_EXTRACTED_EVENTS = _OUTPUT_EVENTS | {'server_max_players', 'mission_state_any'}
+
+# Guild channel type each event type is posted to
+_EVENT_CHANNEL_TYPES = {
+    **{event_type: 'connections' for event_type in _OUTPUT_PLAYER_EVENTS},
+    **{event_type: 'events' for event_type in _OUTPUT_GAME_EVENTS | {'vehicle_spawn', 'vehicle_delete'}}
+}
+
+# Event type -> (EmbedFactory key, ((embed field, event_data field, default), ...), constant embed fields)
+_CONNECTION_EMBED_FIELDS = (('connection_id', 'connection_id', 'Unknown'), ('server_id', 'server_id', 'Unknown'))
+_LOCATION_EMBED_FIELDS = (('location', 'location', 'Unknown'),)
+_VEHICLE_EMBED_FIELDS = (('vehicle_type', 'vehicle_type', 'Military Vehicle'),)
+_EMBED_DISPATCH = {
+    'player_world_connect': ('player_connection', _CONNECTION_EMBED_FIELDS, {}),
+    'player_queue_disconnect': ('player_disconnection', _CONNECTION_EMBED_FIELDS, {}),
+    'mission_ready': ('mission_event', (('mission_name', 'normalized_name', 'Unknown Mission'),), {'state': 'READY'}),
+    **dict.fromkeys(('airdrop_flying', 'airdrop_switched'), ('airdrop_event', (), {})),
+    **dict.fromkeys(('helicrash_initial', 'helicrash_spawned', 'helicrash_switched'),
+                    ('helicrash_event', _LOCATION_EMBED_FIELDS, {})),
+    **dict.fromkeys(('trader_spawn', 'trader_switched', 'trader_available'),
+                    ('trader_event', _LOCATION_EMBED_FIELDS, {})),
+    'vehicle_spawn': ('vehicle_event', _VEHICLE_EMBED_FIELDS, {'action': 'spawn'}),
+    'vehicle_delete': ('vehicle_event', _VEHICLE_EMBED_FIELDS, {'action': 'delete'})
+}
+
+
+def _compile_embed_builders(dispatch) -> Dict[str, tuple]:
+    """Generate one straight-line embed data builder per event type from the dispatch table"""
+    builders = {}
+    for event_type, (factory_key, fields, constants) in dispatch.items():
+        entries = [f"{embed_field!r}: e.get({event_field!r}, {default!r})" for embed_field, event_field, default in fields]
+        entries += [f"{key!r}: {value!r}" for key, value in constants.items()]
+        entries.append("'timestamp': e['timestamp']")
+        src = f"def build(e):\n    return {{{', '.join(entries)}}}\n"
+        namespace = {}
+        exec(compile(src, f"<embed builder {event_type}>", 'exec'), namespace)
+        builders[event_type] = (factory_key, namespace['build'])
+    return builders
+
+
+# Event type -> (EmbedFactory key, embed data builder), generated once at import
+_EMBED_BUILDERS = _compile_embed_builders(_EMBED_DISPATCH)
+
+# Player presence flags tracked per server in server_status['players']
+PLAYER_QUEUED = 1
+PLAYER_ONLINE = 2
+
+# Lifecycle state -> get_comprehensive_server_stats counter it contributes to
+_LIFECYCLE_BUCKETS = {
+    'WORLD_CONNECTED': 'active_players',
+    'ONLINE_ACTIVE': 'active_players',
+    'QUEUE_REQUESTED': 'queued_players',
+    'QUEUE_ACCEPTED': 'queued_players',
+    'BEACON_HANDSHAKE': 'connecting_players',
+    'BEACON_AUTHENTICATED': 'connecting_players',
+    'WORLD_AUTHENTICATING': 'connecting_players',
+    'FAILED': 'failed',
+    'TIMEOUT': 'failed'
+}
+
+# Display names for known mission and vehicle blueprints (built once at import)
+_MISSION_MAPPINGS: Dict[str, str] = {
+    # Military Bases
+    'GA_Military_03_Mis_01': 'Military Base Alpha',
+    'GA_Military_04_Mis1': 'Military Base Bravo', 
+    'GA_Military_04_Mis_2': 'Military Base Charlie',
+    'GA_Military_02_mis1': 'Military Outpost Delta',
+    'GA_Military_05_Mis_1': 'Military Base Echo',
+    'GA_Military_01_Mis_1': 'Military Base Foxtrot',
+    'GA_Military_06_Mis_1': 'Military Base Golf',
+    'GA_Military_07_Mis_01': 'Military Base Hotel',
+    'GA_Military_Mis_1': 'Military Base India',
+    'GA_Military_Mis_01': 'Military Base Juliet',
+    'GA_Military_Mis_02': 'Military Base Kilo',
+
+    # Industrial Zones
+    'GA_Ind_02_Mis_1': 'Industrial Complex Alpha',
+    'GA_Ind_01_Mis_1': 'Industrial Complex Beta',
+    'GA_Ind_03_Mis_1': 'Industrial Complex Gamma',
+    'GA_Ind_Mis_1': 'Industrial Complex Delta',
+    'GA_Ind_Mis_01': 'Industrial Complex Echo',
+    'GA_PromZone_Mis_01': 'Industrial Zone Beta',
+    'GA_PromZone_Mis_02': 'Industrial Zone Gamma',
+    'GA_PromZone_Mis_1': 'Industrial Zone Delta',
+    'GA_KhimMash_Mis_01': 'Chemical Plant Alpha',
+    'GA_KhimMash_Mis_02': 'Chemical Plant Beta',
+    'GA_KhimMash_Mis_1': 'Chemical Plant Gamma',
+
+    # Settlements
+    'GA_Bochki_Mis_1': 'Bochki Settlement',
+    'GA_Bochki_Mis_01': 'Bochki Settlement Alpha',
+    'GA_Krasnoe_Mis_1': 'Krasnoe Settlement',
+    'GA_Krasnoe_Mis_01': 'Krasnoe Settlement Alpha',
+    'GA_Dubovoe_0_Mis_1': 'Dubovoe Settlement',
+    'GA_Dubovoe_Mis_1': 'Dubovoe Settlement Alpha',
+    'GA_Settle_09_Mis_1': 'Northern Settlement',
+    'GA_Settle_05_ChernyLog_mis1': 'Cherny Log Settlement',
+    'GA_Settle_Mis_1': 'Eastern Settlement',
+    'GA_Settle_Mis_01': 'Western Settlement',
+    'GA_Beregovoy_mis1': 'Beregovoy Settlement',
+    'GA_Beregovoy_Mis_1': 'Beregovoy Settlement Alpha',
+
+    # Resource Sites
+    'GA_Sawmill_03_Mis_01': 'Sawmill Complex Alpha',
+    'GA_Sawmill_01_mis1': 'Sawmill Complex Beta',
+    'GA_Sawmill_02_Mis_1': 'Sawmill Complex Gamma',
+    'GA_Sawmill_Mis_1': 'Sawmill Complex Delta',
+    'GA_Sawmill_Mis_01': 'Sawmill Complex Echo',
+    'GA_Lighthouse_02_mis1': 'Lighthouse Compound',
+    'GA_Lighthouse_Mis_1': 'Lighthouse Compound Alpha',
+    'GA_Lighthouse_Mis_01': 'Lighthouse Compound Beta',
+    'GA_Bunker_01_mis1': 'Underground Bunker',
+    'GA_Bunker_Mis_1': 'Underground Bunker Alpha',
+    'GA_Bunker_Mis_01': 'Underground Bunker Beta',
+
+    # Special Locations
+    'GA_Airport_mis_01_Enc2': 'Airport Terminal',
+    'GA_Airport_Mis_1': 'Airport Terminal Alpha',
+    'GA_Airport_Mis_01': 'Airport Terminal Beta',
+    'GA_Voron_Enc_1': 'Voron Stronghold',
+    'GA_Voron_Mis_1': 'Voron Stronghold Alpha',
+    'GA_Hospital_Mis_1': 'Medical Facility',
+    'GA_Hospital_Mis_01': 'Medical Facility Alpha',
+    'GA_School_Mis_1': 'Abandoned School',
+    'GA_School_Mis_01': 'Abandoned School Alpha',
+    'GA_Factory_Mis_1': 'Manufacturing Plant',
+    'GA_Factory_Mis_01': 'Manufacturing Plant Alpha',
+
+    # Additional common patterns
+    'GA_Town_Mis_1': 'Town Center',
+    'GA_Town_Mis_01': 'Town Center Alpha',
+    'GA_Base_Mis_1': 'Forward Base',
+    'GA_Base_Mis_01': 'Forward Base Alpha',
+    'GA_Outpost_Mis_1': 'Remote Outpost',
+    'GA_Outpost_Mis_01': 'Remote Outpost Alpha',
+    'GA_Camp_Mis_1': 'Field Camp',
+    'GA_Camp_Mis_01': 'Field Camp Alpha'
+}
+
+_VEHICLE_MAPPINGS: Dict[str, str] = {
+    'BP_Vehicle_Car_01_C': 'Civilian Car',
+    'BP_Vehicle_Car_02_C': 'Sports Car',
+    'BP_Vehicle_Car_03_C': 'Off-Road Vehicle',
+    'BP_Vehicle_Truck_01_C': 'Cargo Truck',
+    'BP_Vehicle_Truck_02_C': 'Military Truck',
+    'BP_Vehicle_APC_01_C': 'Armored Personnel Carrier',
+    'BP_Vehicle_Helicopter_01_C': 'Transport Helicopter',
+    'BP_Vehicle_Helicopter_02_C': 'Attack Helicopter',
+    'BP_Vehicle_Bike_01_C': 'Motorcycle',
+    'BP_Vehicle_Quad_01_C': 'ATV Quad Bike',
+    'BP_Vehicle_Boat_01_C': 'Patrol Boat',
+    'BP_Vehicle_Boat_02_C': 'Speed Boat'
+}
+
+
+# Single-pass replacement table for the mission name fallback
+_MISSION_NAME_TOKENS = re.compile(r'GA_|_Mis_|_mis|_0[123]|_[123]|_Enc')
+_MISSION_NAME_REPLACEMENTS = {
+    'GA_': '', '_Mis_': ' ', '_mis': ' ', '_Enc': ' Encounter',
+    '_01': '', '_02': '', '_03': '', '_1': '', '_2': '', '_3': ''
+}
+
+
+@lru_cache(maxsize=1024)
+def _fallback_mission_name(raw_mission_name: str) -> str:
+    """Derive a readable name for missions missing from _MISSION_MAPPINGS"""
+    # Strip prefixes/suffixes in one scan instead of chained str.replace calls
+    clean_name = _MISSION_NAME_TOKENS.sub(lambda m: _MISSION_NAME_REPLACEMENTS[m.group(0)], raw_mission_name)
+
+    # Convert to title case and clean up
+    return clean_name.replace('_', ' ').title()
+
+
+@lru_cache(maxsize=256)
+def _fallback_vehicle_name(raw_vehicle_name: str) -> str:
+    """Derive a readable name for vehicles missing from _VEHICLE_MAPPINGS"""
+    # Extract meaningful parts for fallback
+    clean_name = raw_vehicle_name.replace('BP_Vehicle_', '').replace('_C', '').replace('_01', '').replace('_02', '')
+    return clean_name.replace('_', ' ').title() if clean_name else 'Military Vehicle'
+
+
+class _PatternMatch:
+    """View of one event's capture groups inside a master-pattern match"""
+
+    __slots__ = ('_match', '_base', '_count')
+
+    def __init__(self, match, base: int, count: int):
+        self._match = match
+        self._base = base
+        self._count = count
+
+    def group(self, index: int = 0):
+        return self._match.group(self._base + index)
+
+    def groups(self) -> tuple:
+        return tuple(self._match.group(self._base + i) for i in range(1, self._count + 1))
+
+    @property
+    def string(self) -> str:
+        return self._match.string
+
+
+def _parse_log_timestamp(timestamp_str: str) -> datetime:
+    """
+    Parse a 'YYYY.MM.DD-HH.MM.SS[:fff]' log timestamp into a UTC datetime by slicing.
+    Accepts exactly what strptime with '%Y.%m.%d-%H.%M.%S:%f' or '%Y.%m.%d-%H.%M.%S'
+    would, raising ValueError otherwise.
+    """
+    s = timestamp_str
+    if (len(s) < 19 or s[4] != '.' or s[7] != '.' or s[10] != '-' or s[13] != '.' or s[16] != '.'
+            or (len(s) > 19 and (s[19] != ':' or not 21 <= len(s) <= 26))):
+        raise ValueError(f"Unrecognised log timestamp: {timestamp_str}")
+
+    microsecond = int(s[20:].ljust(6, '0')) if len(s) > 19 else 0
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                    microsecond, tzinfo=timezone.utc)
+
+
+_VEHICLE_BLUEPRINT_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+
+
+def _find_vehicle_blueprint(line: str) -> Optional[str]:
+    """First 'BP_Vehicle_<name>' token in the line, found with str.find instead of a regex"""
+    start = line.find('BP_Vehicle_')
+    while start >= 0:
+        end = start + 11
+        while end < len(line) and line[end] in _VEHICLE_BLUEPRINT_CHARS:
+            end += 1
+        if end > start + 11:
+            return line[start:end]
+        start = line.find('BP_Vehicle_', end)
+    return None
+
+
+def _count_lines(data: bytes) -> int:
+    """Number of lines in a buffer, counting an unterminated final line"""
+    if not data:
+        return 0
+    return data.count(b'\n') + (0 if data.endswith(b'\n') else 1)
+
+
+def _last_line(data: bytes) -> bytes:
+    """Last line of a buffer without splitting the whole thing"""
+    end = len(data) - 1 if data.endswith(b'\n') else len(data)
+    return data[data.rfind(b'\n', 0, end) + 1:end].rstrip(b'\r')
+
+
+# SFTP failures that leave the channel unusable; a missing or unreadable path does not
+_SFTP_CHANNEL_ERRORS = (asyncssh.Error, ConnectionError, OSError, asyncio.TimeoutError)
+_SFTP_PATH_ERRORS = (FileNotFoundError, PermissionError, asyncssh.SFTPNoSuchFile, asyncssh.SFTPPermissionDenied)
+# SSH connect failures that another attempt would only repeat (bad credentials, no common algorithms)
+_SSH_FATAL_CONNECT_ERRORS = (asyncssh.PermissionDenied, asyncssh.KeyExchangeFailed)
+
+
+def _is_broken_channel_error(error: BaseException) -> bool:
+    """Whether an SFTP error means the channel should be closed rather than returned to the pool"""
+    return isinstance(error, _SFTP_CHANNEL_ERRORS) and not isinstance(error, _SFTP_PATH_ERRORS)
+
+
+# Dev mode log locations, in priority order
+_DEV_LOG_PATHS = (Path('./attached_assets/Deadside.log'), Path('./dev_data/logs/Deadside.log'))
+
+
+def _first_existing_path(paths) -> Optional[Path]:
+    """First path that exists on disk, run via asyncio.to_thread"""
+    for path in paths:
+        if path.exists():
+            return path
+    return None
+
+
+def _read_text_file(path) -> str:
+    """Blocking whole-file read, run via asyncio.to_thread"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+def _read_bytes_file(path) -> bytes:
+    """Blocking whole-file binary read with no decoding, run via asyncio.to_thread"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+# Matcher-only LogParser built lazily in each scan worker process
+_worker_parser = None
+
+
+def _scan_text_worker(data: bytes) -> List[tuple]:
+    """Process pool entry point: scan a log buffer with a per-process copy of the patterns"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = LogParser.__new__(LogParser)
+        _worker_parser._init_matchers()
+        _worker_parser.connection_parser = IntelligentConnectionParser(None)
+    return _worker_parser._scan_text(data)
+
+
 class LogParser:
     """
     LOG PARSER (PREMIUM ONLY)
@@ -34,12 +424,39 @@ class LogParser:
     def __init__(self, bot):
         self.bot = bot
         self.last_log_position: Dict[str, int] = {}  # Track file position per server
-        self.log_patterns = self._compile_log_patterns()
-        self.player_sessions: Dict[str, Dict[str, Any]] = {}  # Track player join times for playtime rewards
-        self.server_status: Dict[str, Dict[str, Any]] = {}  # Track real-time server status per guild_server
-        self.sftp_pool: Dict[str, asyncssh.SSHClientConnection] = {}  # SFTP connection pool
-        self.log_file_hashes: Dict[str, str] = {}  # Track log file rotation
-        self.player_lifecycle: Dict[str, Dict[str, Any]] = {}  # Track comprehensive player lifecycle
+        self._server_key_cache: Dict[tuple, str] = {}  # (guild_id, server_id) -> "guild_server" status key
+        self._init_matchers()
+        self._parse_pool: Optional[ProcessPoolExecutor] = None  # Created on first large scan
+        self.parse_workers = os.cpu_count() or 1  # Worker processes for scanning large log buffers
+        self.process_pool_min_bytes = 262144  # Smaller buffers are scanned in a thread (pickling would dominate)
+        self._session_join_ts: Dict[tuple, float] = {}  # (guild_id, server_id, player_name) -> join epoch for playtime rewards
+        self.server_status: Dict[tuple, Dict[str, Any]] = {}  # Track real-time server status per (guild_id, server_id)
+        self.sftp_pool: Dict[tuple, Dict[str, Any]] = {}  # Shared SSH connection + SFTP channel pool per (host, port, user)
+        self._sftp_connect_locks: Dict[tuple, asyncio.Lock] = {}  # pool key -> lock serialising lookup + connect
+        self.sftp_max_channels = 8  # SFTP channels opened per pooled connection (stay under sshd MaxSessions)
+        self.max_concurrent_hosts = 8  # SFTP hosts parsed in parallel (stay under sshd MaxStartups)
+        self.sftp_read_chunk_size = 65536  # Bytes per SFTP READ request when fetching a log tail
+        self.sftp_max_inflight_reads = 64  # SFTP READ requests kept in flight per file (like sftp -R 64)
+        self.sftp_connect_retry_delays = (0.5, 1.5)  # Pause after a failed SSH connect before the next attempt
+        self.sftp_stream_chunk_size = 262144  # Bytes per read when streaming whole log files
+        self.sftp_file_concurrency = 8  # Log files stat'd and read concurrently per SFTP session
+        self.player_lifecycle: Dict[tuple, Dict[str, Any]] = {}  # Track comprehensive player lifecycle
+        self._lifecycle_expiry: List[tuple] = []  # Min-heap of (last_updated_ts, connection_key)
+        self._session_expiry: List[tuple] = []  # Min-heap of (join_ts, session_key)
+        self._lifecycle_stats: Dict[tuple, Dict[str, Any]] = {}  # (guild_id, server_id) -> running lifecycle counters
+        self._lifecycle_buckets: Dict[tuple, Optional[str]] = {}  # connection_key -> counter bucket it is counted in
+        self._character_cache: Dict[tuple, tuple] = {}  # (guild_id, character) -> (cached_at, discord_id)
+        self._character_cache_ttl = 300  # Seconds before a character -> Discord user lookup is refreshed
+        self._currency_cache: Dict[int, tuple] = {}  # guild_id -> (cached_at, currency_name)
+        self._currency_cache_ttl = 300  # Seconds before a guild's currency name is re-read
+        self._guild_cache: Dict[int, tuple] = {}  # guild_id -> (cached_at, guild config)
+        self._guild_cache_ttl = 60  # Seconds before a guild config (channels, dispatch rules) is re-read
+        self._dev_log_path: Optional[tuple] = None  # (resolved_at, dev log path or None)
+        self._dev_log_path_ttl = 30  # Seconds before the dev log location is looked up again
+        self._vc_pending: Dict[tuple, asyncio.TimerHandle] = {}  # Pending coalesced voice channel renames
+        self._vc_update_delay = 30  # Seconds to batch status changes before renaming (Discord allows ~2 edits/10min)
+        self._pending_vc_names: Dict[int, tuple] = {}  # voice_channel_id -> (channel, latest name) awaiting flush
+        self._vc_flush_interval = 300  # Seconds between rename flushes (one edit per channel per window)
 
         # PERSISTENT FILE TRACKING - Track file state in database (per server)
         self.file_states: Dict[str, Dict[str, Any]] = {}  # Track file size, position, and last line
@@ -54,224 +471,251 @@ class LogParser:
         # Load persistent state on startup
         asyncio.create_task(self._load_persistent_state())
 
+        # Playtime wallet events are buffered and written in bulk
+        self._wallet_queue: List[tuple] = []
+        self._wallet_flush_interval = 5
+        self._wallet_flush_task = asyncio.create_task(self._flush_wallet_events_loop())
+
+        # Pooled SSH connections stay warm between polls; ones unused for a while are closed
+        self.sftp_idle_timeout = 900
+        self._sftp_reaper_task = asyncio.create_task(self._reap_idle_sftp_loop())
+        self._vc_flush_task = asyncio.create_task(self._flush_voice_channel_names_loop())
+
+        # File state updates are queued and persisted by a background writer
+        self._state_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._state_write_delay = 5
+        self._state_writer_task = asyncio.create_task(self._state_writer_loop())
+
+    def _init_matchers(self):
+        """Compile the pattern set and per-event extractors used by _scan_text"""
+        self.log_patterns = self._compile_log_patterns()
+        self._master_match, self._master_groups = self._build_master_pattern(self.log_patterns)
+        self._hyperscan_db = self._build_hyperscan_database(self.log_patterns) if USE_HYPERSCAN else None
+        self._hyperscan_local = threading.local()  # Per-thread scratch space for Hyperscan scans
+        self._event_types = list(self.log_patterns.keys())
+        self._event_handlers = self._build_event_handlers()
+        self._keyword_automaton = self._build_keyword_automaton() if ahocorasick else None
+        self._capture_matchers = {
+            event_type: (pattern.match if pattern.pattern.startswith('^') else pattern.search)
+            for event_type, pattern in self._compile_capture_patterns(self.log_patterns).items()
+        }
+
     def _compile_log_patterns(self) -> Dict[str, re.Pattern]:
         """Compile robust regex patterns for complete player connection lifecycle tracking"""
+        # Timestamped lines are anchored at the start so a miss fails at column 0
+        # instead of being retried at every offset.
+        # Engine log categories (LogNet:, LogSFPS:, ...) have fixed casing and are matched
+        # case-sensitively; patterns in _CASEFOLDED_EVENTS are written in lowercase and
+        # matched case-insensitively. All of these are unioned by _build_master_pattern.
+        ts = r'^\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\]'
         return {
             # PLAYER CONNECTION LIFECYCLE EVENTS (4 Core Events)
 
             # PLAYER CONNECTION LIFECYCLE EVENTS (Updated to match intelligent parser)
 
             # 1. Queue Join - Player enters queue (actual format from logs)
-            'queue_join': re.compile(r'LogNet: Join request: /Game/Maps/world_\d+/World_\d+\?.*Name=([^&\?]+).*eosid=\|([a-f0-9]+)', re.IGNORECASE),
+            'queue_join': re.compile(r'LogNet: Join request: /Game/Maps/world_\d+/World_\d+\?.*?Name=([^&\?]+).*?eosid=\|([a-fA-F0-9]+)'),
 
             # 2. Beacon connection (intermediate step)
-            'beacon_join': re.compile(r'LogBeacon: Beacon Join SFPSOnlineBeaconClient EOS:\|([a-f0-9]+)', re.IGNORECASE),
+            'beacon_join': re.compile(r'LogBeacon: Beacon Join SFPSOnlineBeaconClient EOS:\|([a-fA-F0-9]+)'),
 
             # 3. Player Joined - Player successfully connects (updated format)
-            'player_joined': re.compile(r'LogOnline: Warning: Player \|([a-f0-9]+) successfully registered!', re.IGNORECASE),
+            'player_joined': re.compile(r'LogOnline: Warning: Player \|([a-fA-F0-9]+) successfully registered!'),
 
             # 4. Disconnect Post-Join - Standard disconnect after joining
-            'disconnect_post_join': re.compile(r'UChannel::Close: Sending CloseBunch.*UniqueId: EOS:\|([a-f0-9]+)', re.IGNORECASE),
+            'disconnect_post_join': re.compile(r'UChannel::Close: Sending CloseBunch.*?UniqueId: EOS:\|([a-fA-F0-9]+)'),
 
             # 5. Disconnect Pre-Join - Disconnect from queue before joining  
-            'disconnect_pre_join': re.compile(r'UNetConnection::Close:.*UniqueId: EOS:\|([a-f0-9]+)', re.IGNORECASE),
+            'disconnect_pre_join': re.compile(r'UNetConnection::Close:.*?UniqueId: EOS:\|([a-fA-F0-9]+)'),
 
             # 6. Beacon disconnect
-            'beacon_disconnect': re.compile(r'LogBeacon:.*Beacon.*(?:disconnect|close|cleanup).*EOS:\|([a-f0-9]+)', re.IGNORECASE),
+            'beacon_disconnect': re.compile(r'logbeacon:.*?beacon.*?(?:disconnect|close|cleanup).*?eos:\|([a-f0-9]+)'),
 
             # Phase 4: Disconnection Tracking
-            'player_disconnect_cleanup': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*UChannel::CleanUp.*Connection.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_session_end': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*LogOnline.*Session.*(?:ended|closed|terminated).*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_beacon_disconnect': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*UChannel::CleanUp.*Beacon.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_network_disconnect': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*NetConnection.*closed.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
+            'player_disconnect_cleanup': re.compile(ts + r'.*?uchannel::cleanup.*?connection.*?remoteaddr:\s*([\d\.]+):(\d+)'),
+            'player_session_end': re.compile(ts + r'.*?logonline.*?session.*?(?:ended|closed|terminated).*?remoteaddr:\s*([\d\.]+):(\d+)'),
+            'player_beacon_disconnect': re.compile(ts + r'.*?uchannel::cleanup.*?beacon.*?remoteaddr:\s*([\d\.]+):(\d+)'),
+            'player_network_disconnect': re.compile(ts + r'.*?netconnection.*?closed.*?remoteaddr:\s*([\d\.]+):(\d+)'),
 
             # Phase 5: Queue Management & Failures
-            'player_queue_timeout': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Connection.*timeout.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_queue_failed': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Failed.*connection.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_auth_failed': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Authentication.*failed.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
+            'player_queue_timeout': re.compile(ts + r'.*?connection.*?timeout.*?remoteaddr:\s*([\d\.]+):(\d+)'),
+            'player_queue_failed': re.compile(ts + r'.*?failed.*?connection.*?remoteaddr:\s*([\d\.]+):(\d+)'),
+            'player_auth_failed': re.compile(ts + r'.*?authentication.*?failed.*?remoteaddr:\s*([\d\.]+):(\d+)'),
 
             # Legacy patterns for backward compatibility
-            'player_queue_join': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*NotifyAcceptingConnection.*accepted.*from:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_beacon_connected': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*NotifyAcceptedConnection.*RemoteAddr:\s*([\d\.]+):(\d+).*UniqueId:\s*([A-Z]+:\|\w+)', re.IGNORECASE),
-            'player_world_connect': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*(?:NotifyAcceptedConnection.*Name:\s*World_\d+|World_\d+.*Join).*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_queue_disconnect': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*UChannel::CleanUp.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
+            'player_queue_join': re.compile(ts + r'.*?notifyacceptingconnection.*?accepted.*?from:\s*([\d\.]+):(\d+)'),
+            'player_beacon_connected': re.compile(ts + r'.*?NotifyAcceptedConnection.*?RemoteAddr:\s*([\d\.]+):(\d+).*?UniqueId:\s*([A-Z]+:\|\w+)', re.IGNORECASE),
+            'player_world_connect': re.compile(ts + r'.*?(?:notifyacceptedconnection.*?name:\s*world_\d+|world_\d+.*?join).*?remoteaddr:\s*([\d\.]+):(\d+)'),
+            'player_queue_disconnect': re.compile(ts + r'.*?uchannel::cleanup.*?remoteaddr:\s*([\d\.]+):(\d+)'),
 
             # ENHANCED CONNECTION PATTERNS - Better detection for player count tracking
-            'player_accepted_from': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*NotifyAcceptingConnection.*accepted.*from:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_connection_cleanup': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*UChannel::CleanUp.*Connection.*RemoteAddr:\s*([\d\.]+):(\d+)', re.IGNORECASE),
-            'player_beacon_join': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*BeaconHost.*accept.*from:\s*([\d\.]+):(\d+)', re.IGNORECASE),
+            'player_accepted_from': re.compile(ts + r'.*?notifyacceptingconnection.*?accepted.*?from:\s*([\d\.]+):(\d+)'),
+            'player_connection_cleanup': re.compile(ts + r'.*?uchannel::cleanup.*?connection.*?remoteaddr:\s*([\d\.]+):(\d+)'),
+            'player_beacon_join': re.compile(ts + r'.*?beaconhost.*?accept.*?from:\s*([\d\.]+):(\d+)'),
 
             # MISSION EVENTS - Updated to match actual log format (no timestamp brackets, different format)
-            'mission_ready': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) switched to READY', re.IGNORECASE),
-            'mission_waiting': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) switched to WAITING', re.IGNORECASE),
-            'mission_initial': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) switched to INITIAL', re.IGNORECASE),
-            'mission_respawn': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) will respawn in (\d+)', re.IGNORECASE),
+            'mission_ready': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) switched to READY'),
+            'mission_waiting': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) switched to WAITING'),
+            'mission_initial': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) switched to INITIAL'),
+            'mission_respawn': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]*_[Mm]is[_0-9]*) will respawn in (\d+)'),
 
             # Additional mission patterns to catch variations
-            'mission_state_any': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Mission\s+(GA_[A-Za-z0-9_]*_Mis_?[A-Za-z0-9_]*).*switched\s+to\s+([A-Z_]+)', re.IGNORECASE),
+            'mission_state_any': re.compile(ts + r'.*?Mission\s+(GA_[A-Za-z0-9_]*_Mis_?[A-Za-z0-9_]*).*?switched\s+to\s+([A-Z_]+)', re.IGNORECASE),
 
             # ENCOUNTER EVENTS
-            'encounter_initial': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Encounter\s+(GA_[A-Za-z0-9_]+).*switched\s+to\s+INITIAL.*respawn\s+in\s+(\d+)', re.IGNORECASE),
+            'encounter_initial': re.compile(ts + r'.*?Encounter\s+(GA_[A-Za-z0-9_]+).*?switched\s+to\s+INITIAL.*?respawn\s+in\s+(\d+)', re.IGNORECASE),
 
             # PATROL POINT EVENTS
-            'patrol_switch': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*PatrolPoint\s+([A-Za-z0-9_]+).*switched\s+to\s+([A-Z.]+)(?:.*monsters\s+(\d+))?', re.IGNORECASE),
+            'patrol_switch': re.compile(ts + r'.*?PatrolPoint\s+([A-Za-z0-9_]+).*?switched\s+to\s+([A-Z.]+)(?:.*?monsters\s+(\d+))?', re.IGNORECASE),
 
             # VEHICLE EVENTS - Updated to match actual log format
-            'vehicle_spawn': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Add\] Add vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+) Total (\d+)', re.IGNORECASE),
-            'vehicle_delete': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Del\] Del vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+) Total (\d+)', re.IGNORECASE),
+            'vehicle_spawn': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Add\] Add vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+) Total (\d+)'),
+            'vehicle_delete': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Del\] Del vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+) Total (\d+)'),
 
             # HELICOPTER CRASH EVENTS - Enhanced patterns
-            'helicrash_initial': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*(?:Heli.*crash|Helicopter.*crash|HeliCrash).*(?:INITIAL|initiated|spawned)', re.IGNORECASE),
-            'helicrash_spawned': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*HeliCrash.*spawned.*(?:X=([\d\.-]+).*Y=([\d\.-]+))?', re.IGNORECASE),
-            'helicrash_switched': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*HeliCrash.*switched.*to.*INITIAL', re.IGNORECASE),
+            'helicrash_initial': re.compile(ts + r'.*?(?:heli.*?crash|helicopter.*?crash|helicrash).*?(?:initial|initiated|spawned)'),
+            'helicrash_spawned': re.compile(ts + r'.*?helicrash.*?spawned.*?(?:x=([\d\.-]+).*?y=([\d\.-]+))?'),
+            'helicrash_switched': re.compile(ts + r'.*?helicrash.*?switched.*?to.*?initial'),
 
             # AIRDROP EVENTS - Enhanced patterns  
-            'airdrop_flying': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*(?:Airdrop|Air.*drop).*(?:flying|in.*air|deployed)', re.IGNORECASE),
-            'airdrop_switched': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*AirDrop.*switched.*to.*(?:Flying|Waiting)', re.IGNORECASE),
+            'airdrop_flying': re.compile(ts + r'.*?(?:airdrop|air.*?drop).*?(?:flying|in.*?air|deployed)'),
+            'airdrop_switched': re.compile(ts + r'.*?airdrop.*?switched.*?to.*?(?:flying|waiting)'),
 
             # TRADER EVENTS - Enhanced patterns
-            'trader_spawn': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Trader.*(?:spawn|appear|initial).*(?:X=([\d\.-]+).*Y=([\d\.-]+))?', re.IGNORECASE),
-            'trader_switched': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Trader.*switched.*to.*(?:INITIAL|Active)', re.IGNORECASE),
-            'trader_available': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*Trader.*(?:available|ready|active)', re.IGNORECASE),
+            'trader_spawn': re.compile(ts + r'.*?trader.*?(?:spawn|appear|initial).*?(?:x=([\d\.-]+).*?y=([\d\.-]+))?'),
+            'trader_switched': re.compile(ts + r'.*?trader.*?switched.*?to.*?(?:initial|active)'),
+            'trader_available': re.compile(ts + r'.*?trader.*?(?:available|ready|active)'),
 
             # CONSTRUCTION SAVES - Detect but suppress output
-            'construction_save': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*(?:LogSFPSConstruction|Construction).*Save.*constructibles\s+(\d+).*([0-9.]+)ms', re.IGNORECASE),
+            'construction_save': re.compile(ts + r'.*?(?:logsfpsconstruction|construction).*?save.*?constructibles\s+(\d+).*?([0-9.]+)ms'),
 
             # SERVER CONFIGURATION - Updated to match actual log format
-            'server_max_players': re.compile(r'LogSFPS:.*playersmaxcount=(\d+)', re.IGNORECASE),
-            'server_startup': re.compile(r'LogWorld: Bringing World.*up for play.*at (\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})', re.IGNORECASE),
-            'session_created': re.compile(r'LogOnline: Warning: Session .* created successfully!', re.IGNORECASE),
+            'server_max_players': re.compile(r'logsfps:.*?playersmaxcount=(\d+)'),
+            'server_startup': re.compile(r'LogWorld: Bringing World.*?up for play.*?at (\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})'),
+            'session_created': re.compile(r'LogOnline: Warning: Session .*? created successfully!'),
 
             # GENERIC FALLBACK PATTERNS for better coverage
-            'generic_mission': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*(?:Mission|GA_[A-Za-z0-9_]*_Mis_?[A-Za-z0-9_]*).*(?:READY|WAITING|INITIAL|respawn)', re.IGNORECASE),
-            'generic_vehicle': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*(?:Vehicle|NewVehicle).*(?:spawn|delete|Del)', re.IGNORECASE),
-            'generic_player': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\].*(?:NotifyAccept|UChannel|World_0|RemoteAddr)', re.IGNORECASE)
+            'generic_mission': re.compile(ts + r'.*?(?:mission|ga_[a-z0-9_]*_mis_?[a-z0-9_]*).*?(?:ready|waiting|initial|respawn)'),
+            'generic_vehicle': re.compile(ts + r'.*?(?:vehicle|newvehicle).*?(?:spawn|delete|del)'),
+            'generic_player': re.compile(ts + r'.*?(?:notifyaccept|uchannel|world_0|remoteaddr)')
         }
 
-    def normalize_mission_name(self, raw_mission_name: str) -> str:
-        """Normalize mission names for consistency with comprehensive mappings"""
-        mission_mappings = {
-            # Military Bases
-            'GA_Military_03_Mis_01': 'Military Base Alpha',
-            'GA_Military_04_Mis1': 'Military Base Bravo', 
-            'GA_Military_04_Mis_2': 'Military Base Charlie',
-            'GA_Military_02_mis1': 'Military Outpost Delta',
-            'GA_Military_05_Mis_1': 'Military Base Echo',
-            'GA_Military_01_Mis_1': 'Military Base Foxtrot',
-            'GA_Military_06_Mis_1': 'Military Base Golf',
-            'GA_Military_07_Mis_01': 'Military Base Hotel',
-            'GA_Military_Mis_1': 'Military Base India',
-            'GA_Military_Mis_01': 'Military Base Juliet',
-            'GA_Military_Mis_02': 'Military Base Kilo',
-
-            # Industrial Zones
-            'GA_Ind_02_Mis_1': 'Industrial Complex Alpha',
-            'GA_Ind_01_Mis_1': 'Industrial Complex Beta',
-            'GA_Ind_03_Mis_1': 'Industrial Complex Gamma',
-            'GA_Ind_Mis_1': 'Industrial Complex Delta',
-            'GA_Ind_Mis_01': 'Industrial Complex Echo',
-            'GA_PromZone_Mis_01': 'Industrial Zone Beta',
-            'GA_PromZone_Mis_02': 'Industrial Zone Gamma',
-            'GA_PromZone_Mis_1': 'Industrial Zone Delta',
-            'GA_KhimMash_Mis_01': 'Chemical Plant Alpha',
-            'GA_KhimMash_Mis_02': 'Chemical Plant Beta',
-            'GA_KhimMash_Mis_1': 'Chemical Plant Gamma',
-
-            # Settlements
-            'GA_Bochki_Mis_1': 'Bochki Settlement',
-            'GA_Bochki_Mis_01': 'Bochki Settlement Alpha',
-            'GA_Krasnoe_Mis_1': 'Krasnoe Settlement',
-            'GA_Krasnoe_Mis_01': 'Krasnoe Settlement Alpha',
-            'GA_Dubovoe_0_Mis_1': 'Dubovoe Settlement',
-            'GA_Dubovoe_Mis_1': 'Dubovoe Settlement Alpha',
-            'GA_Settle_09_Mis_1': 'Northern Settlement',
-            'GA_Settle_05_ChernyLog_mis1': 'Cherny Log Settlement',
-            'GA_Settle_Mis_1': 'Eastern Settlement',
-            'GA_Settle_Mis_01': 'Western Settlement',
-            'GA_Beregovoy_mis1': 'Beregovoy Settlement',
-            'GA_Beregovoy_Mis_1': 'Beregovoy Settlement Alpha',
-
-            # Resource Sites
-            'GA_Sawmill_03_Mis_01': 'Sawmill Complex Alpha',
-            'GA_Sawmill_01_mis1': 'Sawmill Complex Beta',
-            'GA_Sawmill_02_Mis_1': 'Sawmill Complex Gamma',
-            'GA_Sawmill_Mis_1': 'Sawmill Complex Delta',
-            'GA_Sawmill_Mis_01': 'Sawmill Complex Echo',
-            'GA_Lighthouse_02_mis1': 'Lighthouse Compound',
-            'GA_Lighthouse_Mis_1': 'Lighthouse Compound Alpha',
-            'GA_Lighthouse_Mis_01': 'Lighthouse Compound Beta',
-            'GA_Bunker_01_mis1': 'Underground Bunker',
-            'GA_Bunker_Mis_1': 'Underground Bunker Alpha',
-            'GA_Bunker_Mis_01': 'Underground Bunker Beta',
-
-            # Special Locations
-            'GA_Airport_mis_01_Enc2': 'Airport Terminal',
-            'GA_Airport_Mis_1': 'Airport Terminal Alpha',
-            'GA_Airport_Mis_01': 'Airport Terminal Beta',
-            'GA_Voron_Enc_1': 'Voron Stronghold',
-            'GA_Voron_Mis_1': 'Voron Stronghold Alpha',
-            'GA_Hospital_Mis_1': 'Medical Facility',
-            'GA_Hospital_Mis_01': 'Medical Facility Alpha',
-            'GA_School_Mis_1': 'Abandoned School',
-            'GA_School_Mis_01': 'Abandoned School Alpha',
-            'GA_Factory_Mis_1': 'Manufacturing Plant',
-            'GA_Factory_Mis_01': 'Manufacturing Plant Alpha',
-
-            # Additional common patterns
-            'GA_Town_Mis_1': 'Town Center',
-            'GA_Town_Mis_01': 'Town Center Alpha',
-            'GA_Base_Mis_1': 'Forward Base',
-            'GA_Base_Mis_01': 'Forward Base Alpha',
-            'GA_Outpost_Mis_1': 'Remote Outpost',
-            'GA_Outpost_Mis_01': 'Remote Outpost Alpha',
-            'GA_Camp_Mis_1': 'Field Camp',
-            'GA_Camp_Mis_01': 'Field Camp Alpha'
+    def _build_master_pattern(self, patterns: Dict[str, re.Pattern]):
+        """
+        Union every event pattern into one alternation of named groups, run with match()
+        from column 0. Unanchored patterns get a lazy .*? lead-in so each alternative can
+        still hit anywhere in the line, and case-insensitive ones are scoped with (?i:...).
+        Returns the bound match function and {event_type: (group_index, group_count)}.
+        Uses RE2 when it is available.
+        """
+        alternatives = []
+        for event_type, pattern in patterns.items():
+            source = pattern.pattern
+            source = source[1:] if source.startswith('^') else '.*?' + source
+            if event_type in _CASEFOLDED_EVENTS or pattern.flags & re.IGNORECASE:
+                source = f'(?i:{source})'
+            alternatives.append(f'(?P<{event_type}>{source})')
+
+        master_source = '|'.join(alternatives)
+        master = None
+        if USE_RE2:
+            try:
+                master = re2.compile(master_source)
+            except Exception as e:
+                logger.debug(f"RE2 rejected master log pattern, using re: {e}")
+        if master is None:
+            master = re.compile(master_source)
+
+        groups = {
+            event_type: (master.groupindex[event_type], pattern.groups)
+            for event_type, pattern in patterns.items()
         }
+        return master.match, groups
 
-        # If exact match found, return it
-        if raw_mission_name in mission_mappings:
-            return mission_mappings[raw_mission_name]
+    def _build_keyword_automaton(self):
+        """Aho-Corasick automaton over the lowercase event keywords"""
+        try:
+            automaton = ahocorasick.Automaton()
+            for keyword in _EVENT_KEYWORD_LIST:
+                automaton.add_word(keyword.decode('ascii'), keyword)
+            automaton.make_automaton()
+            return automaton
+        except Exception as e:
+            logger.warning(f"Aho-Corasick keyword automaton unavailable, using regex: {e}")
+            return None
+
+    def _has_event_keyword(self, line: str) -> bool:
+        """Cheap screen: every event pattern contains at least one of the event keywords"""
+        if self._keyword_automaton is not None:
+            return next(self._keyword_automaton.iter(line.lower()), None) is not None
+        return _EVENT_KEYWORDS_TEXT.search(line) is not None
+
+    def _compile_capture_patterns(self, patterns: Dict[str, re.Pattern]) -> Dict[str, re.Pattern]:
+        """Standalone per-event patterns with casefolded ones made case-insensitive"""
+        return {
+            event_type: re.compile(pattern.pattern, pattern.flags | re.IGNORECASE)
+            if event_type in _CASEFOLDED_EVENTS else pattern
+            for event_type, pattern in patterns.items()
+        }
 
-        # Try to extract meaningful parts for fallback
-        clean_name = raw_mission_name.replace('GA_', '').replace('_Mis_', ' ').replace('_mis', ' ')
-        clean_name = clean_name.replace('_01', '').replace('_02', '').replace('_03', '')
-        clean_name = clean_name.replace('_1', '').replace('_2', '').replace('_3', '')
-        clean_name = clean_name.replace('_Enc', ' Encounter')
+    def _build_hyperscan_database(self, patterns: Dict[str, re.Pattern]):
+        """Compile every event pattern into one Hyperscan block-mode database"""
+        try:
+            expressions = []
+            flags = []
+            for event_type, pattern in patterns.items():
+                expressions.append(pattern.pattern.encode('utf-8'))
+                pattern_flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+                if event_type in _CASEFOLDED_EVENTS or pattern.flags & re.IGNORECASE:
+                    pattern_flags |= hyperscan.HS_FLAG_CASELESS
+                flags.append(pattern_flags)
+
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(expressions=expressions, ids=list(range(len(expressions))),
+                             elements=len(expressions), flags=flags)
+            logger.info(f"Hyperscan database compiled for {len(expressions)} log patterns")
+            return database
+        except Exception as e:
+            logger.warning(f"Hyperscan unavailable for log patterns, using regex: {e}")
+            return None
+
+    def _hyperscan_event_type(self, line: str) -> Optional[str]:
+        """Return the highest-priority (first declared) event type matching the line"""
+        scratch = getattr(self._hyperscan_local, 'scratch', None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._hyperscan_db)
+            self._hyperscan_local.scratch = scratch
+
+        matched_ids = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched_ids.append(pattern_id)
+
+        self._hyperscan_db.scan(line.encode('utf-8'), match_event_handler=on_match, scratch=scratch)
+        return self._event_types[min(matched_ids)] if matched_ids else None
+
+    def normalize_mission_name(self, raw_mission_name: str) -> str:
+        """Normalize mission names for consistency with comprehensive mappings"""
+        # If exact match found, return it
+        if raw_mission_name in _MISSION_MAPPINGS:
+            return _MISSION_MAPPINGS[raw_mission_name]
 
-        # Convert to title case and clean up
-        return clean_name.replace('_', ' ').title()
+        return _fallback_mission_name(raw_mission_name)
 
     def normalize_vehicle_name(self, raw_vehicle_name: str) -> str:
         """Normalize vehicle names for better display"""
         if not raw_vehicle_name or raw_vehicle_name == 'Unknown':
             return 'Military Vehicle'
 
-        vehicle_mappings = {
-            'BP_Vehicle_Car_01_C': 'Civilian Car',
-            'BP_Vehicle_Car_02_C': 'Sports Car',
-            'BP_Vehicle_Car_03_C': 'Off-Road Vehicle',
-            'BP_Vehicle_Truck_01_C': 'Cargo Truck',
-            'BP_Vehicle_Truck_02_C': 'Military Truck',
-            'BP_Vehicle_APC_01_C': 'Armored Personnel Carrier',
-            'BP_Vehicle_Helicopter_01_C': 'Transport Helicopter',
-            'BP_Vehicle_Helicopter_02_C': 'Attack Helicopter',
-            'BP_Vehicle_Bike_01_C': 'Motorcycle',
-            'BP_Vehicle_Quad_01_C': 'ATV Quad Bike',
-            'BP_Vehicle_Boat_01_C': 'Patrol Boat',
-            'BP_Vehicle_Boat_02_C': 'Speed Boat'
-        }
-
         # Check for exact match
-        if raw_vehicle_name in vehicle_mappings:
-            return vehicle_mappings[raw_vehicle_name]
+        if raw_vehicle_name in _VEHICLE_MAPPINGS:
+            return _VEHICLE_MAPPINGS[raw_vehicle_name]
 
-        # Extract meaningful parts for fallback
-        clean_name = raw_vehicle_name.replace('BP_Vehicle_', '').replace('_C', '').replace('_01', '').replace('_02', '')
-        return clean_name.replace('_', ' ').title() if clean_name else 'Military Vehicle'
+        return _fallback_vehicle_name(raw_vehicle_name)
 
-    def get_connection_key(self, guild_id: int, server_id: str, ip: str, port: str) -> str:
+    def get_connection_key(self, guild_id: int, server_id: str, ip: str, port: str) -> tuple:
         """Generate unique key for tracking connection lifecycle"""
-        return f"{guild_id}_{server_id}_{ip}_{port}"
+        return (guild_id, server_id, ip, port)
 
     async def track_player_lifecycle_event(self, guild_id: int, server_id: str, ip: str, port: str, 
                                          event_type: str, timestamp: datetime, additional_data: Dict = None):
@@ -305,39 +749,109 @@ class LogParser:
         stats = self.connection_parser.get_server_stats(server_key)
         return stats.get('player_count', 0)
 
-    async def cleanup_old_lifecycle_data(self, max_age_hours: int = 24):
-        """Clean up old lifecycle tracking data"""
-        current_time = datetime.now(timezone.utc)
-        keys_to_remove = []
-
-        for connection_key, lifecycle in self.player_lifecycle.items():
-            age_hours = (current_time - lifecycle['last_updated']).total_seconds() / 3600
-            if age_hours > max_age_hours:
-                keys_to_remove.append(connection_key)
+    def _touch_lifecycle(self, connection_key: tuple, lifecycle: Dict[str, Any], timestamp: datetime):
+        """Store a lifecycle entry, keep its server's stats counters current and queue its age check"""
+        stats = self._get_lifecycle_stats(lifecycle['guild_id'], lifecycle['server_id'])
+        is_new = connection_key not in self.player_lifecycle
+
+        # Move the connection between state buckets
+        old_bucket = self._lifecycle_buckets.get(connection_key)
+        new_bucket = _LIFECYCLE_BUCKETS.get(lifecycle['current_state'])
+        if new_bucket == 'active_players' and not lifecycle.get('is_active'):
+            new_bucket = None
+        if old_bucket != new_bucket:
+            if old_bucket:
+                stats[old_bucket] -= 1
+            if new_bucket:
+                stats[new_bucket] += 1
+            self._lifecycle_buckets[connection_key] = new_bucket
+
+        is_today = lifecycle['first_seen'].date() == stats['day']
+        if is_new and is_today:
+            stats['total_connections_today'] += 1
+        if new_bucket == 'failed' and old_bucket != 'failed' and is_today:
+            stats['failed_connections_today'] += 1
+        if lifecycle.get('session_duration') and old_bucket != new_bucket:
+            # Keep the window total in step so the average never re-sums the window
+            durations = stats['session_durations']
+            if len(durations) == durations.maxlen:
+                stats['session_duration_total'] -= durations[0]
+            durations.append(lifecycle['session_duration'])
+            stats['session_duration_total'] += lifecycle['session_duration']
+
+        lifecycle['last_updated'] = timestamp
+        self.player_lifecycle[connection_key] = lifecycle
+        heapq.heappush(self._lifecycle_expiry, (timestamp.timestamp(), connection_key))
+
+    def _get_lifecycle_stats(self, guild_id: int, server_id: str) -> Dict[str, Any]:
+        """Running lifecycle counters for a server, rolled over at UTC midnight"""
+        today = datetime.now(timezone.utc).date()
+        stats = self._lifecycle_stats.get((guild_id, server_id))
+
+        if stats is None:
+            stats = {
+                'active_players': 0,
+                'queued_players': 0,
+                'connecting_players': 0,
+                'failed': 0,
+                'session_durations': deque(maxlen=1024),
+                'session_duration_total': 0,
+                'day': today,
+                'total_connections_today': 0,
+                'failed_connections_today': 0
+            }
+            self._lifecycle_stats[(guild_id, server_id)] = stats
+        elif stats['day'] != today:
+            stats['day'] = today
+            stats['total_connections_today'] = 0
+            stats['failed_connections_today'] = 0
 
-        for key in keys_to_remove:
-            del self.player_lifecycle[key]
+        return stats
 
-        if keys_to_remove:
-            logger.info(f"Cleaned up {len(keys_to_remove)} old player lifecycle entries")
+    async def cleanup_old_lifecycle_data(self, max_age_hours: int = 24):
+        """Clean up old lifecycle tracking data"""
+        cutoff = datetime.now(timezone.utc).timestamp() - max_age_hours * 3600
+
+        # Heaps are ordered by last-touched time, so only expired entries are visited.
+        # Entries touched again since being pushed no longer match and are skipped.
+        removed_lifecycles = 0
+        while self._lifecycle_expiry and self._lifecycle_expiry[0][0] < cutoff:
+            touched_ts, connection_key = heapq.heappop(self._lifecycle_expiry)
+            lifecycle = self.player_lifecycle.get(connection_key)
+            if lifecycle and lifecycle['last_updated'].timestamp() == touched_ts:
+                del self.player_lifecycle[connection_key]
+                bucket = self._lifecycle_buckets.pop(connection_key, None)
+                if bucket:
+                    self._get_lifecycle_stats(lifecycle['guild_id'], lifecycle['server_id'])[bucket] -= 1
+                removed_lifecycles += 1
+
+        if removed_lifecycles:
+            logger.info(f"Cleaned up {removed_lifecycles} old player lifecycle entries")
+
+        # Drop playtime sessions whose disconnect was never seen
+        stale_sessions = 0
+        while self._session_expiry and self._session_expiry[0][0] < cutoff:
+            join_ts, session_key = heapq.heappop(self._session_expiry)
+            if self._session_join_ts.get(session_key) == join_ts:
+                del self._session_join_ts[session_key]
+                stale_sessions += 1
+
+        if stale_sessions:
+            logger.info(f"Cleaned up {stale_sessions} stale playtime sessions")
 
     async def track_player_join(self, guild_id: int, server_id: str, player_name: str, timestamp: datetime):
         """Track player join for playtime rewards"""
-        session_key = f"{guild_id}_{server_id}_{player_name}"
-        self.player_sessions[session_key] = {
-            'join_time': timestamp,
-            'guild_id': guild_id,
-            'server_id': server_id,
-            'player_name': player_name
-        }
+        session_key = (guild_id, server_id, player_name)
+        join_ts = timestamp.timestamp()
+        self._session_join_ts[session_key] = join_ts
+        heapq.heappush(self._session_expiry, (join_ts, session_key))
 
     async def track_player_disconnect(self, guild_id: int, server_id: str, player_name: str, timestamp: datetime):
         """Track player disconnect and award playtime economy points"""
-        session_key = f"{guild_id}_{server_id}_{player_name}"
+        join_ts = self._session_join_ts.pop((guild_id, server_id, player_name), None)
 
-        if session_key in self.player_sessions:
-            join_time = self.player_sessions[session_key]['join_time']
-            playtime_minutes = (timestamp - join_time).total_seconds() / 60
+        if join_ts is not None:
+            playtime_minutes = (timestamp.timestamp() - join_ts) / 60
 
             # Award economy points (1 point per minute, minimum 5 minutes)
             if playtime_minutes >= 5:
@@ -349,44 +863,98 @@ class LogParser:
                     # Get currency name for this guild
                     currency_name = await self._get_guild_currency_name(guild_id)
 
-                    # Award playtime points
-                    await self.bot.get_cog('Economy').add_wallet_event(
-                        guild_id, discord_id, points_earned, 
+                    # Award playtime points (written in batches by _flush_wallet_events_loop)
+                    self._wallet_queue.append((
+                        guild_id, discord_id, points_earned,
                         'playtime', f'Online time: {int(playtime_minutes)} minutes'
-                    )
-
-            # Remove from tracking
-            del self.player_sessions[session_key]
+                    ))
 
     async def _find_discord_user_by_character(self, guild_id: int, character_name: str) -> Optional[int]:
         """Find Discord user ID by character name"""
+        cache_key = (guild_id, character_name)
+        cached = self._character_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._character_cache_ttl:
+            return cached[1]
+
         try:
-            # Search through all players in the guild for this character
-            cursor = self.bot.db_manager.players.find({'guild_id': guild_id})
-            async for player_doc in cursor:
-                if character_name in player_doc.get('linked_characters', []):
-                    return player_doc.get('discord_id')
-            return None
+            # Indexed lookup on (guild_id, linked_characters)
+            player_doc = await self.bot.db_manager.players.find_one(
+                {'guild_id': guild_id, 'linked_characters': character_name},
+                {'discord_id': 1}
+            )
+            discord_id = player_doc.get('discord_id') if player_doc else None
+            self._character_cache[cache_key] = (time.monotonic(), discord_id)
+            return discord_id
         except Exception:
             return None
 
+    async def _get_guild_cached(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """Guild config from db_manager, cached briefly since it is read for every event"""
+        now = time.monotonic()
+        cached = self._guild_cache.get(guild_id)
+        if cached and now - cached[0] < self._guild_cache_ttl:
+            return cached[1]
+
+        guild_config = await self.bot.db_manager.get_guild(guild_id)
+        self._guild_cache[guild_id] = (now, guild_config)
+        return guild_config
+
     async def _get_guild_currency_name(self, guild_id: int) -> str:
         """Get custom currency name for guild or default"""
+        now = time.monotonic()
+        cached = self._currency_cache.get(guild_id)
+        if cached and now - cached[0] < self._currency_cache_ttl:
+            return cached[1]
+
         try:
             if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
                 return 'Emeralds'
             guild_config = await self.bot.db_manager.get_guild(guild_id)
-            return guild_config.get('currency_name', 'Emeralds') if guild_config else 'Emeralds'
+            currency_name = guild_config.get('currency_name', 'Emeralds') if guild_config else 'Emeralds'
+            self._currency_cache[guild_id] = (now, currency_name)
+            return currency_name
         except Exception:
             return 'Emeralds'
 
+    async def _flush_wallet_events(self):
+        """Write all queued playtime wallet events with a single bulk insert"""
+        if not self._wallet_queue:
+            return
+
+        batch, self._wallet_queue = self._wallet_queue, []
+        economy_cog = self.bot.get_cog('Economy')
+        if not economy_cog:
+            logger.warning(f"Economy cog not loaded - dropping {len(batch)} playtime wallet events")
+            return
+
+        await economy_cog.add_wallet_events_bulk(batch)
+
+    async def _flush_wallet_events_loop(self):
+        """Background task flushing the wallet event queue every few seconds"""
+        while True:
+            try:
+                await asyncio.sleep(self._wallet_flush_interval)
+                await self._flush_wallet_events()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Failed to flush wallet events: {e}")
+
     def get_server_status_key(self, guild_id: int, server_id: str) -> str:
-        """Generate server status tracking key"""
-        return f"{guild_id}_{server_id}"
+        """Generate server status tracking key (shared with the connection parser and persisted state)"""
+        key = self._server_key_cache.get((guild_id, server_id))
+        if key is None:
+            key = sys.intern(f"{guild_id}_{server_id}")
+            self._server_key_cache[(guild_id, server_id)] = key
+        return key
+
+    def _status_key(self, guild_id: int, server_id: str) -> tuple:
+        """In-process key for server_status and pending voice channel updates"""
+        return (guild_id, server_id)
 
     async def init_server_status(self, guild_id: int, server_id: str, server_name: Optional[str] = None):
         """Initialize server status tracking"""
-        status_key = self.get_server_status_key(guild_id, server_id)
+        status_key = self._status_key(guild_id, server_id)
         self.server_status[status_key] = {
             'guild_id': guild_id,
             'server_id': server_id,
@@ -394,14 +962,13 @@ class LogParser:
             'current_players': 0,
             'max_players': 50,  # Default, will be updated from log
             'queue_count': 0,
-            'queued_players': set(),
-            'online_players': set(),
+            'players': {},  # player_name -> PLAYER_QUEUED / PLAYER_ONLINE, counts kept alongside
             'last_updated': datetime.now(timezone.utc)
         }
 
     async def update_server_max_players(self, guild_id: int, server_id: str, max_players: int):
         """Update server max player count from log"""
-        status_key = self.get_server_status_key(guild_id, server_id)
+        status_key = self._status_key(guild_id, server_id)
 
         if status_key not in self.server_status:
             await self.init_server_status(guild_id, server_id)
@@ -411,33 +978,29 @@ class LogParser:
 
     async def track_player_queued(self, guild_id: int, server_id: str, player_name: str, queue_position: int):
         """Track player entering queue"""
-        status_key = self.get_server_status_key(guild_id, server_id)
+        status_key = self._status_key(guild_id, server_id)
 
         if status_key not in self.server_status:
             await self.init_server_status(guild_id, server_id)
 
         # Add to queued players
-        self.server_status[status_key]['queued_players'].add(player_name)
-        self.server_status[status_key]['queue_count'] = len(self.server_status[status_key]['queued_players'])
-        self.server_status[status_key]['last_updated'] = datetime.now(timezone.utc)
+        status = self.server_status[status_key]
+        self._set_player_state(status, player_name, PLAYER_QUEUED)
+        status['last_updated'] = datetime.now(timezone.utc)
 
         await self.update_voice_channel_name(guild_id, server_id)
 
     async def track_player_successful_join(self, guild_id: int, server_id: str, player_name: str, timestamp: datetime):
         """Track successful player join (from queue to online)"""
-        status_key = self.get_server_status_key(guild_id, server_id)
+        status_key = self._status_key(guild_id, server_id)
 
         if status_key not in self.server_status:
             await self.init_server_status(guild_id, server_id)
 
         # Remove from queue, add to online
-        self.server_status[status_key]['queued_players'].discard(player_name)
-        self.server_status[status_key]['online_players'].add(player_name)
-
-        # Update counts
-        self.server_status[status_key]['current_players'] = len(self.server_status[status_key]['online_players'])
-        self.server_status[status_key]['queue_count'] = len(self.server_status[status_key]['queued_players'])
-        self.server_status[status_key]['last_updated'] = datetime.now(timezone.utc)
+        status = self.server_status[status_key]
+        self._set_player_state(status, player_name, PLAYER_ONLINE)
+        status['last_updated'] = datetime.now(timezone.utc)
 
         # Start playtime tracking
         await self.track_player_join(guild_id, server_id, player_name, timestamp)
@@ -446,21 +1009,15 @@ class LogParser:
 
     async def track_player_disconnect_or_failed_join(self, guild_id: int, server_id: str, player_name: str, timestamp: datetime):
         """Track player disconnect or failed join"""
-        status_key = self.get_server_status_key(guild_id, server_id)
+        status_key = self._status_key(guild_id, server_id)
 
         if status_key not in self.server_status:
             await self.init_server_status(guild_id, server_id)
 
         # Remove from both queue and online (handles both disconnect and failed join)
-        was_online = player_name in self.server_status[status_key]['online_players']
-
-        self.server_status[status_key]['queued_players'].discard(player_name)
-        self.server_status[status_key]['online_players'].discard(player_name)
-
-        # Update counts
-        self.server_status[status_key]['current_players'] = len(self.server_status[status_key]['online_players'])
-        self.server_status[status_key]['queue_count'] = len(self.server_status[status_key]['queued_players'])
-        self.server_status[status_key]['last_updated'] = datetime.now(timezone.utc)
+        status = self.server_status[status_key]
+        was_online = self._set_player_state(status, player_name, None) == PLAYER_ONLINE
+        status['last_updated'] = datetime.now(timezone.utc)
 
         # Award playtime if they were online
         if was_online:
@@ -468,62 +1025,43 @@ class LogParser:
 
         await self.update_voice_channel_name(guild_id, server_id)
 
+    def _set_player_state(self, status: Dict[str, Any], player_name: str, new_state: Optional[int]) -> Optional[int]:
+        """Move a player between queued/online/gone, keeping the status counters in step"""
+        players = status['players']
+        old_state = players.pop(player_name, None)
+
+        if old_state == PLAYER_ONLINE:
+            status['current_players'] -= 1
+        elif old_state == PLAYER_QUEUED:
+            status['queue_count'] -= 1
+
+        if new_state == PLAYER_ONLINE:
+            status['current_players'] += 1
+        elif new_state == PLAYER_QUEUED:
+            status['queue_count'] += 1
+
+        if new_state is not None:
+            players[player_name] = new_state
+
+        return old_state
+
     async def get_comprehensive_server_stats(self, guild_id: int, server_id: str) -> Dict[str, Any]:
-        """Get comprehensive server statistics using lifecycle tracking"""
-        current_time = datetime.now(timezone.utc)
+        """Get comprehensive server statistics from the running lifecycle counters"""
+        counters = self._get_lifecycle_stats(guild_id, server_id)
         stats = {
-            'active_players': 0,
-            'queued_players': 0,
-            'connecting_players': 0,
-            'total_connections_today': 0,
-            'failed_connections_today': 0,
+            'active_players': counters['active_players'],
+            'queued_players': counters['queued_players'],
+            'connecting_players': counters['connecting_players'],
+            'total_connections_today': counters['total_connections_today'],
+            'failed_connections_today': counters['failed_connections_today'],
             'average_session_duration': 0,
             'peak_players_today': 0,
             'connection_success_rate': 0
         }
 
-        # Calculate statistics from lifecycle data
-        active_connections = []
-        queued_connections = []
-        connecting_connections = []
-        todays_connections = []
-        failed_connections = []
-        session_durations = []
-
-        for connection_key, lifecycle in self.player_lifecycle.items():
-            if lifecycle['guild_id'] == guild_id and lifecycle['server_id'] == server_id:
-                # Check if connection is from today
-                is_today = lifecycle['first_seen'].date() == current_time.date()
-                if is_today:
-                    todays_connections.append(lifecycle)
-
-                # Categorize current state
-                current_state = lifecycle['current_state']
-                if current_state in ['WORLD_CONNECTED', 'ONLINE_ACTIVE'] and lifecycle['is_active']:
-                    # Check if still considered active
-                    time_since_update = (current_time - lifecycle['last_updated']).total_seconds()
-                    if time_since_update < 600:  # 10 minutes
-                        active_connections.append(lifecycle)
-                elif current_state in ['QUEUE_REQUESTED', 'QUEUE_ACCEPTED']:
-                    queued_connections.append(lifecycle)
-                elif current_state in ['BEACON_HANDSHAKE', 'BEACON_AUTHENTICATED', 'WORLD_AUTHENTICATING']:
-                    connecting_connections.append(lifecycle)
-                elif current_state in ['FAILED', 'TIMEOUT'] and is_today:
-                    failed_connections.append(lifecycle)
-
-                # Collect session durations for completed sessions
-                if lifecycle.get('session_duration'):
-                    session_durations.append(lifecycle['session_duration'])
-
-        # Calculate final statistics
-        stats['active_players'] = len(active_connections)
-        stats['queued_players'] = len(queued_connections)
-        stats['connecting_players'] = len(connecting_connections)
-        stats['total_connections_today'] = len(todays_connections)
-        stats['failed_connections_today'] = len(failed_connections)
-
+        session_durations = counters['session_durations']
         if session_durations:
-            stats['average_session_duration'] = sum(session_durations) / len(session_durations)
+            stats['average_session_duration'] = counters['session_duration_total'] / len(session_durations)
 
         if stats['total_connections_today'] > 0:
             successful_connections = stats['total_connections_today'] - stats['failed_connections_today']
@@ -532,9 +1070,30 @@ class LogParser:
         return stats
 
     async def update_voice_channel_name(self, guild_id: int, server_id: str):
+        """Schedule a voice channel rename, coalescing bursts of status changes into one edit"""
+        status_key = self._status_key(guild_id, server_id)
+
+        if status_key not in self.server_status:
+            return
+
+        # A rename is already pending - it will pick up the latest counts when it fires
+        if status_key in self._vc_pending:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._vc_pending[status_key] = loop.call_later(
+            self._vc_update_delay, self._fire_voice_channel_update, guild_id, server_id
+        )
+
+    def _fire_voice_channel_update(self, guild_id: int, server_id: str):
+        """Timer callback that hands the coalesced rename to the event loop"""
+        self._vc_pending.pop(self._status_key(guild_id, server_id), None)
+        asyncio.create_task(self._do_voice_channel_update(guild_id, server_id))
+
+    async def _do_voice_channel_update(self, guild_id: int, server_id: str):
         """Update voice channel name with current server status"""
         try:
-            status_key = self.get_server_status_key(guild_id, server_id)
+            status_key = self._status_key(guild_id, server_id)
 
             if status_key not in self.server_status:
                 return
@@ -546,7 +1105,7 @@ class LogParser:
                 logger.warning("Bot database not available for voice channel update")
                 return
 
-            guild_config = await self.bot.db_manager.get_guild(guild_id)
+            guild_config = await self._get_guild_cached(guild_id)
             if not guild_config:
                 return
 
@@ -580,22 +1139,45 @@ class LogParser:
             else:
                 new_name = f"📈 {server_name}: {current}/{max_players}"
 
-            # Update channel name if different
+            # Queue the rename; the flusher applies only the latest name per channel
             if voice_channel.name != new_name:
-                await voice_channel.edit(name=new_name)
-                logger.info(f"Updated voice channel name to: {new_name}")
+                self._pending_vc_names[voice_channel.id] = (voice_channel, new_name)
+            else:
+                self._pending_vc_names.pop(voice_channel.id, None)
 
         except Exception as e:
             logger.error(f"Failed to update voice channel name: {e}")
 
-    async def get_sftp_log_content(self, server_config: Dict[str, Any]) -> Optional[str]:
-        """Get log content from SFTP server using AsyncSSH with rotation detection"""
+    async def _flush_voice_channel_names_loop(self):
+        """Background task applying the most recent pending name per voice channel"""
+        while True:
+            try:
+                await asyncio.sleep(self._vc_flush_interval)
+                pending = self._pending_vc_names
+                self._pending_vc_names = {}
+
+                for voice_channel, new_name in pending.values():
+                    try:
+                        if voice_channel.name != new_name:
+                            await voice_channel.edit(name=new_name)
+                            logger.info(f"Updated voice channel name to: {new_name}")
+                    except Exception as e:
+                        logger.error(f"Failed to update voice channel name: {e}")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Failed to flush voice channel names: {e}")
+
+    async def get_sftp_log_content(self, server_config: Dict[str, Any]) -> Optional[bytes]:
+        """Get new raw log bytes from SFTP server using AsyncSSH with rotation detection"""
         try:
-            conn = await self.get_sftp_connection(server_config)
-            if not conn:
+            acquired = await self._acquire_sftp(server_config)
+            if not acquired:
                 return None
+            pool_key, sftp = acquired
+            broken = False
 
-            server_id = str(server_config.get('_id', 'unknown'))
+            server_id = sys.intern(str(server_config.get('_id', 'unknown')))
             sftp_host = server_config.get('host')
             # Try multiple possible log paths
             possible_paths = [
@@ -605,7 +1187,7 @@ class LogParser:
                 f"./logs/Deadside.log"
             ]
 
-            async with conn.start_sftp_client() as sftp:
+            try:
                 # Try each possible path until we find the log file
                 for remote_path in possible_paths:
                     try:
@@ -613,98 +1195,144 @@ class LogParser:
 
                         # Check file stats for rotation detection
                         file_stat = await sftp.stat(remote_path)
-                        file_size = file_stat.size if hasattr(file_stat, 'size') else 0
+                        file_size = file_stat.size or 0
+                        file_mtime = file_stat.mtime or 0
 
                         server_key = f"{sftp_host}_{server_id}"
-
-                        async with sftp.open(remote_path, 'r') as f:
-                            # Read entire file content
-                            full_content = await f.read()
-
-                            # Split into lines for processing
-                            all_lines = full_content.splitlines()
-                            total_lines = len(all_lines)
-
-                            # Check if file has been reset using persistent tracking
-                            file_was_reset = self._detect_file_reset(server_key, file_size, all_lines)
-
-                            if file_was_reset:
-                                logger.info(f"File reset detected for {server_key}, starting from beginning")
-                                last_line_count = 0
-                            else:
-                                # Get last processed line count from persistent state
-                                stored_state = self.file_states.get(server_key, {})
-                                last_line_count = stored_state.get('line_count', 0)
-
-                                # Validate that our stored position is still valid
-                                if last_line_count > total_lines:
-                                    logger.warning(f"Stored position {last_line_count} exceeds file size {total_lines}, resetting")
-                                    last_line_count = 0
-
-                            # Get new lines only
-                            new_lines = all_lines[last_line_count:]
-                            new_content = '\n'.join(new_lines)
-
-                            # Update file state with current information
-                            if all_lines:
-                                last_line_content = all_lines[-1] if all_lines else ""
-                                await self._update_file_state(server_key, file_size, total_lines, last_line_content)
-
-                            # Update legacy position tracking for compatibility
-                            self.last_log_position[server_key] = total_lines
-
-                            logger.info(f"Successfully read log file from: {remote_path} ({len(new_lines)} new lines from total {total_lines})")
-                            return new_content
+                        stored_state = self.file_states.get(server_key, {})
+                        offset = stored_state.get('last_position', 0)
+                        line_count = stored_state.get('line_count', 0)
+
+                        # Unchanged (mtime, size) means nothing new was appended
+                        if (offset and offset == file_size and
+                                stored_state.get('file_mtime') == file_mtime):
+                            logger.debug(f"No new log data for {server_key}")
+                            return b""
+
+                        # A shrunk file has been rotated - start from the beginning
+                        if offset > file_size:
+                            logger.info(f"File reset detected for {server_key}: size {offset} -> {file_size}")
+                            offset = 0
+
+                        async with sftp.open(remote_path, 'rb') as f:
+                            # Ranged read of only the bytes appended since the last cycle, plus
+                            # the byte before our offset so rotation is checked in the same request
+                            start = offset - 1 if offset else 0
+                            data = await self._read_range(f, start, file_size - start)
+
+                            if offset:
+                                if data[:1] != b'\n':
+                                    # Byte before our offset is no longer a line break: the file was
+                                    # replaced by one at least as large - re-read it from the start
+                                    logger.info(f"File reset detected for {server_key}, starting from beginning")
+                                    offset = 0
+                                    data = await self._read_range(f, 0, file_size)
+                                else:
+                                    data = data[1:]
+
+                            if offset == 0:
+                                line_count = 0
+
+                        # Hold back a trailing partial line until it has been terminated
+                        cut = data.rfind(b'\n') + 1
+                        new_content = data[:cut]
+                        new_line_count = new_content.count(b'\n')
+                        line_count += new_line_count
+
+                        # Update file state with current information
+                        if new_line_count:
+                            last_line = new_content[new_content.rfind(b'\n', 0, cut - 1) + 1:cut].decode('utf-8', errors='ignore').strip()
+                            await self._update_file_state(server_key, file_size, line_count, last_line,
+                                                          last_position=offset + cut, file_mtime=file_mtime)
+
+                        # Update legacy position tracking for compatibility
+                        self.last_log_position[server_key] = line_count
+
+                        logger.info(f"Successfully read log file from: {remote_path} ({new_line_count} new lines, {cut} bytes from offset {offset})")
+                        return new_content
 
                     except FileNotFoundError:
                         logger.debug(f"Log file not found at: {remote_path}")
                         continue
                     except Exception as e:
+                        if _is_broken_channel_error(e):
+                            # The channel itself failed - the other paths would fail the same way
+                            logger.warning(f"SFTP channel failed reading {remote_path}: {e}")
+                            broken = True
+                            return None
                         logger.warning(f"Error reading log file at {remote_path}: {e}")
                         continue
 
                 logger.warning(f"No log file found at any of the attempted paths for server {server_id}")
                 return None
+            finally:
+                self._release_sftp(pool_key, sftp, broken=broken)
 
         except Exception as e:
             logger.error(f"Failed to fetch SFTP log file: {e}")
             return None
 
+    async def _read_range(self, f, start: int, length: int) -> bytes:
+        """Read a byte range with several SFTP READ requests in flight, reassembled in order"""
+        chunk_size = self.sftp_read_chunk_size
+        if length <= chunk_size:
+            return await f.read(length, start)
+
+        semaphore = asyncio.Semaphore(self.sftp_max_inflight_reads)
+
+        async def read_chunk(chunk_offset: int, size: int) -> bytes:
+            async with semaphore:
+                return await f.read(size, chunk_offset)
+
+        end = start + length
+        chunks = await asyncio.gather(*[
+            read_chunk(chunk_offset, min(chunk_size, end - chunk_offset))
+            for chunk_offset in range(start, end, chunk_size)
+        ])
+        return b''.join(chunks)
+
+    def _get_sftp_pool_key(self, server_config: Dict[str, Any]) -> Optional[tuple]:
+        """Pool key shared by every server hosted behind the same SFTP login"""
+        sftp_host = server_config.get('host')
+        sftp_username = server_config.get('username')
+        if not all([sftp_host, sftp_username, server_config.get('password')]):
+            return None
+        return (sftp_host, server_config.get('port', 22), sftp_username)
+
     async def get_sftp_connection(self, server_config: Dict[str, Any]) -> Optional[asyncssh.SSHClientConnection]:
         """Get or create SFTP connection with pooling and timeout handling"""
         try:
-            sftp_host = server_config.get('host')
-            sftp_port = server_config.get('port', 22)
-            sftp_username = server_config.get('username')
-            sftp_password = server_config.get('password')
-
-            if not all([sftp_host, sftp_username, sftp_password]):
+            pool_key = self._get_sftp_pool_key(server_config)
+            if not pool_key:
                 return None
 
-            pool_key = f"{sftp_host}:{sftp_port}:{sftp_username}"
+            sftp_host, sftp_port, sftp_username = pool_key
+            sftp_password = server_config.get('password')
 
-            # Check existing connection with improved validation
-            if pool_key in self.sftp_pool:
-                conn = self.sftp_pool[pool_key]
-                try:
-                    if not conn.is_closed():
-                        return conn
-                    else:
-                        del self.sftp_pool[pool_key]
-                except Exception:
-                    del self.sftp_pool[pool_key]
+            # One lookup-and-connect per pool key at a time: concurrent misses would each
+            # connect and the later store would leak the earlier connection
+            lock = self._sftp_connect_locks.setdefault(pool_key, asyncio.Lock())
+            async with lock:
+                # Check existing connection with improved validation
+                entry = self.sftp_pool.get(pool_key)
+                if entry:
+                    try:
+                        if not entry['conn'].is_closed():
+                            return entry['conn']
+                    except Exception:
+                        pass
+                    self._drop_sftp_entry(pool_key)
 
-            # Create new connection with retry/backoff
-            for attempt in range(3):
-                try:
+                async def connect_attempt() -> asyncssh.SSHClientConnection:
                     # Use exact format specified in diagnostic for asyncssh connection
-                    conn = await asyncio.wait_for(
+                    return await asyncio.wait_for(
                         asyncssh.connect(
                             sftp_host, 
                             username=sftp_username, 
                             password=sftp_password, 
                             port=sftp_port, 
                             known_hosts=None,
+                            keepalive_interval=30,
                             server_host_key_algs=['ssh-rsa', 'rsa-sha2-256', 'rsa-sha2-512'],
                             kex_algs=['diffie-hellman-group14-sha256', 'diffie-hellman-group16-sha512', 'ecdh-sha2-nistp256', 'ecdh-sha2-nistp384', 'ecdh-sha2-nistp521'],
                             encryption_algs=['aes128-ctr', 'aes192-ctr', 'aes256-ctr', 'aes128-gcm@openssh.com', 'aes256-gcm@openssh.com'],
@@ -712,47 +1340,153 @@ class LogParser:
                         ),
                         timeout=30
                     )
-                    self.sftp_pool[pool_key] = conn
-                    return conn
 
-                except (asyncio.TimeoutError, asyncssh.Error) as e:
-                    logger.warning(f"SFTP connection attempt {attempt + 1} failed: {e}")
-                    if attempt < 2:
-                        await asyncio.sleep(2 ** attempt)
+                # One handshake at a time (sshd MaxStartups); the next attempt starts shortly
+                # after a failure rather than waiting out a long backoff
+                conn = None
+                for retry_delay in (*self.sftp_connect_retry_delays, None):
+                    try:
+                        conn = await connect_attempt()
+                        break
+                    except _SSH_FATAL_CONNECT_ERRORS as e:
+                        logger.warning(f"SFTP connection to {sftp_host} refused, not retrying: {e}")
+                        break
+                    except Exception as e:
+                        logger.warning(f"SFTP connection attempt to {sftp_host} failed: {e}")
+                        if retry_delay is not None:
+                            await asyncio.sleep(retry_delay)
 
-            return None
+                if conn is None:
+                    return None
+
+                self.sftp_pool[pool_key] = {
+                    'conn': conn,
+                    'channels': asyncio.Queue(),
+                    'open_channels': 0,
+                    'refcount': 0,
+                    'last_used': time.monotonic()
+                }
+                return conn
 
         except Exception as e:
             logger.error(f"Failed to get SFTP connection: {e}")
             return None
 
-    async def get_dev_log_content(self) -> Optional[str]:
-        """Get log content from attached_assets and dev_data directories"""
+    async def _acquire_sftp(self, server_config: Dict[str, Any]) -> Optional[tuple]:
+        """Borrow a pooled SFTP channel, opening a new one while under sftp_max_channels"""
+        conn = await self.get_sftp_connection(server_config)
+        if not conn:
+            return None
+
+        pool_key = self._get_sftp_pool_key(server_config)
+        entry = self.sftp_pool[pool_key]
+        entry['refcount'] += 1
+        entry['last_used'] = time.monotonic()
+
         try:
-            # Check attached_assets first
-            attached_log = Path('./attached_assets/Deadside.log')
-            if attached_log.exists():
+            if entry['channels'].empty() and entry['open_channels'] < self.sftp_max_channels:
+                entry['open_channels'] += 1
                 try:
-                    async with aiofiles.open(attached_log, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = await f.read()
-                        return content
-                except Exception as e:
-                    logger.error(f"Failed to read log file {attached_log}: {e}")
-                    return None
+                    sftp = await conn.start_sftp_client()
+                except Exception:
+                    entry['open_channels'] -= 1
+                    raise
+            else:
+                sftp = await entry['channels'].get()
+            return pool_key, sftp
+        except Exception as e:
+            entry['refcount'] -= 1
+            logger.error(f"Failed to open SFTP channel: {e}")
+            return None
 
-            # Fallback to dev_data
-            log_path = Path('./dev_data/logs/Deadside.log')
-            if log_path.exists():
-                try:
-                    async with aiofiles.open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = await f.read()
-                        return content
-                except Exception as e:
-                    logger.error(f"Failed to read log file {log_path}: {e}")
-                    return None
+    def _release_sftp(self, pool_key: tuple, sftp, broken: bool = False):
+        """Return a borrowed SFTP channel to its pool"""
+        entry = self.sftp_pool.get(pool_key)
+        if not entry:
+            try:
+                sftp.exit()
+            except Exception:
+                pass
+            return
 
-            logger.warning("No log file found in attached_assets or dev_data/logs/")
-            return None
+        entry['refcount'] -= 1
+        try:
+            if entry['conn'].is_closed():
+                self._drop_sftp_entry(pool_key)
+                return
+        except Exception:
+            pass
+
+        if broken:
+            entry['open_channels'] -= 1
+            try:
+                sftp.exit()
+            except Exception:
+                pass
+        else:
+            entry['channels'].put_nowait(sftp)
+
+    def _drop_sftp_entry(self, pool_key: tuple):
+        """Close a pooled connection and every idle channel on it"""
+        entry = self.sftp_pool.pop(pool_key, None)
+        if not entry:
+            return
+        while not entry['channels'].empty():
+            try:
+                entry['channels'].get_nowait().exit()
+            except Exception:
+                pass
+        try:
+            entry['conn'].close()
+        except Exception:
+            pass
+
+    async def _reap_idle_sftp_loop(self):
+        """Background task closing pooled connections that have been idle too long"""
+        while True:
+            try:
+                await asyncio.sleep(60)
+                cutoff = time.monotonic() - self.sftp_idle_timeout
+                for pool_key, entry in list(self.sftp_pool.items()):
+                    if entry['refcount'] == 0 and entry['last_used'] < cutoff:
+                        logger.debug(f"Closing idle SFTP connection to {pool_key[0]}:{pool_key[1]}")
+                        self._drop_sftp_entry(pool_key)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Failed to reap idle SFTP connections: {e}")
+
+    def close_sftp_pool(self):
+        """Close all pooled SFTP connections"""
+        for pool_key in list(self.sftp_pool.keys()):
+            self._drop_sftp_entry(pool_key)
+
+    async def get_dev_log_content(self, raw: bool = False):
+        """Get log content from attached_assets and dev_data directories (bytes when raw)"""
+        try:
+            # Resolve which candidate exists off the event loop, reusing the answer briefly
+            now = time.monotonic()
+            cached = self._dev_log_path
+            if cached and now - cached[0] < self._dev_log_path_ttl:
+                log_path = cached[1]
+            else:
+                log_path = await asyncio.to_thread(_first_existing_path, _DEV_LOG_PATHS)
+                self._dev_log_path = (now, log_path)
+
+            if log_path is None:
+                logger.warning("No log file found in attached_assets or dev_data/logs/")
+                return None
+
+            try:
+                if raw and async_open is not None:
+                    async with async_open(log_path, 'rb') as f:
+                        return await f.read()
+                return await asyncio.to_thread(_read_bytes_file if raw else _read_text_file, log_path)
+            except Exception as e:
+                # The file may have moved since it was cached - look again next time
+                self._dev_log_path = None
+                logger.error(f"Failed to read log file {log_path}: {e}")
+                return None
 
         except Exception as e:
             logger.error(f"Failed to read dev log file: {e}")
@@ -760,353 +1494,435 @@ class LogParser:
 
     async def parse_log_line(self, line: str, server_key: str, guild_id: int) -> Optional[Dict[str, Any]]:
         """Parse a single log line and extract event data with enhanced patterns"""
-        line = line.strip()
+        # Callers hand over splitlines() output, so only a stray CR can remain
+        if line.endswith('\r'):
+            line = line[:-1]
         if not line:
             return None
 
-        # FIRST: Check for player connection lifecycle events using intelligent parser
-        lifecycle_result = await self.connection_parser.parse_connection_event(line, server_key, guild_id)
-        if lifecycle_result:
-            return lifecycle_result
+        # FIRST: Check for player connection lifecycle events using intelligent parser -
+        # only lines it acts on pay for the await
+        if self.connection_parser.matches_connection_event(line):
+            lifecycle_result = await self.connection_parser.parse_connection_event(line, server_key, guild_id)
+            if lifecycle_result:
+                return lifecycle_result
 
-        # Try each pattern - prioritize specific patterns over generic ones
-        for event_type, pattern in self.log_patterns.items():
-            match = pattern.search(line)
-            if match:
-                try:
-                    # Handle different timestamp formats
-                    timestamp_str = match.group(1) if match.groups() else None
+        return self._parse_log_line_sync(line)
 
-                    if timestamp_str:
-                        try:
-                            # Try the expected format first
-                            timestamp = datetime.strptime(timestamp_str, '%Y.%m.%d-%H.%M.%S:%f')
-                        except ValueError:
-                            try:
-                                # Try without microseconds
-                                timestamp = datetime.strptime(timestamp_str, '%Y.%m.%d-%H.%M.%S')
-                            except ValueError:
-                                # Fallback to current time
-                                timestamp = datetime.now(timezone.utc)
-                                logger.debug(f"Could not parse timestamp '{timestamp_str}', using current time")
-                    else:
-                        timestamp = datetime.now(timezone.utc)
-
-                    timestamp = timestamp.replace(tzinfo=timezone.utc)
-
-                    event_data = {
-                        'type': event_type,
-                        'timestamp': timestamp,
-                        'raw_line': line
-                    }
-
-                    # Extract specific data based on event type with comprehensive lifecycle handling
-                    try:
-                        # COMPREHENSIVE PLAYER LIFECYCLE EVENT HANDLING
-                        if event_type in ['player_queue_request', 'player_queue_accepted', 'player_beacon_handshake'] and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type == 'player_beacon_auth' and len(match.groups()) >= 4:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'unique_id': match.group(4),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type in ['player_world_auth', 'player_world_spawn', 'player_online_status', 'player_session_start', 'player_character_spawn'] and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type in ['player_disconnect_cleanup', 'player_session_end', 'player_beacon_disconnect', 'player_network_disconnect', 'player_queue_timeout', 'player_queue_failed', 'player_auth_failed'] and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        # Legacy pattern support for backward compatibility
-                        elif event_type == 'player_queue_join' and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type == 'player_beacon_connected' and len(match.groups()) >= 4:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'unique_id': match.group(4),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type == 'player_world_connect' and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type == 'player_queue_disconnect' and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type in ['player_accepted_from', 'player_beacon_join'] and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type == 'player_connection_cleanup' and len(match.groups()) >= 3:
-                            event_data.update({
-                                'ip': match.group(2),
-                                'port': match.group(3),
-                                'connection_id': f"{match.group(2)}:{match.group(3)}"
-                            })
-                        elif event_type in ['mission_ready', 'mission_waiting', 'mission_initial'] and len(match.groups()) >= 2:
-                            mission_name = match.group(2)
-                            event_data.update({
-                                'mission_name': mission_name,
-                                'normalized_name': self.normalize_mission_name(mission_name),
-                                'state': event_type.replace('mission_', '').upper()
-                            })
-                        elif event_type == 'mission_respawn' and len(match.groups()) >= 3:
-                            mission_name = match.group(2)
-                            respawn_time = int(match.group(3))
-                            event_data.update({
-                                'mission_name': mission_name,
-                                'normalized_name': self.normalize_mission_name(mission_name),
-                                'respawn_time': respawn_time
-                            })
-                        elif event_type == 'mission_state_any' and len(match.groups()) >= 3:
-                            mission_name = match.group(2)
-                            state = match.group(3)
-                            # Convert to specific event type based on state
-                            if state == 'READY':
-                                event_data['type'] = 'mission_ready'
-                            elif state == 'WAITING':
-                                event_data['type'] = 'mission_waiting'
-                            elif state == 'INITIAL':
-                                event_data['type'] = 'mission_initial'
-
-                            event_data.update({
-                                'mission_name': mission_name,
-                                'normalized_name': self.normalize_mission_name(mission_name),
-                                'state': state
-                            })
-                        elif event_type == 'encounter_initial' and len(match.groups()) >= 3:
-                            encounter_name = match.group(2)
-                            respawn_time = int(match.group(3))
-                            event_data.update({
-                                'encounter_name': encounter_name,
-                                'respawn_time': respawn_time
-                            })
-                        elif event_type == 'patrol_switch' and len(match.groups()) >= 3:
-                            patrol_name = match.group(2)
-                            state = match.group(3)
-                            monsters = match.group(4) if len(match.groups()) >= 4 and match.group(4) else None
-                            event_data.update({
-                                'patrol_name': patrol_name,
-                                'state': state,
-                                'monsters': int(monsters) if monsters else None
-                            })
-                        elif event_type == 'vehicle_spawn' and len(match.groups()) >= 2:
-                            # Enhanced vehicle spawn detection
-                            current_vehicles = None
-                            max_vehicles = None
-                            vehicle_type = 'Unknown'
-
-                            if len(match.groups()) >= 3:
-                                try:
-                                    current_vehicles = int(match.group(2)) if match.group(2) else None
-                                    max_vehicles = int(match.group(3)) if match.group(3) else None
-                                except (ValueError, TypeError):
-                                    pass
-
-                            # Try to extract vehicle type from the line
-                            if 'BP_Vehicle_' in line:
-                                vehicle_match = re.search(r'BP_Vehicle_[A-Za-z0-9_]+', line)
-                                if vehicle_match:
-                                    vehicle_type = self.normalize_vehicle_name(vehicle_match.group())
-
-                            event_data.update({
-                                'current_vehicles': current_vehicles,
-                                'max_vehicles': max_vehicles,
-                                'vehicle_type': vehicle_type
-                            })
-                        elif event_type == 'vehicle_delete' and len(match.groups()) >= 2:
-                            vehicle_type = match.group(2) or match.group(3) if len(match.groups()) >= 3 else 'Unknown'
-
-                            # Try to extract vehicle type from the line if not found in groups
-                            if vehicle_type == 'Unknown' and 'BP_Vehicle_' in line:
-                                vehicle_match = re.search(r'BP_Vehicle_[A-Za-z0-9_]+', line)
-                                if vehicle_match:
-                                    vehicle_type = self.normalize_vehicle_name(vehicle_match.group())
-                            else:
-                                vehicle_type = self.normalize_vehicle_name(vehicle_type)
-
-                            event_data.update({
-                                'vehicle_type': vehicle_type
-                            })
-                        elif event_type in ['helicrash_initial', 'helicrash_spawned', 'helicrash_switched']:
-                            location = 'Unknown'
-                            if len(match.groups()) >= 4 and match.group(2) and match.group(3):
-                                try:
-                                    x_coord = float(match.group(2))
-                                    y_coord = float(match.group(3))
-                                    location = f"Grid {x_coord:.0f},{y_coord:.0f}"
-                                except (ValueError, TypeError):
-                                    pass
-                            event_data.update({
-                                'crash_type': 'helicopter',
-                                'state': 'INITIAL',
-                                'location': location
-                            })
-                        elif event_type in ['airdrop_flying', 'airdrop_switched']:
-                            event_data.update({
-                                'airdrop_state': 'flying'
-                            })
-                        elif event_type in ['trader_spawn', 'trader_switched', 'trader_available']:
-                            location = 'Unknown'
-                            if len(match.groups()) >= 4 and match.group(2) and match.group(3):
-                                try:
-                                    x_coord = float(match.group(2))
-                                    y_coord = float(match.group(3))
-                                    location = f"Grid {x_coord:.0f},{y_coord:.0f}"
-                                except (ValueError, TypeError):
-                                    pass
-                            event_data.update({
-                                'trader_state': 'available',
-                                'location': location
-                            })
-                        elif event_type == 'construction_save' and len(match.groups()) >= 3:
-                            count = int(match.group(2))
-                            duration = float(match.group(3))
-                            event_data.update({
-                                'constructibles_count': count,
-                                'save_duration_ms': duration
-                            })
-                        elif event_type == 'server_max_players' and len(match.groups()) >= 2:
-                            event_data['max_players'] = int(match.group(2))
-                    except (ValueError, IndexError) as e:
-                        logger.debug(f"Error extracting data from event {event_type}: {e}")
-
-                    return event_data
+    def _parse_log_line_sync(self, line: str) -> Optional[Dict[str, Any]]:
+        """Event extraction for one line with no awaits (CPU only)"""
+        # Most log lines are engine noise - skip the pattern set unless a keyword is present
+        if not self._has_event_keyword(line):
+            return None
 
-                except Exception as e:
-                    logger.debug(f"Failed to parse event type {event_type} from line: {e}")
-                    continue
+        return self._match_log_line(line)
+
+    def _scan_text(self, data: bytes) -> List[tuple]:
+        """
+        Regex pass over a block of raw log bytes with no event loop access, so it can
+        run in a worker thread. One finditer over the undecoded buffer locates candidate
+        lines by keyword; only those lines are decoded and matched against the full
+        pattern set. Returns (connection_line, event_data) pairs in log order.
+        """
+        results = []
+        is_connection_line = self.connection_parser.matches_connection_event
+        candidates = self._arrow_candidate_lines(data) if USE_ARROW else self._keyword_candidate_lines(data)
+
+        for line in candidates:
+            connection_line = line if is_connection_line(line) else None
+            event_data = self._match_log_line(line)
+            if connection_line or event_data:
+                results.append((connection_line, event_data))
+
+        return results
+
+    def _get_parse_pool(self, data: bytes) -> Optional[ProcessPoolExecutor]:
+        """Process pool for buffers large enough to be worth the copy, None otherwise"""
+        if len(data) < self.process_pool_min_bytes or self.parse_workers <= 1:
+            return None
 
-        # Log unmatched lines occasionally for debugging
-        if len(line) > 50:  # Only log substantial lines
-            logger.debug(f"No pattern matched for line: {line[:100]}...")
+        if self._parse_pool is None:
+            # spawn, not fork: the bot process already runs driver and scheduler threads
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                                   mp_context=multiprocessing.get_context('spawn'))
+        return self._parse_pool
 
-        return None
+    async def _scan_in_worker(self, data: bytes) -> List[tuple]:
+        """Run _scan_text in the process pool for large buffers, in a thread otherwise"""
+        try:
+            pool = self._get_parse_pool(data)
+            if pool is not None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(pool, _scan_text_worker, data)
+        except Exception as e:
+            logger.warning(f"Process pool scan failed, scanning in a thread: {e}")
+        return await asyncio.to_thread(self._scan_text, data)
+
+    def _keyword_candidate_lines(self, data: bytes):
+        """Yield decoded lines of the buffer that contain at least one event keyword"""
+        line_end = -1
+
+        for keyword in _EVENT_KEYWORDS.finditer(data):
+            # Further keyword hits on a line that was already handled
+            if keyword.start() < line_end:
+                continue
+
+            line_start = data.rfind(b'\n', 0, keyword.start()) + 1
+            line_end = data.find(b'\n', keyword.end())
+            if line_end == -1:
+                line_end = len(data)
+
+            yield data[line_start:line_end].decode('utf-8', errors='ignore').strip()
+
+    def _arrow_candidate_lines(self, data: bytes):
+        """Arrow variant of the keyword filter: one C pass over the whole line column"""
+        try:
+            lines = pa.array(data.decode('utf-8', errors='ignore').split('\n'), type=pa.string())
+            mask = pc.match_substring_regex(lines, pattern=_ARROW_KEYWORD_PATTERN, ignore_case=True)
+            candidates = pc.filter(lines, mask).to_pylist()
+        except Exception as e:
+            logger.warning(f"Arrow keyword filter failed, using regex scan: {e}")
+            yield from self._keyword_candidate_lines(data)
+            return
+
+        for line in candidates:
+            yield line.strip()
+
+    def _match_log_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """Match a stripped log line against the event patterns (CPU only, thread safe)"""
+        if self._hyperscan_db is not None:
+            # Hyperscan picks the event type; re only extracts that pattern's groups
+            event_type = self._hyperscan_event_type(line)
+            match = self._capture_matchers[event_type](line) if event_type else None
+        else:
+            # One engine call over the master alternation; alternatives are tried in
+            # log_patterns order, so specific patterns still win over generic ones
+            master_match = self._master_match(line)
+            event_type = master_match.lastgroup if master_match else None
+            match = _PatternMatch(master_match, *self._master_groups[event_type]) if master_match else None
+
+        if not match:
+            # Log unmatched lines occasionally for debugging
+            if len(line) > 50:  # Only log substantial lines
+                logger.debug(f"No pattern matched for line: {line[:100]}...")
+            return None
+
+        # Handle different timestamp formats
+        timestamp_str = match.group(1) if match.groups() else None
+
+        if timestamp_str:
+            try:
+                timestamp = _parse_log_timestamp(timestamp_str)
+            except ValueError:
+                # Fallback to current time
+                timestamp = datetime.now(timezone.utc)
+                logger.debug(f"Could not parse timestamp '{timestamp_str}', using current time")
+        else:
+            timestamp = datetime.now(timezone.utc)
+
+        # The full line is only kept (truncated) for debug logging; nothing downstream reads it
+        event_data = {
+            'type': event_type,
+            'timestamp': timestamp,
+            'raw_line': line[:120] if logger.isEnabledFor(logging.DEBUG) else None
+        }
+
+        # Events nobody downstream reads fields from (encounters, construction saves,
+        # vehicles, non-READY missions...) keep just type/timestamp/raw_line
+        if event_type not in _EXTRACTED_EVENTS:
+            return event_data
+
+        # Extract specific data based on event type via the precomputed handler table
+        try:
+            handler = self._event_handlers.get(event_type)
+            if handler and len(match.groups()) >= handler[0]:
+                handler[1](match, event_data)
+        except (ValueError, IndexError, TypeError, AttributeError) as e:
+            logger.debug(f"Error extracting data from event {event_type}: {e}")
+
+        return event_data
+
+    def _build_event_handlers(self) -> Dict[str, tuple]:
+        """Map each event type to (minimum capture groups, extractor), built once at init"""
+        handlers = {}
+
+        # COMPREHENSIVE PLAYER LIFECYCLE EVENTS - all capture (timestamp, ip, port)
+        for event_type in ('player_queue_request', 'player_queue_accepted', 'player_beacon_handshake',
+                           'player_world_auth', 'player_world_spawn', 'player_online_status',
+                           'player_session_start', 'player_character_spawn',
+                           'player_disconnect_cleanup', 'player_session_end', 'player_beacon_disconnect',
+                           'player_network_disconnect', 'player_queue_timeout', 'player_queue_failed',
+                           'player_auth_failed',
+                           # Legacy pattern support for backward compatibility
+                           'player_queue_join', 'player_world_connect', 'player_queue_disconnect',
+                           'player_accepted_from', 'player_beacon_join', 'player_connection_cleanup'):
+            handlers[event_type] = (3, self._extract_connection)
+        for event_type in ('player_beacon_auth', 'player_beacon_connected'):
+            handlers[event_type] = (4, self._extract_connection_with_id)
+
+        for event_type in ('mission_ready', 'mission_waiting', 'mission_initial'):
+            handlers[event_type] = (2, self._extract_mission_state)
+        handlers['mission_respawn'] = (3, self._extract_mission_respawn)
+        handlers['mission_state_any'] = (3, self._extract_mission_state_any)
+        handlers['encounter_initial'] = (3, self._extract_encounter)
+        handlers['patrol_switch'] = (3, self._extract_patrol)
+        handlers['vehicle_spawn'] = (2, self._extract_vehicle_spawn)
+        handlers['vehicle_delete'] = (2, self._extract_vehicle_delete)
+        for event_type in ('helicrash_initial', 'helicrash_spawned', 'helicrash_switched'):
+            handlers[event_type] = (0, self._extract_helicrash)
+        for event_type in ('airdrop_flying', 'airdrop_switched'):
+            handlers[event_type] = (0, self._extract_airdrop)
+        for event_type in ('trader_spawn', 'trader_switched', 'trader_available'):
+            handlers[event_type] = (0, self._extract_trader)
+        handlers['construction_save'] = (3, self._extract_construction_save)
+        handlers['server_max_players'] = (2, self._extract_max_players)
+
+        return handlers
+
+    def _extract_connection(self, match, event_data: Dict[str, Any]):
+        event_data.update({
+            'ip': match.group(2),
+            'port': match.group(3),
+            'connection_id': f"{match.group(2)}:{match.group(3)}"
+        })
+
+    def _extract_connection_with_id(self, match, event_data: Dict[str, Any]):
+        event_data.update({
+            'ip': match.group(2),
+            'port': match.group(3),
+            'unique_id': match.group(4),
+            'connection_id': f"{match.group(2)}:{match.group(3)}"
+        })
+
+    def _extract_mission_state(self, match, event_data: Dict[str, Any]):
+        mission_name = match.group(2)
+        event_data.update({
+            'mission_name': mission_name,
+            'normalized_name': self.normalize_mission_name(mission_name),
+            'state': event_data['type'].replace('mission_', '').upper()
+        })
+
+    def _extract_mission_respawn(self, match, event_data: Dict[str, Any]):
+        mission_name = match.group(2)
+        respawn_time = int(match.group(3))
+        event_data.update({
+            'mission_name': mission_name,
+            'normalized_name': self.normalize_mission_name(mission_name),
+            'respawn_time': respawn_time
+        })
+
+    def _extract_mission_state_any(self, match, event_data: Dict[str, Any]):
+        mission_name = match.group(2)
+        state = match.group(3)
+        # Convert to specific event type based on state
+        if state == 'READY':
+            event_data['type'] = 'mission_ready'
+        elif state == 'WAITING':
+            event_data['type'] = 'mission_waiting'
+        elif state == 'INITIAL':
+            event_data['type'] = 'mission_initial'
+
+        event_data.update({
+            'mission_name': mission_name,
+            'normalized_name': self.normalize_mission_name(mission_name),
+            'state': state
+        })
+
+    def _extract_encounter(self, match, event_data: Dict[str, Any]):
+        encounter_name = match.group(2)
+        respawn_time = int(match.group(3))
+        event_data.update({
+            'encounter_name': encounter_name,
+            'respawn_time': respawn_time
+        })
+
+    def _extract_patrol(self, match, event_data: Dict[str, Any]):
+        patrol_name = match.group(2)
+        state = match.group(3)
+        monsters = match.group(4) if len(match.groups()) >= 4 and match.group(4) else None
+        event_data.update({
+            'patrol_name': patrol_name,
+            'state': state,
+            'monsters': int(monsters) if monsters else None
+        })
+
+    def _extract_vehicle_spawn(self, match, event_data: Dict[str, Any]):
+        # Enhanced vehicle spawn detection
+        current_vehicles = None
+        max_vehicles = None
+        vehicle_type = 'Unknown'
+        line = match.string
+
+        if len(match.groups()) >= 3:
+            try:
+                current_vehicles = int(match.group(2)) if match.group(2) else None
+                max_vehicles = int(match.group(3)) if match.group(3) else None
+            except (ValueError, TypeError):
+                pass
+
+        # Try to extract vehicle type from the line
+        vehicle_blueprint = _find_vehicle_blueprint(line)
+        if vehicle_blueprint:
+            vehicle_type = self.normalize_vehicle_name(vehicle_blueprint)
+
+        event_data.update({
+            'current_vehicles': current_vehicles,
+            'max_vehicles': max_vehicles,
+            'vehicle_type': vehicle_type
+        })
+
+    def _extract_vehicle_delete(self, match, event_data: Dict[str, Any]):
+        vehicle_type = match.group(2) or match.group(3) if len(match.groups()) >= 3 else 'Unknown'
+        line = match.string
+
+        # Try to extract vehicle type from the line if not found in groups
+        if vehicle_type == 'Unknown' and 'BP_Vehicle_' in line:
+            vehicle_blueprint = _find_vehicle_blueprint(line)
+            if vehicle_blueprint:
+                vehicle_type = self.normalize_vehicle_name(vehicle_blueprint)
+        else:
+            vehicle_type = self.normalize_vehicle_name(vehicle_type)
+
+        event_data.update({
+            'vehicle_type': vehicle_type
+        })
+
+    def _grid_location(self, match) -> str:
+        location = 'Unknown'
+        if len(match.groups()) >= 4 and match.group(2) and match.group(3):
+            try:
+                x_coord = float(match.group(2))
+                y_coord = float(match.group(3))
+                location = f"Grid {x_coord:.0f},{y_coord:.0f}"
+            except (ValueError, TypeError):
+                pass
+        return location
+
+    def _extract_helicrash(self, match, event_data: Dict[str, Any]):
+        event_data.update({
+            'crash_type': 'helicopter',
+            'state': 'INITIAL',
+            'location': self._grid_location(match)
+        })
+
+    def _extract_airdrop(self, match, event_data: Dict[str, Any]):
+        event_data.update({
+            'airdrop_state': 'flying'
+        })
+
+    def _extract_trader(self, match, event_data: Dict[str, Any]):
+        event_data.update({
+            'trader_state': 'available',
+            'location': self._grid_location(match)
+        })
+
+    def _extract_construction_save(self, match, event_data: Dict[str, Any]):
+        count = int(match.group(2))
+        duration = float(match.group(3))
+        event_data.update({
+            'constructibles_count': count,
+            'save_duration_ms': duration
+        })
+
+    def _extract_max_players(self, match, event_data: Dict[str, Any]):
+        event_data['max_players'] = int(match.group(2))
 
     def should_output_event(self, event_data: Dict[str, Any]) -> bool:
         """Determine if event should be output based on dispatch rules"""
         event_type = event_data['type']
 
-        # Mission events - output only when READY
-        if event_type in ['mission_ready', 'mission_waiting', 'mission_initial']:
-            return event_type == 'mission_ready'
+        # Missions only when READY; encounters, construction saves and vehicles never
+        return event_type in _OUTPUT_EVENTS
 
-        # Airdrop events - output when flying or switched
-        if event_type in ['airdrop_flying', 'airdrop_switched']:
-            return True
+    async def send_log_event_embed(self, guild_id: int, server_id: str, event_data: Dict[str, Any]):
+        """Send log event embed to appropriate channel using EmbedFactory"""
+        try:
+            payload = await self._build_event_payload(guild_id, server_id, event_data)
+            if payload:
+                channel_id, embed, file = payload
+                await self.bot.batch_sender.queue_embed(channel_id=channel_id, embed=embed, file=file)
 
-        # Encounters - do not output
-        if event_type == 'encounter_initial':
-            return False
+        except Exception as e:
+            logger.error(f"Failed to send log event embed: {e}")
 
-        # Construction saves - do not output
-        if event_type == 'construction_save':
-            return False
+    async def _queue_event_payloads(self, pending_events: List[tuple]):
+        """Build a batch of (guild_id, server_id, event_data) embeds and hand them to the batch sender"""
+        if not pending_events:
+            return
+        try:
+            from bot.utils.embed_factory import EmbedFactory
 
-        # Heli crashes - output all types
-        if event_type in ['helicrash_initial', 'helicrash_spawned', 'helicrash_switched']:
-            return True
+            # Resolve each guild config once up front so the concurrent lookups all hit the cache
+            if getattr(self.bot, 'db_manager', None):
+                for guild_id in {guild_id for guild_id, _, _ in pending_events}:
+                    await self._get_guild_cached(guild_id)
 
-        # Trader events - output all types
-        if event_type in ['trader_spawn', 'trader_switched', 'trader_available']:
-            return True
+            channel_ids = await asyncio.gather(*(self._resolve_event_channel(guild_id, event_data)
+                                                 for guild_id, _, event_data in pending_events))
+            targets, requests = [], []
+            for channel_id, (_, _, event_data) in zip(channel_ids, pending_events):
+                if channel_id and (request := self._event_embed_request(event_data)):
+                    targets.append((channel_id, event_data))
+                    requests.append(request)
 
-        # Vehicle spawns - disabled for now
-        if event_type in ['vehicle_spawn', 'vehicle_delete']:
-            return False
+            # One factory call for the batch; if any event breaks it, build them one by one instead
+            try:
+                embed_results = EmbedFactory.build_batch(requests)
+            except Exception as e:
+                logger.error(f"Failed to build event embed batch, building individually: {e}")
+                embed_results = [await self._create_event_embed_via_factory(event_data) for _, event_data in targets]
+
+            items = [(channel_id, *embed_result)
+                     for (channel_id, _), embed_result in zip(targets, embed_results) if embed_result]
+            # Channels past the high-water mark hand items back; wait on just those channels and retry
+            while items:
+                items = await self.bot.batch_sender.queue_embeds(items)
+                if items:
+                    await self.bot.batch_sender.drain({channel_id for channel_id, _, _ in items})
+        except Exception as e:
+            logger.error(f"Failed to queue log event embeds: {e}")
 
-        # Player events - output based on significance (connections and disconnections)
-        if event_type in ['player_world_connect', 'player_world_spawn', 'player_online_status', 'player_session_start',
-                         'player_queue_disconnect', 'player_disconnect_cleanup', 'player_session_end', 
-                         'player_beacon_disconnect', 'player_network_disconnect', 'player_accepted_from', 
-                         'player_connection_cleanup', 'player_beacon_join']:
-            return True
+    async def _build_event_payload(self, guild_id: int, server_id: str, event_data: Dict[str, Any]) -> Optional[tuple]:
+        """Resolve the channel and build the embed for an event: (channel_id, embed, file) or None"""
+        try:
+            channel_id = await self._resolve_event_channel(guild_id, event_data)
+            if not channel_id:
+                return None
 
-        # Queue events - output for visibility into queue activity
-        if event_type in ['player_queue_accepted', 'player_queue_timeout', 'player_queue_failed', 'player_auth_failed']:
-            return True
+            # Create event-specific embed using EmbedFactory with file attachment
+            embed_result = await self._create_event_embed_via_factory(event_data)
+            if not embed_result:
+                return None
 
-        return False
+            embed, file = embed_result
+            return channel_id, embed, file
 
-    async def send_log_event_embed(self, guild_id: int, server_id: str, event_data: Dict[str, Any]):
-        """Send log event embed to appropriate channel using EmbedFactory"""
+        except Exception as e:
+            logger.error(f"Failed to build log event embed: {e}")
+            return None
+
+    async def _resolve_event_channel(self, guild_id: int, event_data: Dict[str, Any]) -> Optional[int]:
+        """Channel id an event's embed should be sent to, or None when it is not sent"""
         try:
             # Check if event should be output
             if not self.should_output_event(event_data):
                 logger.debug(f"Event {event_data['type']} suppressed per dispatch rules")
-                return
+                return None
 
             # Get guild configuration - FIX: Use proper database manager
             if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
                 logger.warning("Bot database not available for sending embeds")
-                return
+                return None
 
-            guild_config = await self.bot.db_manager.get_guild(guild_id)
+            guild_config = await self._get_guild_cached(guild_id)
             if not guild_config:
-                return
+                return None
 
             channels = guild_config.get('channels', {})
             event_type = event_data['type']
 
-            # Map event types to channel types
-            channel_mapping = {
-                # Player connection events
-                'player_world_connect': 'connections',
-                'player_world_spawn': 'connections', 
-                'player_online_status': 'connections',
-                'player_session_start': 'connections',
-                'player_queue_accepted': 'connections',
-                'player_accepted_from': 'connections',
-                'player_beacon_join': 'connections',
-                # Player disconnection events
-                'player_queue_disconnect': 'connections',
-                'player_disconnect_cleanup': 'connections',
-                'player_session_end': 'connections',
-                'player_beacon_disconnect': 'connections',
-                'player_network_disconnect': 'connections',
-                'player_connection_cleanup': 'connections',
-                'player_queue_timeout': 'connections',
-                'player_queue_failed': 'connections',
-                'player_auth_failed': 'connections',
-                # Game events
-                'mission_ready': 'events',
-                'airdrop_flying': 'events',
-                'airdrop_switched': 'events',
-                'helicrash_initial': 'events',
-                'helicrash_spawned': 'events',
-                'helicrash_switched': 'events',
-                'trader_spawn': 'events',
-                'trader_switched': 'events',
-                'trader_available': 'events',
-                'vehicle_spawn': 'events',
-                'vehicle_delete': 'events'
-            }
-
             # Get the appropriate channel for this event type
-            channel_type = channel_mapping.get(event_type, 'events')  # Default to events
+            channel_type = _EVENT_CHANNEL_TYPES.get(event_type, 'events')  # Default to events
             channel_id = channels.get(channel_type)
 
             # If specific channel not set, try fallback channels
@@ -1116,109 +1932,45 @@ class LogParser:
 
             if not channel_id:
                 logger.debug(f"No channel configured for event type '{event_type}' (needs '{channel_type}' channel)")
-                return
+                return None
 
             channel = self.bot.get_channel(channel_id)
             if not channel:
                 logger.warning(f"Channel {channel_id} not found for event type '{event_type}'")
-                return
+                return None
 
-            # Create event-specific embed using EmbedFactory with file attachment
-            embed_result = await self._create_event_embed_via_factory(event_data)
-            if embed_result:
-                if isinstance(embed_result, tuple):
-                    embed, file = embed_result
-                    await self.bot.batch_sender.queue_embed(
-                        channel_id=channel.id,
-                        embed=embed,
-                        file=file
-                    )
-                else:
-                    embed = embed_result
-                    await self.bot.batch_sender.queue_embed(
-                        channel_id=channel.id,
-                        embed=embed
-                    )
-                logger.debug(f"Queued {event_type} embed for {channel_type} channel: {channel.name}")
+            logger.debug(f"Routing {event_type} embed to {channel_type} channel: {channel.name}")
+            return channel.id
 
         except Exception as e:
-            logger.error(f"Failed to send log event embed: {e}")
+            logger.error(f"Failed to resolve log event channel: {e}")
+            return None
 
-    async def _create_event_embed_via_factory(self, event_data: Dict[str, Any]):
-        """Create styled embed for log event using EmbedFactory"""
+    def _event_embed_request(self, event_data: Dict[str, Any]) -> Optional[tuple]:
+        """(factory embed type, data) for an event, or None when it has no embed"""
         try:
-            from bot.utils.embed_factory import EmbedFactory
-
-            event_type = event_data['type']
-            timestamp = event_data['timestamp']
-
-            # Map event types to EmbedFactory keys and create appropriate embeds
-            if event_type == 'player_world_connect':
-                embed_data = {
-                    'connection_id': event_data.get('connection_id', 'Unknown'),
-                    'server_id': event_data.get('server_id', 'Unknown'),
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('player_connection', embed_data)
-
-            elif event_type == 'player_queue_disconnect':
-                embed_data = {
-                    'connection_id': event_data.get('connection_id', 'Unknown'),
-                    'server_id': event_data.get('server_id', 'Unknown'),
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('player_disconnection', embed_data)
-
-            elif event_type == 'mission_ready':
-                mission_name = event_data.get('normalized_name', 'Unknown Mission')
-                embed_data = {
-                    'mission_name': mission_name,
-                    'state': 'READY',
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('mission_event', embed_data)
+            spec = _EMBED_BUILDERS.get(event_data['type'])
+            if spec is None:
+                return None
 
-            elif event_type in ['airdrop_flying', 'airdrop_switched']:
-                embed_data = {
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('airdrop_event', embed_data)
+            factory_key, build = spec
+            return factory_key, build(event_data)
 
-            elif event_type in ['helicrash_initial', 'helicrash_spawned', 'helicrash_switched']:
-                embed_data = {
-                    'location': event_data.get('location', 'Unknown'),
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('helicrash_event', embed_data)
+        except Exception as e:
+            logger.error(f"Failed to prepare event embed data: {e}")
+            return None
 
-            elif event_type in ['trader_spawn', 'trader_switched', 'trader_available']:
-                embed_data = {
-                    'location': event_data.get('location', 'Unknown'),
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('trader_event', embed_data)
-
-            elif event_type == 'vehicle_spawn':
-                vehicle_type = event_data.get('vehicle_type', 'Military Vehicle')
-                embed_data = {
-                    'vehicle_type': vehicle_type,
-                    'action': 'spawn',
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('vehicle_event', embed_data)
-
-            elif event_type == 'vehicle_delete':
-                vehicle_type = event_data.get('vehicle_type', 'Military Vehicle')
-                embed_data = {
-                    'vehicle_type': vehicle_type,
-                    'action': 'delete',
-                    'timestamp': timestamp
-                }
-                return await EmbedFactory.build('vehicle_event', embed_data)
+    async def _create_event_embed_via_factory(self, event_data: Dict[str, Any]):
+        """Create styled embed for log event using EmbedFactory"""
+        try:
+            from bot.utils.embed_factory import EmbedFactory
 
-            else:
+            request = self._event_embed_request(event_data)
+            if request is None:
                 return None
 
+            return EmbedFactory.build(*request)
+
         except Exception as e:
             logger.error(f"Failed to create event embed via factory: {e}")
             return None
@@ -1244,110 +1996,193 @@ class LogParser:
         """Parse logs from SFTP server"""
         try:
             host = server_config.get('host', server_config.get('hostname'))
-            port = server_config.get('port', 22)
             username = server_config.get('username')
             password = server_config.get('password')
-            server_id = str(server_config.get('_id', 'unknown'))
+            server_id = sys.intern(str(server_config.get('_id', 'unknown')))
 
             if not all([host, username, password]):
                 logger.warning(f"Missing SFTP credentials for server {server_id}")
                 return
 
-            # Create SSH connection
-            async with asyncssh.connect(
-                host, port=port, username=username, password=password,
-                known_hosts=None, server_host_key_algs=['ssh-rsa', 'rsa-sha2-256', 'rsa-sha2-512']
-            ) as conn:
+            # Borrow a channel on the pooled connection for this login rather than paying
+            # an SSH handshake every polling tick
+            acquired = await self._acquire_sftp({**server_config, 'host': host})
+            if not acquired:
+                return
+            pool_key, sftp = acquired
+            broken = False
 
-                async with conn.start_sftp_client() as sftp:
-                    # Get log files
-                    log_path = f"./{host}_{server_id}/actual1/logs/"
+            try:
+                # Get log files
+                log_path = f"./{host}_{server_id}/actual1/logs/"
 
-                    try:
-                        files = await sftp.glob(f"{log_path}**/*.log")
+                try:
+                    # One directory walk returns each entry's attributes with its name,
+                    # so no per-file STAT round trip is needed
+                    files = await self._list_sftp_log_files(sftp, log_path)
 
-                        # Get current time with timezone awareness
-                        current_time = datetime.now(timezone.utc)
+                    # Get current time with timezone awareness
+                    current_time = datetime.now(timezone.utc)
 
-                        for file_path in files:
-                            try:
-                                # Check file modification time
-                                stat = await sftp.stat(file_path)
-                                # Make file_mtime timezone-aware
-                                file_mtime = datetime.fromtimestamp(getattr(stat, 'st_mtime', datetime.now().timestamp()), tz=timezone.utc)
+                    # Stat and read files concurrently over the one SFTP session
+                    semaphore = asyncio.Semaphore(self.sftp_file_concurrency)
 
-                                # Only process recent files (last 24 hours)
-                                if (current_time - file_mtime).total_seconds() > 86400:
-                                    continue
+                    async def handle_file(file_path, attrs):
+                        async with semaphore:
+                            await self._parse_sftp_log_file(sftp, guild_id, server_id, file_path, attrs, current_time)
 
-                                # Read and parse file
-                                async with sftp.open(file_path, 'r') as f:
-                                    content = await f.read()
-                                    await self.process_log_content(guild_id, server_id, content)
+                    results = await asyncio.gather(*(handle_file(file_path, attrs) for file_path, attrs in files),
+                                                   return_exceptions=True)
+                    broken = any(isinstance(result, BaseException) and _is_broken_channel_error(result)
+                                 for result in results)
 
-                            except Exception as e:
-                                logger.error(f"Failed to process log file {file_path}: {e}")
-                                continue
+                    # Forget offsets of files that have since been rotated away or renamed
+                    server_key = self.get_server_status_key(guild_id, server_id)
+                    prefix = f"{server_key}:"
+                    listed = {prefix + file_path for file_path, _ in files}
+                    stale = [key for key in self.file_states if key.startswith(prefix) and key not in listed]
+                    for file_key in stale:
+                        del self.file_states[file_key]
+                    if stale:
+                        self._queue_state_save(server_key)
 
-                    except Exception as e:
-                        logger.warning(f"No log files found at {log_path}: {e}")
+                except Exception as e:
+                    broken = _is_broken_channel_error(e)
+                    logger.warning(f"No log files found at {log_path}: {e}")
+            finally:
+                self._release_sftp(pool_key, sftp, broken=broken)
 
         except Exception as e:
             logger.error(f"Failed SFTP log parsing: {e}")
 
+    async def _list_sftp_log_files(self, sftp, directory: str) -> List[tuple]:
+        """Recursively list (path, attrs) for *.log files using the attributes from the directory listing"""
+        files = []
+        async for entry in sftp.scandir(directory):
+            if entry.filename in ('.', '..'):
+                continue
+            path = f"{directory.rstrip('/')}/{entry.filename}"
+            if entry.attrs.type == asyncssh.FILEXFER_TYPE_DIRECTORY:
+                files.extend(await self._list_sftp_log_files(sftp, path))
+            elif entry.filename.endswith('.log'):
+                files.append((path, entry.attrs))
+        return files
+
+    async def _parse_sftp_log_file(self, sftp, guild_id: int, server_id: str, file_path: str, stat,
+                                   current_time: datetime):
+        """Parse one recent log file from an open SFTP session, given its listing attributes"""
+        try:
+            # Check file modification time (SFTP attributes expose mtime/size)
+            # Make file_mtime timezone-aware
+            file_mtime = datetime.fromtimestamp(stat.mtime or datetime.now().timestamp(), tz=timezone.utc)
+
+            # Only process recent files (last 24 hours)
+            if (current_time - file_mtime).total_seconds() > 86400:
+                return
+
+            # Stat-gate: nothing appended since the bytes we already processed
+            server_key = self.get_server_status_key(guild_id, server_id)
+            file_key = f"{server_key}:{file_path}"
+            file_size = stat.size or 0
+            position = self.file_states.get(file_key, {}).get('last_position', 0)
+            if file_size == position:
+                return
+            if file_size < position:
+                logger.info(f"File reset detected for {file_path}: size {position} -> {file_size}")
+                position = 0
+
+            # Stream the new bytes in fixed-size chunks, parsing complete lines as
+            # they arrive so memory stays bounded by the chunk size
+            async with sftp.open(file_path, 'rb') as f:
+                # Start one byte early so the rotation check rides on the first read
+                check_offset = position > 0
+                await f.seek(position - 1 if check_offset else 0)
+                tail = b''
+                while True:
+                    chunk = await f.read(self.sftp_stream_chunk_size)
+                    if not chunk:
+                        break
+                    if check_offset:
+                        check_offset = False
+                        if chunk[:1] != b'\n':
+                            # Byte before our offset is no longer a line break: the file was
+                            # replaced by one at least as large - re-read it from the start
+                            logger.info(f"File reset detected for {file_path}, starting from beginning")
+                            position = 0
+                            await f.seek(0)
+                            continue
+                        chunk = chunk[1:]
+                    data = tail + chunk
+                    cut = data.rfind(b'\n') + 1
+                    tail = data[cut:]
+                    if cut:
+                        await self._process_log_bytes(guild_id, server_id, data[:cut])
+                        position += cut
+                        # Saved per chunk so a read failing later on does not re-send these events;
+                        # a trailing partial line is left for the next poll
+                        self.file_states[file_key] = {
+                            'file_size': file_size,
+                            'last_position': position,
+                            'file_mtime': stat.mtime or 0,
+                            'last_updated': datetime.now(timezone.utc).isoformat()
+                        }
+                        self._queue_state_save(server_key)
+
+        except Exception as e:
+            logger.error(f"Failed to process log file {file_path}: {e}")
+            if _is_broken_channel_error(e):
+                raise  # Lets parse_sftp_logs close the channel instead of pooling it
+
     async def parse_dev_logs(self, guild_id: int, server_config: Dict[str, Any]):
         """Parse logs in development mode from local files"""
         try:
-            server_id = str(server_config.get('_id', 'dev_server'))
+            server_id = sys.intern(str(server_config.get('_id', 'dev_server')))
 
-            # Get log content from dev files
-            log_content = await self.get_dev_log_content()
+            # Get log content from dev files as raw bytes - the byte length is the file size
+            log_content = await self.get_dev_log_content(raw=True)
 
             if not log_content:
                 logger.warning(f"No dev log content found for server {server_id}")
                 return
 
-            lines = log_content.splitlines()
-            total_lines = len(lines)
+            total_lines = _count_lines(log_content)
 
             # Track position for incremental parsing using persistent state
-            server_key = f"{guild_id}_{server_id}"
+            server_key = self.get_server_status_key(guild_id, server_id)
 
             # Check if file has been reset using persistent tracking
-            file_size = len(log_content.encode('utf-8'))  # Estimate file size
-            file_was_reset = self._detect_file_reset(server_key, file_size, lines)
+            file_size = len(log_content)
+            file_was_reset = self._detect_file_reset(server_key, log_content, total_lines)
 
             if file_was_reset:
                 logger.info(f"Dev file reset detected for {server_key}, starting from beginning")
-                last_position = 0
+                byte_offset = 0
             else:
-                # Get last processed line count from persistent state
+                # Resume from the byte offset of the last complete line processed
                 stored_state = self.file_states.get(server_key, {})
-                last_position = stored_state.get('line_count', 0)
+                byte_offset = stored_state.get('last_position') or stored_state.get('file_size', 0)
 
                 # Validate that our stored position is still valid
-                if last_position > total_lines:
-                    logger.warning(f"Stored position {last_position} exceeds file size {total_lines}, resetting")
-                    last_position = 0
-
-            # Process new lines only
-            new_lines = lines[last_position:]
+                if byte_offset > file_size:
+                    logger.warning(f"Stored offset {byte_offset} exceeds file size {file_size}, resetting")
+                    byte_offset = 0
+                elif byte_offset and log_content[byte_offset - 1] != 0x0A:
+                    # Offset from an older state is mid-line - resume at the next line start
+                    byte_offset = log_content.find(b'\n', byte_offset) + 1 or file_size
+
+            # Only complete lines are scanned; a partial final line waits for the next tick
+            end_offset = log_content.rfind(b'\n') + 1
             new_events = 0
-
-            for line in new_lines:
-                status_server_key = self.get_server_status_key(guild_id, server_id)
-                event_data = await self.parse_log_line(line, status_server_key, guild_id)
-                if event_data:
-                    # Process player tracking events
-                    await self.process_log_event(guild_id, server_id, event_data)
-                    # Send embed
-                    await self.send_log_event_embed(guild_id, server_id, event_data)
-                    new_events += 1
+            if end_offset > byte_offset:
+                scanned = await self._scan_in_worker(log_content[byte_offset:end_offset])
+                new_events = await self._dispatch_scanned(guild_id, server_id, scanned)
+                byte_offset = end_offset
 
             # Update file state with current information
-            if lines:
-                last_line_content = lines[-1] if lines else ""
-                await self._update_file_state(server_key, file_size, total_lines, last_line_content)
+            if total_lines:
+                last_line_content = _last_line(log_content).decode('utf-8', errors='ignore')
+                await self._update_file_state(server_key, file_size, total_lines, last_line_content,
+                                              last_position=byte_offset)
 
             # Update legacy position tracking for compatibility
             self.last_log_position[server_key] = total_lines
@@ -1361,13 +2196,13 @@ class LogParser:
     async def parse_server_logs(self, guild_id: int, server_config: Dict[str, Any]):
         """Parse logs for a single server (PREMIUM ONLY) with enhanced event detection"""
         try:
-            server_id = str(server_config.get('_id', 'unknown'))
+            server_id = sys.intern(str(server_config.get('_id', 'unknown')))
 
             logger.info(f"Parsing logs for premium server {server_id} in guild {guild_id}")
 
-            # Get log content
+            # Get log content as raw bytes - only lines that look like events get decoded
             if self.bot.dev_mode:
-                log_content = await self.get_dev_log_content()
+                log_content = await self.get_dev_log_content(raw=True)
             else:
                 log_content = await self.get_sftp_log_content(server_config)
 
@@ -1379,8 +2214,20 @@ class LogParser:
                 logger.warning(f"Log content is empty for server {server_id}")
                 return
 
-            lines = log_content.splitlines()
-            total_lines = len(lines)
+            server_key = self.get_server_status_key(guild_id, server_id)
+
+            # Dev mode re-reads the whole file: same length and same tail as the buffer parsed
+            # last tick means nothing new. SFTP content is only the new bytes, so it is never skipped
+            content_signature = None
+            if self.bot.dev_mode:
+                content_signature = (len(log_content), hashlib.blake2b(log_content[-4096:], digest_size=8).digest())
+                if self.file_states.get(server_key, {}).get('sig') == content_signature:
+                    logger.debug(f"Log content unchanged for server {server_id}, skipping parse")
+                    return
+
+            # Count lines and take the last one without materialising a list of every line
+            total_lines = _count_lines(log_content)
+            last_line = _last_line(log_content).decode('utf-8', errors='ignore')
 
             # COLD START DETECTION - Large file threshold (more than 1000 lines indicates cold start)
             is_cold_start = total_lines > 1000
@@ -1388,84 +2235,52 @@ class LogParser:
             if is_cold_start:
                 logger.info(f"🧊 COLD START detected for server {server_id}: {total_lines} lines - Using IntelligentLogParser for comprehensive processing")
 
-                # Use the existing IntelligentLogParser for cold start scenarios
-                # Create a temporary log file for the intelligent parser
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as temp_file:
-                    temp_file.write(log_content)
-                    temp_file_path = temp_file.name
-
+                # Use the existing IntelligentLogParser for cold start scenarios, handing it
+                # the buffer in memory rather than via a temporary file; large buffers are
+                # split and keyword-screened in the process pool
                 try:
-                    # Use IntelligentLogParser which has built-in cold start optimization
-                    result = await self.intelligent_parser.parse_log_file(temp_file_path, guild_id, server_id)
-                    logger.info(f"🧊 COLD START completed via IntelligentLogParser: {result.get('events_processed', 0)} events processed")
-                    new_events = result.get('events_processed', 0)
-                    processed_lines = result.get('lines_analyzed', total_lines)
-                    
-                    # After cold start processing, update file state and ensure connection tracking is current
-                    server_key = self.get_server_status_key(guild_id, server_id)
-                    content_size = len(log_content.encode('utf-8'))
-                    await self._update_file_state(server_key, content_size, total_lines, lines[-1] if lines else "")
-                    
-                    # Ensure voice channels are updated with current player counts from cold start
-                    # Initialize server tracking first, then update counts
-                    self.connection_parser.initialize_server_tracking(server_key)
-                    await self.connection_parser._update_counts(server_key)
-                    
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(temp_file_path)
-                    except:
-                        pass
+                    pool = self._get_parse_pool(log_content)
+                except Exception as e:
+                    logger.warning(f"Process pool unavailable for cold start, splitting in a thread: {e}")
+                    pool = None
+                result = await self.intelligent_parser.parse_log_content(log_content, guild_id, server_id,
+                                                                         executor=pool)
+                logger.info(f"🧊 COLD START completed via IntelligentLogParser: {result.get('events_processed', 0)} events processed")
+                new_events = result.get('events_processed', 0)
+                processed_lines = result.get('lines_analyzed', total_lines)
+
+                # After cold start processing, update file state and ensure connection tracking is current
+                content_size = len(log_content)
+                await self._update_file_state(server_key, content_size, total_lines, last_line)
+
+                # Ensure voice channels are updated with current player counts from cold start
+                # Initialize server tracking first, then update counts
+                self.connection_parser.initialize_server_tracking(server_key)
+                await self.connection_parser._update_counts(server_key)
 
             else:
                 logger.info(f"🔥 HOT START for server {server_id}: {total_lines} lines - Normal processing with embeds")
 
                 # Normal hot start processing
                 batch_size = 500
-                new_events = 0
-                processed_lines = 0
-                total_batches = (total_lines + batch_size - 1) // batch_size
-
-                logger.info(f"Starting enhanced batch processing: {total_lines} lines in {total_batches} batches")
-
-                for i in range(0, total_lines, batch_size):
-                    batch = lines[i:i + batch_size]
-                    batch_events = 0
-                    batch_number = (i // batch_size) + 1
+                processed_lines = total_lines
 
-                    logger.debug(f"Processing batch {batch_number}/{total_batches} (lines {i+1}-{min(i+batch_size, total_lines)})")
+                logger.info(f"Starting enhanced batch processing: {total_lines} lines")
 
-                    for line_num, line in enumerate(batch, start=i+1):
-                        processed_lines += 1
-                        server_key = self.get_server_status_key(guild_id, server_id)
-                        event_data = await self.parse_log_line(line, server_key, guild_id)
-                        if event_data:
-                            logger.debug(f"Line {line_num}: Parsed event: {event_data['type']}")
-
-                            # Process player tracking events
-                            await self.process_log_event(guild_id, server_id, event_data)
-
-                            # Send embed (with dispatch rule filtering)
-                            await self.send_log_event_embed(guild_id, server_id, event_data)
-
-                            new_events += 1
-                            batch_events += 1
-
-                    # Log progress for every batch
-                    logger.info(f"Batch {batch_number}/{total_batches}: Found {batch_events} events from {len(batch)} lines (total processed: {processed_lines}/{total_lines})")
-
-                    # Small delay between batches to prevent overwhelming Discord API
-                    if i + batch_size < total_lines:
-                        await asyncio.sleep(0.05)
+                # Regex work runs off the event loop over the whole buffer; state updates
+                # and embeds for the matched lines stay on it
+                scanned = await self._scan_in_worker(log_content)
+                new_events = await self._dispatch_scanned(guild_id, server_id, scanned, batch_size)
 
                 logger.info(f"🔥 HOT START completed for server {server_id}: {processed_lines} lines processed, {new_events} events found - All embeds sent")
                 
                 # Update file state after hot start processing
-                server_key = self.get_server_status_key(guild_id, server_id)
-                content_size = len(log_content.encode('utf-8'))
-                await self._update_file_state(server_key, content_size, total_lines, lines[-1] if lines else "")
+                content_size = len(log_content)
+                await self._update_file_state(server_key, content_size, total_lines, last_line)
+
+            if content_signature:
+                # Set after _update_file_state, which replaces the server's state dict
+                self.file_states[server_key]['sig'] = content_signature
 
         except Exception as e:
             logger.error(f"Failed to parse logs for server {server_config}: {e}")
@@ -1476,23 +2291,56 @@ class LogParser:
 
     async def process_log_content(self, guild_id: int, server_id: str, content: str):
         """Process log content and extract events"""
-        try:
-            lines = content.splitlines()
-            for line in lines:
-                if not line.strip():
-                    continue
+        await self._process_log_bytes(guild_id, server_id, content.encode('utf-8'))
 
-                server_key = self.get_server_status_key(guild_id, server_id)
-                event_data = await self.parse_log_line(line, server_key, guild_id)
-                if event_data:
-                    # Process player tracking events
-                    await self.process_log_event(guild_id, server_id, event_data)
-                    # Send embed
-                    await self.send_log_event_embed(guild_id, server_id, event_data)
+    async def _process_log_bytes(self, guild_id: int, server_id: str, data: bytes):
+        """Process a block of raw log bytes made of whole lines"""
+        try:
+            # One combined scan over the whole block; only matched lines reach the event loop
+            scanned = await self._scan_in_worker(data)
+            await self._dispatch_scanned(guild_id, server_id, scanned)
 
         except Exception as e:
             logger.error(f"Failed to process log content: {e}")
 
+    async def _dispatch_scanned(self, guild_id: int, server_id: str, scanned: List[tuple],
+                                batch_size: int = 500) -> int:
+        """Apply connection events, state updates and embeds for _scan_text results in log order"""
+        server_key = self.get_server_status_key(guild_id, server_id)
+        total_batches = (len(scanned) + batch_size - 1) // batch_size
+        new_events = 0
+        pending_embeds = []
+
+        for index, (connection_line, event_data) in enumerate(scanned, start=1):
+            if connection_line:
+                # One bad line is logged and skipped rather than aborting the rest of the batch
+                try:
+                    await self.connection_parser.parse_connection_event(connection_line, server_key, guild_id)
+                except Exception as e:
+                    logger.error(f"Failed to apply connection event for {server_key}: {e}")
+
+            if event_data:
+                logger.debug(f"Parsed event: {event_data['type']}")
+
+                # Process player tracking events
+                await self.process_log_event(guild_id, server_id, event_data)
+
+                # Embeds are built and queued per batch (with dispatch rule filtering)
+                if self.should_output_event(event_data):
+                    pending_embeds.append((guild_id, server_id, event_data))
+
+                new_events += 1
+
+            if index % batch_size == 0 or index == len(scanned):
+                await self._queue_event_payloads(pending_embeds)
+                pending_embeds = []
+
+            if index % batch_size == 0:
+                # Log progress for every batch
+                logger.info(f"Batch {index // batch_size}/{total_batches}: {new_events} events from {index}/{len(scanned)} matched lines")
+
+        return new_events
+
     def schedule_log_parser(self):
         """Schedule log parser to run every 180 seconds"""
         try:
@@ -1515,7 +2363,7 @@ class LogParser:
             timestamp = event_data['timestamp']
 
             # All player connection events are already handled by the intelligent connection parser
-            # in parse_log_line(), so we only need to handle non-player events here
+            # in parse_log_line() / _dispatch_scanned(), so we only need to handle non-player events here
 
             if event_type == 'server_max_players':
                 max_players = event_data.get('max_players', 50)
@@ -1525,6 +2373,7 @@ class LogParser:
             if hasattr(self, '_last_cleanup'):
                 if (timestamp - self._last_cleanup).total_seconds() > 3600:  # Cleanup every hour
                     self.connection_parser.cleanup_old_states(24)  # 24 hour cleanup
+                    await self.cleanup_old_lifecycle_data(24)
                     self._last_cleanup = timestamp
             else:
                 self._last_cleanup = timestamp
@@ -1535,8 +2384,9 @@ class LogParser:
     async def _load_persistent_state(self):
         """Load persistent file state from database"""
         try:
-            # Get all guilds that have configured servers
-            guilds_cursor = self.bot.db_manager.guilds.find({})
+            # Every saved log parser state in one query, then match them to configured servers
+            saved_states = await self.bot.db_manager.get_parser_states_by_type("log_parser")
+            guilds_cursor = self.bot.db_manager.guilds.find({}, {'guild_id': 1, 'servers.server_id': 1})
             total_states = 0
             
             async for guild in guilds_cursor:
@@ -1546,17 +2396,22 @@ class LogParser:
                 for server in servers:
                     server_id = server.get('server_id')
                     if server_id:
-                        # Get parser state for this server
-                        state = await self.bot.db_manager.get_parser_state(guild_id, server_id, "log_parser")
+                        state = saved_states.get((guild_id, str(server_id)))
                         if state:
                             server_key = f"{guild_id}_{server_id}"
                             self.file_states[server_key] = {
                                 'file_size': state.get('file_size', 0),
                                 'last_position': state.get('last_position', 0),
                                 'last_line': state.get('last_line', ''),
-                                'file_hash': state.get('file_hash', ''),
+                                'line_count': state.get('line_count', 0),
+                                'file_mtime': state.get('file_mtime', 0),
                                 'last_processed': state.get('last_processed')
                             }
+                            for file_state in state.get('sftp_files', []):
+                                self.file_states[f"{server_key}:{file_state['path']}"] = {
+                                    'last_position': file_state.get('last_position', 0),
+                                    'file_mtime': file_state.get('file_mtime', 0)
+                                }
                             total_states += 1
             
             logger.info(f"Loaded persistent state for {total_states} servers from database")
@@ -1565,53 +2420,86 @@ class LogParser:
             self.file_states = {}
 
     async def _save_persistent_state(self):
-        """Save persistent file state to database"""
+        """Save persistent file state to database in a single bulk write"""
         try:
             # Get all guilds to map server keys properly
-            guilds_cursor = self.bot.db_manager.guilds.find({})
-            
+            guilds_cursor = self.bot.db_manager.guilds.find({}, {'guild_id': 1, 'servers.server_id': 1})
+            states = []
+
+            # Per-file SFTP offsets ("server_key:path") are saved with their server as a list,
+            # since file paths are not safe as MongoDB field names
+            sftp_files: Dict[str, List[Dict[str, Any]]] = {}
+            for state_key, state_data in self.file_states.items():
+                server_key, separator, file_path = state_key.partition(':')
+                if separator:
+                    sftp_files.setdefault(server_key, []).append({
+                        'path': file_path,
+                        'last_position': state_data.get('last_position', 0),
+                        'file_mtime': state_data.get('file_mtime', 0)
+                    })
+
             async for guild in guilds_cursor:
                 guild_id = guild.get('guild_id')
                 servers = guild.get('servers', [])
-                
+
                 for server in servers:
                     server_id = str(server.get('server_id', ''))
                     server_key = self.get_server_status_key(guild_id, server_id)
-                    
-                    if server_key in self.file_states:
-                        state_data = self.file_states[server_key]
-                        
-                        # Save state to database
-                        await self.bot.db_manager.save_parser_state(
-                            guild_id=guild_id,
-                            server_id=server_id,
-                            state_data={
-                                'file_size': state_data.get('file_size', 0),
-                                'last_position': state_data.get('last_position', 0),
-                                'last_line': state_data.get('last_line', ''),
-                                'file_hash': state_data.get('file_hash', ''),
-                                'last_processed': state_data.get('last_processed')
-                            },
-                            parser_type="log_parser"
-                        )
-            
-            logger.debug("Saved persistent state to database")
+
+                    if server_key in self.file_states or server_key in sftp_files:
+                        state_data = self.file_states.get(server_key, {})
+                        states.append((guild_id, server_id, {
+                            'file_size': state_data.get('file_size', 0),
+                            'last_position': state_data.get('last_position', 0),
+                            'last_line': state_data.get('last_line', ''),
+                            'line_count': state_data.get('line_count', 0),
+                            'file_mtime': state_data.get('file_mtime', 0),
+                            'last_processed': state_data.get('last_processed'),
+                            'sftp_files': sftp_files.get(server_key, [])
+                        }))
+
+            await self.bot.db_manager.bulk_save_parser_states(states, parser_type="log_parser")
+            logger.debug(f"Saved persistent state for {len(states)} servers to database")
         except Exception as e:
             logger.error(f"Failed to save persistent state to database: {e}")
 
-    async def _update_file_state(self, server_key: str, file_size: int, line_count: int, last_line_content: str):
+    async def _update_file_state(self, server_key: str, file_size: int, line_count: int, last_line_content: str,
+                                 last_position: int = 0, file_mtime: int = 0):
         """Update file state tracking"""
         self.file_states[server_key] = {
             'file_size': file_size,
             'line_count': line_count,
             'last_line': last_line_content,
+            'last_position': last_position,
+            'file_mtime': file_mtime,
             'last_updated': datetime.now(timezone.utc).isoformat()
         }
-        # Save state periodically (every 10 updates to avoid excessive I/O)
-        if len(self.file_states) % 10 == 0:
-            await self._save_persistent_state()
+        self._queue_state_save(server_key)
 
-    def _detect_file_reset(self, server_key: str, current_size: int, current_lines: List[str]) -> bool:
+    def _queue_state_save(self, server_key: str):
+        """Ask the background writer to persist file states"""
+        # Persistence happens on the background writer, off the read path
+        try:
+            self._state_queue.put_nowait(server_key)
+        except asyncio.QueueFull:
+            pass  # A save is already pending and will include this update
+
+    async def _state_writer_loop(self):
+        """Background task saving file states, one database pass per burst of updates"""
+        while True:
+            try:
+                await self._state_queue.get()
+                # Let the rest of a polling cycle's updates arrive, then drain them together
+                await asyncio.sleep(self._state_write_delay)
+                while not self._state_queue.empty():
+                    self._state_queue.get_nowait()
+                await self._save_persistent_state()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Failed to write file state: {e}")
+
+    def _detect_file_reset(self, server_key: str, raw_bytes: bytes, current_line_count: int) -> bool:
         """Detect if file has been reset/rotated based on size and content"""
         if server_key not in self.file_states:
             logger.info(f"No previous state for {server_key}, treating as first run")
@@ -1621,8 +2509,7 @@ class LogParser:
         stored_size = stored_state.get('file_size', 0)
         stored_line_count = stored_state.get('line_count', 0)
         stored_last_line = stored_state.get('last_line', '')
-
-        current_line_count = len(current_lines)
+        current_size = len(raw_bytes)
         
         # Only consider it a reset if file is dramatically smaller (90% reduction)
         if stored_size > 0 and current_size < stored_size * 0.1:
@@ -1635,9 +2522,9 @@ class LogParser:
             return True
 
         # More lenient last line check - only reset if file is much smaller AND last line missing
-        if (stored_last_line and current_lines and 
+        if (stored_last_line and raw_bytes and
             current_size < stored_size * 0.8 and  # File is 20% smaller
-            stored_last_line not in current_lines[-min(50, len(current_lines))]):  # Check last 50 lines
+            stored_last_line.encode('utf-8') not in raw_bytes[-8192:]):  # Search the tail of the buffer
             logger.info(f"File reset detected for {server_key}: file smaller and last line not found")
             return True
 
@@ -1677,6 +2564,9 @@ class LogParser:
             guilds_cursor = self.bot.db_manager.guilds.find({})
             total_servers_processed = 0
 
+            # Group servers by SFTP login so each host's pooled connection is reused
+            # serially, while different hosts are processed concurrently
+            host_groups: Dict[Any, List[tuple]] = {}
             async for guild_doc in guilds_cursor:
                 guild_id = guild_doc['guild_id']
                 servers = guild_doc.get('servers', [])
@@ -1686,20 +2576,40 @@ class LogParser:
                 logger.info(f"Found {len(servers)} servers for guild {guild_id}")
 
                 for server in servers:
-                    server_name = server.get('name', 'Unknown')
-                    server_id = str(server.get('_id', 'unknown'))
-                    try:
-                        logger.info(f"Processing logs for server: {server_name} (ID: {server_id})")
+                    group_key = self._get_sftp_pool_key(server) or (guild_id, str(server.get('_id', 'unknown')))
+                    host_groups.setdefault(group_key, []).append((guild_id, server))
+
+            semaphore = asyncio.Semaphore(self.max_concurrent_hosts)
 
-                        await self.parse_server_logs(guild_id, server)
+            async def process_host_group(group: List[tuple]) -> int:
+                processed = 0
+                async with semaphore:
+                    for guild_id, server in group:
+                        server_name = server.get('name', 'Unknown')
+                        server_id = str(server.get('_id', 'unknown'))
+                        try:
+                            logger.info(f"Processing logs for server: {server_name} (ID: {server_id})")
+
+                            await self.parse_server_logs(guild_id, server)
+
+                            processed += 1
+                            logger.info(f"Successfully processed logs for server: {server_name}")
 
-                        total_servers_processed += 1
-                        logger.info(f"Successfully processed logs for server: {server_name}")
+                        except Exception as server_error:
+                            logger.error(f"Failed to process server {server_name}: {server_error}")
+                            import traceback
+                            logger.error(f"Server error traceback: {traceback.format_exc()}")
+                return processed
 
-                    except Exception as server_error:
-                        logger.error(f"Failed to process server {server_name}: {server_error}")
-                        import traceback
-                        logger.error(f"Server error traceback: {traceback.format_exc()}")
+            results = await asyncio.gather(
+                *(process_host_group(group) for group in host_groups.values()),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Host group processing failed: {result}")
+                else:
+                    total_servers_processed += result
 
             # Save persistent state after processing all servers
             await self._save_persistent_state()
@@ -1718,8 +2628,15 @@ class LogParser:
                 logger.error(f"Failed to save state during cleanup: {save_error}")
 
     async def shutdown(self):
-        """Graceful shutdown - save persistent state"""
+        """Graceful shutdown - flush pending wallet events and save persistent state"""
         try:
+            self._wallet_flush_task.cancel()
+            self._sftp_reaper_task.cancel()
+            self._vc_flush_task.cancel()
+            self._state_writer_task.cancel()
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            await self._flush_wallet_events()
             await self._save_persistent_state()
             logger.info("Log parser shutdown complete - state saved")
         except Exception as e:
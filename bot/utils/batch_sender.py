@@ -23,6 +23,7 @@ class BatchSender:
         self.batch_size = 10  # Send up to 10 embeds per batch
         self.batch_interval = 2.0  # Wait 2 seconds between batches
         self.max_queue_size = 100  # Maximum messages per channel queue
+        self.high_water_mark = 80  # Queue depth at which bulk producers should wait for drain()
         self.processing_channels: set = set()  # Track channels being processed
         
     async def queue_embed(self, channel_id: int, embed: discord.Embed, file: discord.File = None, content: str = None):
@@ -48,6 +49,61 @@ class BatchSender:
         except Exception as e:
             logger.error(f"Failed to queue embed for channel {channel_id}: {e}")
 
+    async def queue_embeds(self, items: List[tuple]) -> List[tuple]:
+        """
+        Queue many (channel_id, embed, file) items at once, starting each channel's processor once.
+        A channel stops taking items at the high-water mark; the items not queued are returned
+        in order so the caller can drain() those channels and queue them again.
+        """
+        queued_at = datetime.now(timezone.utc)
+        touched_channels = set()
+        remaining = []
+        index = 0
+
+        try:
+            for index, item in enumerate(items):
+                channel_id, embed, file = item
+                if len(self.message_queues[channel_id]) >= self.high_water_mark:
+                    remaining.append(item)
+                    continue
+
+                self.message_queues[channel_id].append({
+                    'embed': embed,
+                    'file': file,
+                    'content': None,
+                    'timestamp': queued_at
+                })
+                touched_channels.add(channel_id)
+
+            return remaining
+
+        except Exception as e:
+            # Hand back everything after the failing item so the caller requeues it; the failing
+            # item itself is dropped, otherwise it would fail the same way on every retry
+            logger.error(f"Failed to queue embeds: {e}")
+            return remaining + list(items[index + 1:])
+
+        finally:
+            # Items already queued are sent even when a later one failed
+            for channel_id in touched_channels:
+                if channel_id not in self.processing_channels:
+                    asyncio.create_task(self._process_channel_queue(channel_id))
+
+    async def drain(self, channel_ids):
+        """Wait until none of the given channels is queued past the high-water mark"""
+        while True:
+            backed_up = [channel_id for channel_id in channel_ids
+                         if len(self.message_queues[channel_id]) >= self.high_water_mark]
+            if not backed_up:
+                return
+
+            # Restart a processor that has stopped; a duplicate start returns immediately
+            for channel_id in backed_up:
+                if channel_id not in self.processing_channels:
+                    asyncio.create_task(self._process_channel_queue(channel_id))
+
+            await asyncio.sleep(self.batch_interval)
+
     async def _process_channel_queue(self, channel_id: int):
         """Process the message queue for a specific channel"""
         if channel_id in self.processing_channels:
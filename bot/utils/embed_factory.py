@@ -4,12 +4,123 @@ Centralized embed creation with consistent theming and styling
 """
 
 import discord
+import io
+import itertools
 import random
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from pathlib import Path
-from zoneinfo import ZoneInfo
 import asyncio
+from dataclasses import dataclass, field
+from functools import partialmethod
+from types import MappingProxyType
+
+def _read_assets(directory: Path) -> Dict[str, bytes]:
+    """Blocking read of every file in the assets directory, run via asyncio.to_thread"""
+    return {path.name: path.read_bytes() for path in directory.iterdir() if path.is_file()}
+
+
+_UTC = timezone.utc
+_FOOTER = "Powered by Discord.gg/EmeraldServers"  # Standard footer on every factory embed
+_ASSETS_DIR = Path('./assets')
+_ATTACH_PREFIX = 'attachment://'
+_ATTACH_LEN = len(_ATTACH_PREFIX)  # Asset filename = url[_ATTACH_LEN:], no replace() scan
+
+
+def _utc_now(data: Dict[str, Any]) -> datetime:
+    """Embed timestamp: the batch-wide '_now' set by build_batch, else the current UTC time"""
+    return data.get('_now') or datetime.now(_UTC)
+
+
+# Field value formatters, bound once instead of re-parsing an f-string spec per value
+_MONEY = "${:,}".format
+_MONEY_POS = "+${:,}".format
+_MONEY_NEG = "-${:,}".format
+_INT = "{:,}".format
+_DIST = "{:,} m".format
+
+
+def _signed_money(value: int) -> str:
+    """Net result: +$1,500 for a gain, -$250 for a loss or break-even"""
+    return (_MONEY_POS if value > 0 else _MONEY_NEG)(abs(value))
+
+
+def _cycler(pool: Tuple[str, ...]) -> Optional[Callable[[], str]]:
+    """Picker cycling through a once-shuffled copy of pool: flavor text needs variety,
+    not a PRNG step per embed. None for an empty pool."""
+    if not pool:
+        return None
+    return itertools.cycle(random.sample(pool, len(pool))).__next__
+
+
+def _tagged_name(data: Dict[str, Any]) -> str:
+    """Player name with its [faction] tag when the player has one"""
+    name = data.get('player_name', 'Unknown')
+    faction = data.get('faction')
+    return f"{name} [{faction}]" if faction else f"{name}"
+
+
+# Vehicle action -> (title, description template, status); any action but spawn reads as a removal
+_VEHICLE_REMOVED = ("🔧 Vehicle Removed", "**{}** has been removed from service", "Removed")
+_VEHICLE_ACTIONS = MappingProxyType({
+    'spawn': ("🚗 Vehicle Deployed", "**{}** has been deployed to the field", "Deployed"),
+    'delete': _VEHICLE_REMOVED
+})
+
+
+def _vehicle_status(action: str) -> str:
+    """Vehicle embed status for a spawn / delete action"""
+    return _VEHICLE_ACTIONS.get(action, _VEHICLE_REMOVED)[2]
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSpec:
+    """One optional embed field: data key, field name, and how its value is rendered"""
+    key: Optional[str]
+    name: str
+    inline: bool = True
+    formatter: Callable[[Any], str] = str
+    default: Any = None    # Value used when the key is absent; None means skip the field.
+                           # With key=None the field is constant and always shows its default
+    truthy: bool = False   # Also skip falsy values ('' / 0), not just missing ones
+    # Constant (key=None) fields are rendered once here and reused by every build
+    rendered: Optional[Dict[str, Any]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'rendered', None if self.key is not None else {
+            'name': self.name, 'value': self.formatter(self.default), 'inline': self.inline
+        })
+
+
+@dataclass(frozen=True, slots=True)
+class EmbedTypeSpec:
+    """Styling for one embed type: color, default thumbnail URL, title and flavor text pools"""
+    color: int
+    thumbnail: str
+    title_pool: Tuple[str, ...] = ()
+    flavor_pool: Tuple[str, ...] = ()
+    title: Optional[str] = None                 # Static title, used instead of title_pool
+    fields: Tuple[FieldSpec, ...] = ()          # Fields for the table-driven builders
+    flavor_name: str = 'Combat Log'
+    event_time: bool = False                    # Stamp with data['timestamp'] (the log event time) when given
+    # Round-robin pickers over the pools, set in __post_init__
+    next_title: Optional[Callable[[], str]] = field(init=False, repr=False, compare=False)
+    next_flavor: Optional[Callable[[], str]] = field(init=False, repr=False, compare=False)
+    # Asset filename behind the default attachment:// thumbnail, set in __post_init__
+    thumbnail_file: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'next_title', _cycler(self.title_pool))
+        object.__setattr__(self, 'next_flavor', _cycler(self.flavor_pool))
+        object.__setattr__(self, 'thumbnail_file',
+                           self.thumbnail[_ATTACH_LEN:] if self.thumbnail.startswith(_ATTACH_PREFIX) else None)
+
+
+# Flavor-text picks come from a module-private generator, bound once, rather than
+# looking up the shared random module instance on every embed
+_choice = random.Random().choice
+
 
 class EmbedFactory:
     """
@@ -17,7 +128,7 @@ class EmbedFactory:
     """
 
     # Color schemes for different event types
-    COLORS = {
+    COLORS = MappingProxyType({
         'mission_ready': 0x2ECC71,     # Green
         'airdrop': 0xF39C12,           # Orange
         'helicrash': 0xC0392B,         # Red
@@ -40,10 +151,10 @@ class EmbedFactory:
         'admin': 0x64748b,
         'leaderboard': 0xFFD700,
         'trader': 0xFFD700
-    }
+    })
 
     # Thumbnail mappings for event types
-    THUMBNAILS = {
+    THUMBNAILS = MappingProxyType({
         'mission_ready': 'Mission.png',
         'airdrop': 'Airdrop.png',
         'helicrash': 'Helicrash.png',
@@ -54,124 +165,157 @@ class EmbedFactory:
         'leaderboard': 'Leaderboard.png',
         'trader': 'Trader.png',
         'default': 'main.png'
-    }
+    })
+
+    # Asset lookups memoized per filename
+    _THUMBNAIL_EXISTS: Dict[str, bool] = {}
+    _ATTACHMENT_URLS: Dict[str, str] = {}
+    _ASSET_BYTES: Dict[str, bytes] = {}
+    _ASSET_PATHS: Dict[str, Path] = {}
+    _THUMBNAIL_FILES: Dict[str, str] = {}  # attachment:// URL -> asset filename
+
+    # Killfeed text templates, formatted with % / concatenation on the hottest embed
+    _KILL_TEXT_TMPL = "**%s** (KDR: %s)\neliminated\n**%s** (KDR: %s)"
+    _FOOTER_PREFIX = "Server: Emerald EU | discord.gg/EmeraldServers | "
+    _footer_minute: Optional[int] = None  # Minute the cached footer time string was formatted for
+    _footer_time_str = ''
 
     # Militaristic message variations for different event types
-    MILITARY_MESSAGES = {
-        'mission_ready': [
+    MILITARY_MESSAGES = MappingProxyType({
+        'mission_ready': (
             "Tactical teams, move to positions! Mission zone is hot.",
             "All units converge on target area. Mission parameters confirmed.",
             "Operational zone secured. Commence tactical deployment.",
             "Strike team authorization granted. Proceed with caution.",
             "Combat zone established. All personnel maintain readiness."
-        ],
-        'airdrop': [
+        ),
+        'airdrop': (
             "Supply aircraft detected on approach. Valuable cargo incoming!",
             "High-priority supplies inbound. Secure the drop zone immediately.",
             "Air support deploying critical resources. Move to intercept.",
             "Supply drop confirmed. Multiple hostiles may converge on location.",
             "Logistics package incoming. Establish perimeter around landing zone."
-        ],
-        'helicrash': [
+        ),
+        'helicrash': (
             "Aircraft down! Crash site detected. High-value loot reported.",
             "Emergency beacon active. Wreckage contains valuable equipment.",
             "Helicopter eliminated. Salvage operations are a go.",
             "Aircraft debris located. Expect heavy resistance at crash site.",
             "Air asset compromised. Recovery teams deploy immediately."
-        ],
-        'player_join': [
+        ),
+        'player_join': (
             "Operative connecting to battlefield communications.",
             "New combatant entering the operation zone.",
             "Additional personnel joining tactical network.",
             "Reinforcement arriving at forward operating base.",
             "Field operative establishing secure connection."
-        ],
-        'player_leave': [
+        ),
+        'player_leave': (
             "Operative disconnecting from tactical network.",
             "Personnel departing from operation zone.",
             "Field agent ending mission participation.",
             "Combatant leaving battlefield communications.",
             "Tactical unit withdrawing from active duty."
-        ],
-        'vehicle_spawn': [
+        ),
+        'vehicle_spawn': (
             "Transportation asset deployed to the field.",
             "Vehicle unit now available for tactical operations.",
             "Mechanical support deployed to combat zone.",
             "Transport vehicle assigned to operational area.",
             "Mobile asset ready for field deployment."
-        ]
-    }
+        )
+    })
+
+    # create_embed's description flavor: one round-robin picker per message pool
+    _MESSAGE_PICKERS = MappingProxyType({
+        embed_type: _cycler(messages) for embed_type, messages in MILITARY_MESSAGES.items()
+    })
 
     # Tactical message variations
-    TACTICAL_MESSAGES = {
-        'trader': [
+    TACTICAL_MESSAGES = MappingProxyType({
+        'trader': (
             "Black market trader has arrived; re-arm and re-supply.",
             "Trading post established; secure the area for commerce.",
             "Merchant convoy spotted; exchange intel for resources.",
             "The market is open; opportunity knocks for those who dare.",
             "New deals on the horizon; approach the trader with caution."
-        ]
-    }
+        )
+    })
 
     # Title pools for different embed types
-    TITLE_POOLS = {
-        'killfeed': [
+    TITLE_POOLS = MappingProxyType({
+        'killfeed': (
             "Silhouette Erased",
             "Hostile Removed",
             "Contact Dismantled",
             "Kill Confirmed",
             "Eyes Off Target"
-        ],
-        'suicide': [
+        ),
+        'suicide': (
             "Self-Termination Logged",
             "Manual Override",
             "Exit Chosen"
-        ],
-        'fall': [
+        ),
+        'fall': (
             "Gravity Kill Logged",
             "Terminal Descent",
             "Cliffside Casualty"
-        ],
-        'bounty': [
+        ),
+        'bounty': (
             "Target Flagged",
             "HVT Logged",
             "Kill Contract Active"
-        ],
-        'mission_ready': [
+        ),
+        'mission_ready': (
             "Contract Activated",
             "Target Zone Marked",
             "Mission Greenlit"
-        ],
-        'vehicle_spawn': [
+        ),
+        'vehicle_spawn': (
             "Asset Deployed",
             "Logistics Confirmed"
-        ],
-        'player_join': [
+        ),
+        'player_join': (
             "Connection Established",
             "New Arrival Detected"
-        ],
-        'player_leave': [
+        ),
+        'player_leave': (
             "Connection Lost",
             "Departure Recorded"
-        ],
-        'airdrop': [
+        ),
+        'airdrop': (
             "Supplies Incoming",
             "Package Deployed"
-        ],
-        'helicrash': [
+        ),
+        'helicrash': (
             "Crash Detected",
             "Wreckage Located"
-        ],
-        'trader': [
+        ),
+        'trader': (
             "Trading Post Open",
             "Merchant Sighted",
             "Market Deployed"
-        ]
-    }
+        )
+    })
+
+    # Upper-cased title pools, for builders that shout their titles
+    TITLE_POOLS_UPPER = MappingProxyType({
+        pool: tuple(title.upper() for title in titles) for pool, titles in TITLE_POOLS.items()
+    })
+
+    # Leaderboard title pools per stat type, built once instead of per get_leaderboard_title call
+    LEADERBOARD_TITLES = MappingProxyType({
+        'kills': ("Elite Eliminators", "Death Dealers", "Combat Champions"),
+        'deaths': ("Most Fallen", "Battlefield Casualties", "Frequent Respawners"),
+        'kdr': ("Kill/Death Masters", "Efficiency Legends", "Combat Elites"),
+        'distance': ("Long Range Snipers", "Distance Champions", "Precision Masters"),
+        'weapons': ("Arsenal Analysis", "Weapon Mastery", "Combat Tools"),
+        'factions': ("Faction Dominance", "Alliance Power", "Faction Rankings")
+    })
 
     # Combat log message pools
-    COMBAT_LOGS = {
-        'kill': [
+    COMBAT_LOGS = MappingProxyType({
+        'kill': (
             "Another shadow fades from the wasteland.",
             "The survivor count drops by one.",
             "Territory claimed through violence.",
@@ -180,56 +324,48 @@ class EmbedFactory:
             "Death arrives on schedule in Deadside.",
             "One less mouth to feed in this barren world.",
             "The food chain adjusts itself once more."
-        ],
-        'suicide': [
+        ),
+        'suicide': (
             "Sometimes the only escape is through the void.",
             "The wasteland claims another volunteer.",
             "Exit strategy: permanent.",
             "Final decision executed successfully.",
             "The burden of survival lifted by choice.",
             "Another soul releases itself from this hell."
-        ],
-        'fall': [
+        ),
+        'fall': (
             "Gravity shows no mercy in the wasteland.",
             "The ground always wins in the end.",
             "Physics delivers its final verdict.",
             "Another lesson in terminal velocity.",
             "The earth reclaims what fell from above.",
             "Descent complete. No survivors."
-        ],
-        'gambling': [
+        ),
+        'gambling': (
             "Fortune favors the desperate in Deadside.",
             "The house edge cuts deeper than any blade.",
             "Luck is just another scarce resource here.",
             "Survived the dealer. Survived the odds.",
             "In this wasteland, even chance is hostile.",
             "Risk and reward dance their eternal waltz."
-        ],
-        'bounty': [
+        ),
+        'bounty': (
             "A price on their head. A target on their back.",
             "The hunter becomes the hunted.",
             "Blood money flows through these lands.",
             "Marked for termination by popular demand.",
             "Contract issued. Payment pending delivery.",
             "The kill order has been authorized."
-        ]
-    }
+        )
+    })
 
     @staticmethod
-    async def get_leaderboard_title(stat_type: str) -> str:
+    def get_leaderboard_title(stat_type: str) -> str:
         """Get randomized themed title for leaderboard type"""
-        titles = {
-            'kills': ["Elite Eliminators", "Death Dealers", "Combat Champions"],
-            'deaths': ["Most Fallen", "Battlefield Casualties", "Frequent Respawners"],
-            'kdr': ["Kill/Death Masters", "Efficiency Legends", "Combat Elites"],
-            'distance': ["Long Range Snipers", "Distance Champions", "Precision Masters"],
-            'weapons': ["Arsenal Analysis", "Weapon Mastery", "Combat Tools"],
-            'factions': ["Faction Dominance", "Alliance Power", "Faction Rankings"]
-        }
-        return random.choice(titles.get(stat_type, ["Leaderboard"]))
+        return _choice(EmbedFactory.LEADERBOARD_TITLES.get(stat_type, ("Leaderboard",)))
 
     @staticmethod
-    async def get_leaderboard_thumbnail(stat_type: str) -> str:
+    def get_leaderboard_thumbnail(stat_type: str) -> str:
         """Get stat-specific thumbnail URL - all use Leaderboard.png"""
         thumbnails = {
             'kills': 'attachment://Leaderboard.png',
@@ -242,7 +378,7 @@ class EmbedFactory:
         return thumbnails.get(stat_type, 'attachment://Leaderboard.png')
 
     @staticmethod
-    async def build(embed_type: str, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
+    def build(embed_type: str, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
         """
         Build an embed of the specified type with provided data
 
@@ -253,105 +389,73 @@ class EmbedFactory:
         Returns:
             Tuple of (discord.Embed, discord.File or None)
         """
-        if embed_type == 'killfeed':
-            return EmbedFactory._build_killfeed(data)
-        elif embed_type == 'suicide':
-            return EmbedFactory._build_suicide(data)
-        elif embed_type == 'fall':
-            return EmbedFactory._build_fall(data)
-        elif embed_type == 'slots':
-            return EmbedFactory._build_slots(data)
-        elif embed_type == 'roulette':
-            return EmbedFactory._build_roulette(data)
-        elif embed_type == 'blackjack':
-            return EmbedFactory._build_blackjack(data)
-        elif embed_type == 'profile':
-            return EmbedFactory._build_profile(data)
-        elif embed_type == 'bounty':
-            return EmbedFactory._build_bounty(data)
-        elif embed_type == 'admin':
-            return EmbedFactory._build_admin(data)
-        elif embed_type == 'comparison':
-            return EmbedFactory._build_comparison(data)
-        elif embed_type == 'stats':
-            return EmbedFactory._build_stats(data)
-        elif embed_type == 'leaderboard':
-            # Get stat type from data for dynamic styling
-            stat_type = data.get('stat_type', 'kills')
-            style_variant = data.get('style_variant', stat_type)
-
-            # Use dynamic title generation
-            title = data.get('title') or await EmbedFactory.get_leaderboard_title(stat_type)
-
-            embed = discord.Embed(
-                title=title,
-                description=data.get('description', f'Top performers in {stat_type}'),
-                color=EmbedFactory.COLORS['leaderboard'],
-                timestamp=datetime.now(ZoneInfo('UTC'))
-            )
+        builder = _BUILDERS.get(embed_type)
+        if builder is None:
+            raise ValueError(f"Unknown embed type: {embed_type}")
+        return builder(data)
 
-            if 'rankings' in data:
-                embed.add_field(
-                    name="Rankings",
-                    value=data['rankings'][:1024],
-                    inline=False
-                )
+    @staticmethod
+    def build_batch(items: List[tuple]) -> List[tuple]:
+        """Build many (embed_type, data) embeds sharing one clock read for their timestamps"""
+        now = datetime.now(_UTC)
+        return [EmbedFactory.build(embed_type, {'_now': now, **data}) for embed_type, data in items]
+
+    @staticmethod
+    async def build_async(embed_type: str, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
+        """Awaitable wrapper around build for callers that still expect a coroutine"""
+        return EmbedFactory.build(embed_type, data)
+
+    @classmethod
+    def _build_leaderboard(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
+        """Build leaderboard embed with stat-specific title and thumbnail"""
+        # Get stat type from data for dynamic styling
+        stat_type = data.get('stat_type', 'kills')
+        style_variant = data.get('style_variant', stat_type)
+
+        # Use dynamic title generation
+        title = data.get('title') or cls.get_leaderboard_title(stat_type)
+
+        embed = discord.Embed(
+            title=title,
+            description=data.get('description', f'Top performers in {stat_type}'),
+            color=cls.COLORS['leaderboard'],
+            timestamp=_utc_now(data)
+        )
+
+        if 'rankings' in data:
+            embed.add_field(
+                name="Rankings",
+                value=data['rankings'][:1024],
+                inline=False
+            )
 
-            # Add stats summary if available
-            if data.get('total_kills') or data.get('total_deaths'):
-                stats_text = []
-                if data.get('total_kills'):
-                    stats_text.append(f"Total Kills: {data['total_kills']:,}")
-                if data.get('total_deaths'):
-                    stats_text.append(f"Total Deaths: {data['total_deaths']:,}")
-
-                if stats_text:
-                    embed.add_field(
-                        name="Server Statistics",
-                        value=" | ".join(stats_text),
-                        inline=False
-                    )
-
-            # Use dynamic thumbnail and create file attachment
-            thumbnail_url = data.get('thumbnail_url') or await EmbedFactory.get_leaderboard_thumbnail(stat_type)
-            embed.set_thumbnail(url=thumbnail_url)
-
-            # Create file attachment if thumbnail is an attachment URL
-            file_attachment = None
-            if thumbnail_url and thumbnail_url.startswith('attachment://'):
-                filename = thumbnail_url.replace('attachment://', '')
-                file_path = f'assets/{filename}'
-                try:
-                    file_attachment = discord.File(file_path, filename=filename)
-                except FileNotFoundError:
-                    pass
-
-            # Set consistent footer branding
-            embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-
-            return embed, file_attachment
-
-        # LOG PARSER EVENT EMBEDS
-        elif embed_type == 'player_connection':
-            return EmbedFactory._build_player_connection(data)
-        elif embed_type == 'player_disconnection':
-            return EmbedFactory._build_player_disconnection(data)
-        elif embed_type == 'player_join':
-            return EmbedFactory._build_player_connection(data)
-        elif embed_type == 'player_leave':
-            return EmbedFactory._build_player_disconnection(data)
-        elif embed_type == 'mission_event':
-            return EmbedFactory._build_mission_event(data)
-        elif embed_type == 'airdrop_event':
-            return EmbedFactory._build_airdrop_event(data)
-        elif embed_type == 'helicrash_event':
-            return EmbedFactory._build_helicrash_event(data)
-        elif embed_type == 'trader_event':
-            return EmbedFactory._build_trader_event(data)
-        elif embed_type == 'vehicle_event':
-            return EmbedFactory._build_vehicle_event(data)
+        # Add stats summary if available - at most two parts, so no list/join is needed
+        total_kills = data.get('total_kills')
+        total_deaths = data.get('total_deaths')
+        if total_kills and total_deaths:
+            stats_value = f"Total Kills: {total_kills:,} | Total Deaths: {total_deaths:,}"
+        elif total_kills:
+            stats_value = f"Total Kills: {total_kills:,}"
+        elif total_deaths:
+            stats_value = f"Total Deaths: {total_deaths:,}"
         else:
-            raise ValueError(f"Unknown embed type: {embed_type}")
+            stats_value = None
+
+        if stats_value:
+            embed.add_field(
+                name="Server Statistics",
+                value=stats_value,
+                inline=False
+            )
+
+        # Use dynamic thumbnail and create file attachment
+        thumbnail_url = data.get('thumbnail_url') or cls.get_leaderboard_thumbnail(stat_type)
+        file_attachment = cls._attach_thumbnail(embed, thumbnail_url)
+
+        # Set consistent footer branding
+        embed.set_footer(text=_FOOTER)
+
+        return embed, file_attachment
 
     @classmethod
     def create_embed(
@@ -392,18 +496,15 @@ class EmbedFactory:
             title=title or "Server Event",
             description=description,
             color=embed_color,
-            timestamp=timestamp or datetime.now(ZoneInfo('UTC'))
+            timestamp=timestamp or datetime.now(_UTC)
         )
 
         # Add randomized military description if enabled and available
-        if randomize_description and embed_type in cls.MILITARY_MESSAGES:
-            if not description:
-                description = random.choice(cls.MILITARY_MESSAGES[embed_type])
-                embed.description = description
-            else:
-                # Append random military flavor text
-                military_flavor = random.choice(cls.MILITARY_MESSAGES[embed_type])
-                embed.description = f"{description}\n\n*{military_flavor}*"
+        pick_message = cls._MESSAGE_PICKERS.get(embed_type) if randomize_description else None
+        if pick_message:
+            military_flavor = pick_message()
+            # Used as the description, or appended to a provided one as flavor text
+            embed.description = f"{description}\n\n*{military_flavor}*" if description else military_flavor
 
         # Add fields if provided
         if fields:
@@ -416,12 +517,11 @@ class EmbedFactory:
 
         # Set thumbnail
         thumbnail_file = thumbnail or cls.THUMBNAILS.get(embed_type, cls.THUMBNAILS['default'])
-        thumbnail_path = Path(f'./assets/{thumbnail_file}')
-        if thumbnail_path.exists():
-            embed.set_thumbnail(url=f"attachment://{thumbnail_file}")
+        if cls._thumb_exists(thumbnail_file):
+            embed.set_thumbnail(url=cls._attachment_url(thumbnail_file))
 
         # Set footer
-        footer = footer_text or "Powered by Discord.gg/EmeraldServers"
+        footer = footer_text or _FOOTER
         embed.set_footer(text=footer)
 
         return embed
@@ -464,13 +564,13 @@ class EmbedFactory:
         if event_type == 'join':
             embed_type = 'player_join'
             # Random title
-            title = random.choice(cls.TITLE_POOLS['player_join'])
+            title = _choice(cls.TITLE_POOLS['player_join'])
             description = f"Connection **{connection_info}** joined the server"
             color = cls.COLORS['player_join']
         else:
             embed_type = 'player_leave'
             # Random title
-            title = random.choice(cls.TITLE_POOLS['player_leave'])
+            title = _choice(cls.TITLE_POOLS['player_leave'])
             description = f"Connection **{connection_info}** left the server"
             color = cls.COLORS['player_leave']
 
@@ -549,14 +649,8 @@ class EmbedFactory:
     ) -> discord.Embed:
         """Create a specialized vehicle embed"""
 
-        if action == 'spawn':
-            title = "🚗 Vehicle Deployed"
-            description = f"**{vehicle_type}** has been deployed to the field"
-            status = "Deployed"
-        else:
-            title = "🔧 Vehicle Removed"
-            description = f"**{vehicle_type}** has been removed from service"
-            status = "Removed"
+        title, description, status = _VEHICLE_ACTIONS.get(action, _VEHICLE_REMOVED)
+        description = description.format(vehicle_type)
 
         fields = [
             {"name": "Vehicle Type", "value": vehicle_type, "inline": True},
@@ -575,87 +669,153 @@ class EmbedFactory:
         )
 
     @classmethod
-    def create_error_embed(
+    def _create_status_embed(
         cls,
-        error_message: str,
+        embed_type: str,
+        title: str,
+        prefix: str,
+        message: str,
         details: str = None,
         timestamp: datetime = None
     ) -> discord.Embed:
-        """Create a standardized error embed"""
+        """Create a standardized status embed: prefixed message plus optional details"""
 
-        description = f"❌ {error_message}"
+        description = f"{prefix}{message}"
         if details:
             description += f"\n\n**Details:** {details}"
 
         return cls.create_embed(
-            'error',
-            title="Error",
+            embed_type,
+            title=title,
             description=description,
             timestamp=timestamp,
             randomize_description=False
         )
 
+    # Standardized error / success / info embeds: (message, details=None, timestamp=None)
+    create_error_embed = partialmethod(_create_status_embed, 'error', 'Error', '❌ ')
+    create_success_embed = partialmethod(_create_status_embed, 'success', 'Success', '✅ ')
+    create_info_embed = partialmethod(_create_status_embed, 'info', 'Information', 'ℹ️ ')
+
     @classmethod
-    def create_success_embed(
-        cls,
-        success_message: str,
-        details: str = None,
-        timestamp: datetime = None
-    ) -> discord.Embed:
-        """Create a standardized success embed"""
+    def get_thumbnail_path(cls, embed_type: str) -> Optional[str]:
+        """Get the full path to a thumbnail file"""
+        thumbnail_file = cls.THUMBNAILS.get(embed_type, cls.THUMBNAILS['default'])
+        return str(cls._asset_path(thumbnail_file)) if cls._thumb_exists(thumbnail_file) else None
 
-        description = f"✅ {success_message}"
-        if details:
-            description += f"\n\n**Details:** {details}"
+    @classmethod
+    def _asset_path(cls, filename: str) -> Path:
+        """Path of an asset, constructed once per filename"""
+        path = cls._ASSET_PATHS.get(filename)
+        if path is None:
+            path = cls._ASSET_PATHS[filename] = _ASSETS_DIR / filename
+        return path
 
-        return cls.create_embed(
-            'success',
-            title="Success",
-            description=description,
-            timestamp=timestamp,
-            randomize_description=False
-        )
+    @classmethod
+    def _thumb_exists(cls, filename: str) -> bool:
+        """Whether ./assets/<filename> exists, checked once per file (assets are static at runtime)"""
+        exists = cls._THUMBNAIL_EXISTS.get(filename)
+        if exists is None:
+            exists = cls._THUMBNAIL_EXISTS[filename] = cls._asset_path(filename).exists()
+        return exists
 
     @classmethod
-    def create_info_embed(
-        cls,
-        info_message: str,
-        details: str = None,
-        timestamp: datetime = None
-    ) -> discord.Embed:
-        """Create a standardized info embed"""
+    async def prewarm(cls) -> int:
+        """Load every asset into memory off the event loop so embed builds never touch disk"""
+        assets = await asyncio.to_thread(_read_assets, _ASSETS_DIR)
+        cls._ASSET_BYTES.update(assets)
+        cls._THUMBNAIL_EXISTS.update(dict.fromkeys(assets, True))
+        # Required assets the directory lacks are known-missing from startup, never probed per embed
+        cls._THUMBNAIL_EXISTS.update(dict.fromkeys(REQUIRED_ASSETS.difference(assets), False))
+        # Every attachment:// URL the assets can serve, so thumbnail resolution never parses one
+        cls._THUMBNAIL_FILES.update({_ATTACH_PREFIX + name: name for name in assets})
+        return len(assets)
 
-        description = f"ℹ️ {info_message}"
-        if details:
-            description += f"\n\n**Details:** {details}"
+    @classmethod
+    def missing_assets(cls) -> List[str]:
+        """Required asset files found missing by prewarm (or a later lookup)"""
+        return sorted(name for name in REQUIRED_ASSETS if cls._THUMBNAIL_EXISTS.get(name) is False)
 
-        return cls.create_embed(
-            'info',
-            title="Information",
-            description=description,
-            timestamp=timestamp,
-            randomize_description=False
-        )
+    @classmethod
+    def _attach_thumbnail(cls, embed: discord.Embed, thumbnail_url: Optional[str]) -> Optional[discord.File]:
+        """Set the embed thumbnail and return the file attachment an attachment:// URL needs"""
+        embed.set_thumbnail(url=thumbnail_url)
+        return cls._thumbnail_file(thumbnail_url)
 
     @classmethod
-    def get_thumbnail_path(cls, embed_type: str) -> Optional[str]:
-        """Get the full path to a thumbnail file"""
-        thumbnail_file = cls.THUMBNAILS.get(embed_type, cls.THUMBNAILS['default'])
-        thumbnail_path = Path(f'./assets/{thumbnail_file}')
-        return str(thumbnail_path) if thumbnail_path.exists() else None
+    def _resolve_thumbnail(cls, embed: discord.Embed, data: Dict[str, Any], default: str) -> Optional[discord.File]:
+        """Attach the caller's thumbnail_url, or the builder's default, to a builder embed"""
+        return cls._attach_thumbnail(embed, data.get('thumbnail_url', default))
+
+    @classmethod
+    def _spec_thumbnail(cls, spec: EmbedTypeSpec, data: Dict[str, Any]) -> Tuple[Optional[str], Optional[discord.File]]:
+        """Thumbnail URL and file attachment for a spec builder. The common case, no
+        caller override, is an identity check against the spec default."""
+        thumbnail_url = data.get('thumbnail_url', spec.thumbnail)
+        if thumbnail_url is spec.thumbnail and spec.thumbnail_file:
+            return thumbnail_url, cls._make_file(spec.thumbnail_file)
+        return thumbnail_url, cls._thumbnail_file(thumbnail_url)
+
+    @classmethod
+    def _embed_from_payload(cls, spec: EmbedTypeSpec, data: Dict[str, Any],
+                            payload: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
+        """Add the spec thumbnail to a complete embed payload and build it with one from_dict.
+        Embed.from_dict keeps field values as given, so payload values must already be str."""
+        thumbnail_url, file_attachment = cls._spec_thumbnail(spec, data)
+        if thumbnail_url:
+            payload['thumbnail'] = {'url': thumbnail_url}
+        return discord.Embed.from_dict(payload), file_attachment
+
+    @classmethod
+    def _thumbnail_file(cls, thumbnail_url: Optional[str]) -> Optional[discord.File]:
+        """File attachment an attachment:// thumbnail URL refers to, None for other URLs"""
+        filename = cls._THUMBNAIL_FILES.get(thumbnail_url)
+        if filename is None:
+            if not (thumbnail_url and thumbnail_url.startswith(_ATTACH_PREFIX)):
+                return None
+            # Only attachment URLs are memoized: that vocabulary is the fixed asset set
+            filename = cls._THUMBNAIL_FILES[thumbnail_url] = thumbnail_url[_ATTACH_LEN:]
+        return cls._make_file(filename)
+
+    @classmethod
+    def _make_file(cls, filename: str) -> Optional[discord.File]:
+        """Fresh discord.File for an asset served from bytes read once, or None if it is missing"""
+        data = cls._ASSET_BYTES.get(filename)
+        if data is None:
+            # Missing assets are remembered by _thumb_exists, so a miss costs no
+            # syscall or exception after the first build that asks for it
+            if not cls._thumb_exists(filename):
+                return None
+            try:
+                data = cls._ASSET_BYTES[filename] = cls._asset_path(filename).read_bytes()
+            except OSError:
+                cls._THUMBNAIL_EXISTS[filename] = False
+                return None
+        return discord.File(io.BytesIO(data), filename=filename)
+
+    @classmethod
+    def _attachment_url(cls, filename: str) -> str:
+        """attachment:// URL for an asset, formatted once per file"""
+        url = cls._ATTACHMENT_URLS.get(filename)
+        if url is None:
+            url = cls._ATTACHMENT_URLS[filename] = _ATTACH_PREFIX + filename
+        return url
+
+    @classmethod
+    def _footer_time(cls) -> str:
+        """Local time for the killfeed footer; minute precision, so strftime runs once a minute"""
+        minute = int(time.time() // 60)
+        if minute != cls._footer_minute:
+            cls._footer_time_str = datetime.now().strftime("%m/%d/%Y %I:%M %p")
+            cls._footer_minute = minute
+        return cls._footer_time_str
 
     @classmethod
     def _build_killfeed(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
         """Build modern killfeed embed - clean aesthetic with themed title and right-aligned logo"""
+        spec = _SPECS['killfeed']
         # Restore themed titles from the title pool
-        title = random.choice(cls.TITLE_POOLS['killfeed']).upper()
-
-        # Create clean embed with themed title
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['killfeed'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
+        title = spec.next_title()
 
         # Main kill description - clean, bold format
         killer_name = data.get('killer_name', 'Unknown')
@@ -663,1154 +823,426 @@ class EmbedFactory:
         killer_kdr = data.get('killer_kdr', '0.00')
         victim_kdr = data.get('victim_kdr', '0.00')
 
-        # Primary kill info in description (like the screenshot)
-        kill_text = f"**{killer_name}** (KDR: {killer_kdr})\neliminated\n**{victim_name}** (KDR: {victim_kdr})"
-        embed.description = kill_text
-
         # Weapon and distance info - clean format
         weapon = data.get('weapon', 'Unknown')
         distance = data.get('distance', '0')
 
-        weapon_text = f"**Weapon:** {weapon}\n**From** {distance} Meters"
-        embed.add_field(name="", value=weapon_text, inline=False)
-
         # Combat log message - atmospheric flavor text
-        combat_msg = random.choice(cls.COMBAT_LOGS['kill'])
-        embed.add_field(name="", value=f"*{combat_msg}*", inline=False)
+        combat_msg = spec.next_flavor()
+
+        # Whole embed as one payload: a single from_dict instead of a chain of setters
+        payload = {
+            'title': title,
+            'color': spec.color,
+            'timestamp': _utc_now(data).isoformat(),
+            # Primary kill info in description (like the screenshot)
+            'description': cls._KILL_TEXT_TMPL % (killer_name, killer_kdr, victim_name, victim_kdr),
+            'fields': [
+                {'name': '', 'value': f"**Weapon:** {weapon}\n**From** {distance} Meters", 'inline': False},
+                {'name': '', 'value': f"*{combat_msg}*", 'inline': False}
+            ],
+            # Server info footer (like in the screenshot)
+            'footer': {'text': cls._FOOTER_PREFIX + cls._footer_time()}
+        }
 
         # Right-aligned logo as small thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Killfeed.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Server info footer (like in the screenshot)
-        timestamp_str = datetime.now().strftime("%m/%d/%Y %I:%M %p")
-        embed.set_footer(text=f"Server: Emerald EU | discord.gg/EmeraldServers | {timestamp_str}")
-
-        return embed, file_attachment
+        return cls._embed_from_payload(spec, data, payload)
 
     @classmethod
     def _build_suicide(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
         """Build suicide embed"""
-        title = random.choice(cls.TITLE_POOLS['suicide'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['suicide'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Subject
-        faction = f" [{data.get('faction')}]" if data.get('faction') else ""
-        embed.add_field(
-            name="Subject",
-            value=f"{data.get('player_name', 'Unknown')}{faction}",
-            inline=True
-        )
-
-        # Cause
-        cause = data.get('cause', 'Menu Suicide')
-        embed.add_field(
-            name="Cause",
-            value=cause,
-            inline=True
-        )
-
-        # Combat log
-        combat_log = random.choice(cls.COMBAT_LOGS['suicide'])
-        embed.add_field(
-            name="Combat Log",
-            value=combat_log,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://main.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-
-        return embed, file_attachment
+        spec = _SPECS['suicide']
+        payload = {
+            'title': spec.next_title(),
+            'color': spec.color,
+            'timestamp': _utc_now(data).isoformat(),
+            'fields': [
+                {'name': "Subject", 'value': _tagged_name(data), 'inline': True},
+                {'name': "Cause", 'value': str(data.get('cause', 'Menu Suicide')), 'inline': True},
+                {'name': "Combat Log", 'value': spec.next_flavor(), 'inline': False}
+            ],
+            'footer': {'text': _FOOTER}
+        }
+        return cls._embed_from_payload(spec, data, payload)
 
     @classmethod
     def _build_fall(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
         """Build fall damage embed"""
-        title = random.choice(cls.TITLE_POOLS['fall'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['fall'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Subject
-        faction = f" [{data.get('faction')}]" if data.get('faction') else ""
-        embed.add_field(
-            name="Subject",
-            value=f"{data.get('player_name', 'Unknown')}{faction}",
-            inline=True
-        )
-
-        # Combat log
-        combat_log = random.choice(cls.COMBAT_LOGS['fall'])
-        embed.add_field(
-            name="Combat Log",
-            value=combat_log,
-            inline=False
-        )
+        spec = _SPECS['fall']
+        payload = {
+            'title': spec.next_title(),
+            'color': spec.color,
+            'timestamp': _utc_now(data).isoformat(),
+            'fields': [
+                {'name': "Subject", 'value': _tagged_name(data), 'inline': True},
+                {'name': "Combat Log", 'value': spec.next_flavor(), 'inline': False}
+            ],
+            'footer': {'text': _FOOTER}
+        }
+        return cls._embed_from_payload(spec, data, payload)
 
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://main.png')
-        embed.set_thumbnail(url=thumbnail_url)
+    @classmethod
+    def _build_from_spec(cls, kind: str, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
+        """Build a table-driven embed: one field per FieldSpec whose value is present in data"""
+        spec = _SPECS[kind]
 
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
+        fields = []
+        for fs in spec.fields:
+            if fs.rendered is not None:
+                fields.append(fs.rendered)
+                continue
+            value = data.get(fs.key, fs.default)
+            if value is None or (fs.truthy and not value):
+                continue
+            fields.append({'name': fs.name, 'value': fs.formatter(value), 'inline': fs.inline})
+
+        # Flavor text, e.g. the gambling combat log
+        if spec.flavor_pool:
+            fields.append({'name': spec.flavor_name, 'value': spec.next_flavor(), 'inline': False})
+
+        # Whole embed as one payload, like the killfeed: one from_dict instead of an add_field per field
+        payload = {
+            'title': spec.title or spec.next_title(),
+            'color': spec.color,
+            'timestamp': ((spec.event_time and data.get('timestamp')) or _utc_now(data)).isoformat(),
+            'fields': fields,
+            'footer': {'text': _FOOTER}
+        }
 
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
+        return cls._embed_from_payload(spec, data, payload)
+
+    # Table-driven builders; their fields live in _SPECS below
+    _build_slots = partialmethod(_build_from_spec, 'slots')
+    _build_roulette = partialmethod(_build_from_spec, 'roulette')
+    _build_blackjack = partialmethod(_build_from_spec, 'blackjack')
+    _build_profile = partialmethod(_build_from_spec, 'profile')
+    _build_admin = partialmethod(_build_from_spec, 'admin')
+    _build_comparison = partialmethod(_build_from_spec, 'comparison')
+
+    # LOG PARSER EVENT EMBEDS - static fields are key=None FieldSpecs, so each event
+    # is one payload dict instead of a fresh Embed plus an add_field per field
+    _build_player_connection = partialmethod(_build_from_spec, 'player_connection')
+    _build_player_disconnection = partialmethod(_build_from_spec, 'player_disconnection')
+    _build_mission_event = partialmethod(_build_from_spec, 'mission_event')
+    _build_airdrop_event = partialmethod(_build_from_spec, 'airdrop_event')
+    _build_helicrash_event = partialmethod(_build_from_spec, 'helicrash_event')
+    _build_trader_event = partialmethod(_build_from_spec, 'trader_event')
+    _build_vehicle_event = partialmethod(_build_from_spec, 'vehicle_event')
 
-        return embed, file_attachment
+    @classmethod
+    def _build_bounty(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
+        """Build bounty embed"""
+        spec = _SPECS['bounty']
+        payload = {
+            'title': spec.next_title(),
+            'color': spec.color,
+            'timestamp': _utc_now(data).isoformat(),
+            'fields': [
+                {'name': "Target", 'value': _tagged_name(data), 'inline': True},
+                {'name': "Amount", 'value': _MONEY(data.get('amount', 'Unknown')), 'inline': True},
+                {'name': "Combat Log", 'value': spec.next_flavor(), 'inline': False}
+            ],
+            'footer': {'text': _FOOTER}
+        }
+        return cls._embed_from_payload(spec, data, payload)
 
     @classmethod
-    def _build_slots(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build slots gambling embed"""
+    def _build_stats(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
+        """Build comprehensive stats embed with all categories"""
         embed = discord.Embed(
-            title="🎰 Wasteland Slots",
-            color=cls.COLORS['slots'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
+            title=data.get('title', 'Player Statistics'),
+            description=data.get('description', 'Comprehensive combat statistics'),
+            color=cls.COLORS['profile'],
+            timestamp=_utc_now(data)
         )
 
-        # Handle slot display
-        if data.get('slot_display'):
+        # Player name
+        if (player_name := data.get('player_name')):
             embed.add_field(
-                name="Reels",
-                value=data['slot_display'],
-                inline=False
+                name="Operative",
+                value=player_name,
+                inline=True
             )
 
-        # Handle status
-        if data.get('status'):
+        # Server info
+        if (server_name := data.get('server_name')):
             embed.add_field(
-                name="Status",
-                value=data['status'],
-                inline=False
+                name="Theater",
+                value=server_name,
+                inline=True
             )
 
-        # Handle bet amount
-        if data.get('bet_amount'):
+        # Add spacer field for better layout
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+
+        # Core combat stats
+        if (kills := data.get('kills')) is not None:
             embed.add_field(
-                name="Bet",
-                value=f"${data['bet_amount']:,}",
+                name="Eliminations",
+                value=_INT(kills),
                 inline=True
             )
 
-        # Handle winnings
-        if data.get('winnings'):
+        if (deaths := data.get('deaths')) is not None:
             embed.add_field(
-                name="Winnings",
-                value=f"+${data['winnings']:,}",
+                name="Casualties",
+                value=_INT(deaths),
                 inline=True
             )
 
-        # Handle net result
-        if data.get('net_result') is not None:
-            if data['net_result'] > 0:
-                embed.add_field(
-                    name="Net Result",
-                    value=f"+${data['net_result']:,}",
-                    inline=True
-                )
-            else:
-                embed.add_field(
-                    name="Net Result",
-                    value=f"-${abs(data['net_result']):,}",
-                    inline=True
-                )
-
-        # Handle new balance
-        if data.get('new_balance') is not None:
+        if (kdr := data.get('kdr')) is not None:
             embed.add_field(
-                name="New Balance",
-                value=f"${data['new_balance']:,}",
+                name="Efficiency Ratio",
+                value=kdr,
                 inline=True
             )
 
-        # Combat log
-        combat_log = random.choice(cls.COMBAT_LOGS['gambling'])
-        embed.add_field(
-            name="Combat Log",
-            value=combat_log,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Gamble.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-
-        return embed, file_attachment
-
-    @classmethod
-    def _build_roulette(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build roulette gambling embed"""
-        embed = discord.Embed(
-            title="🎯 Deadside Roulette",
-            color=cls.COLORS['roulette'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Handle status
-        if data.get('status'):
+        # Additional stats
+        if (suicides := data.get('suicides')) is not None:
             embed.add_field(
-                name="Status",
-                value=data['status'],
-                inline=False
+                name="Self-Terminations",
+                value=_INT(suicides),
+                inline=True
             )
 
-        # Handle player choice
-        if data.get('player_choice'):
+        if (distance := data.get('best_distance')) is not None:
+            if distance >= 1000:
+                distance_str = f"{distance/1000:.1f}km"
+            else:
+                distance_str = f"{distance:.0f}m"
             embed.add_field(
-                name="Player Pick",
-                value=data['player_choice'],
+                name="Longest Kill",
+                value=distance_str,
                 inline=True
             )
 
-        # Handle result
-        if data.get('result'):
+        if (best_streak := data.get('best_streak')) is not None:
             embed.add_field(
-                name="Spin Result",
-                value=data['result'],
+                name="Best Streak",
+                value=f"{best_streak} kills",
                 inline=True
             )
 
-        # Handle bet amount
-        if data.get('bet_amount'):
+        # Weapon and rivalry stats
+        if (favorite_weapon := data.get('favorite_weapon')):
             embed.add_field(
-                name="Bet",
-                value=f"${data['bet_amount']:,}",
+                name="Preferred Weapon",
+                value=favorite_weapon,
                 inline=True
             )
 
-        # Handle winnings
-        if data.get('winnings'):
-            embed.add_field(                name="Winnings",
-                value=f"+${data['winnings']:,}",
+        if (rival := data.get('rival')):
+            rival_kills = data.get('rival_kills', 0)
+            embed.add_field(
+                name="Primary Rival",
+                value=f"{rival} ({rival_kills} kills)",
                 inline=True
             )
 
-        # Handle net result
-        if data.get('net_result') is not None:
-            if data['net_result'] > 0:
-                embed.add_field(
-                    name="Net Result",
-                    value=f"+${data['net_result']:,}",
-                    inline=True
-                )
-            else:
-                embed.add_field(
-                    name="Net Result",
-                    value=f"-${abs(data['net_result']):,}",
-                    inline=True
-                )
-
-        # Handle new balance
-        if data.get('new_balance') is not None:
+        if (nemesis := data.get('nemesis')):
+            nemesis_deaths = data.get('nemesis_deaths', 0)
             embed.add_field(
-                name="New Balance",
-                value=f"${data['new_balance']:,}",
+                name="Nemesis",
+                value=f"{nemesis} ({nemesis_deaths} deaths)",
                 inline=True
             )
 
-        # Combat log
-        combat_log = random.choice(cls.COMBAT_LOGS['gambling'])
+        # Combat effectiveness footer
+        combat_msg = _choice(cls.COMBAT_LOGS.get('kill', ('Statistics compiled from battlefield data.',)))
         embed.add_field(
-            name="Combat Log",
-            value=combat_log,
+            name="Combat Analysis",
+            value=f"*{combat_msg}*",
             inline=False
         )
 
         # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Gamble.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
+        file_attachment = cls._resolve_thumbnail(embed, data, 'attachment://main.png')
 
         # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
+        embed.set_footer(text=_FOOTER)
         return embed, file_attachment
 
-    @classmethod
-    def _build_blackjack(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build blackjack gambling embed"""
-        embed = discord.Embed(
-            title="🃏 Deadside Blackjack",
-            color=cls.COLORS['blackjack'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Handle status
-        if data.get('status'):
-            embed.add_field(
-                name="Status",
-                value=data['status'],
-                inline=False
-            )
-
-        # Handle player hand
-        if data.get('player_hand'):
-            embed.add_field(
-                name="Your Hand",
-                value=data['player_hand'],
-                inline=True
-            )
-
-        # Handle dealer hand
-        if data.get('dealer_hand'):
-            embed.add_field(
-                name="Dealer Hand",
-                value=data['dealer_hand'],
-                inline=True
-            )
-
-        # Handle bet amount
-        if data.get('bet_amount'):
-            embed.add_field(
-                name="Bet",
-                value=f"${data['bet_amount']:,}",
-                inline=True
-            )
-
-        # Handle winnings
-        if data.get('winnings'):
-            embed.add_field(
-                name="Winnings",
-                value=f"+${data['winnings']:,}",
-                inline=True
-            )
-
-        # Handle net result
-        if data.get('net_result') is not None:
-            if data['net_result'] > 0:
-                embed.add_field(
-                    name="Net Result",
-                    value=f"+${data['net_result']:,}",
-                    inline=True
-                )
-            else:
-                embed.add_field(
-                    name="Net Result",
-                    value=f"-${abs(data['net_result']):,}",
-                    inline=True
-                )
-
-        # Handle new balance
-        if data.get('new_balance') is not None:
-            embed.add_field(
-                name="New Balance",
-                value=f"${data['new_balance']:,}",
-                inline=True
-            )
-
-        # Combat log
-        combat_log = random.choice(cls.COMBAT_LOGS['gambling'])
-        embed.add_field(
-            name="Combat Log",
-            value=combat_log,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Gamble.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_profile(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build profile embed"""
-        embed = discord.Embed(
-            title="👤 Player Profile",
-            color=cls.COLORS['profile'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Player name
-        if data.get('player_name'):
-            embed.add_field(
-                name="Name",
-                value=data['player_name'],
-                inline=True
-            )
-
-        # Faction
-        if data.get('faction'):
-            embed.add_field(
-                name="Faction",
-                value=data['faction'],
-                inline=True
-            )
-
-        # Kills
-        if data.get('kills') is not None:
-            embed.add_field(
-                name="Kills",
-                value=f"{data['kills']:,}",
-                inline=True
-            )
-
-        # Deaths
-        if data.get('deaths') is not None:
-            embed.add_field(
-                name="Deaths",
-                value=f"{data['deaths']:,}",
-                inline=True
-            )
-
-        # KDR
-        if data.get('kdr') is not None:
-            embed.add_field(
-                name="KDR",
-                value=data['kdr'],
-                inline=True
-            )
-
-        # Distance
-        if data.get('distance') is not None:
-            embed.add_field(
-                name="Distance",
-                value=f"{data['distance']:,} m",
-                inline=True
-            )
-
-        # Playtime
-        if data.get('playtime'):
-            embed.add_field(
-                name="Playtime",
-                value=data['playtime'],
-                inline=True
-            )
-
-        # Bounty
-        if data.get('bounty') is not None:
-            embed.add_field(
-                name="Bounty",
-                value=f"${data['bounty']:,}",
-                inline=True
-            )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://main.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_bounty(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build bounty embed"""
-        title = random.choice(cls.TITLE_POOLS['bounty'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['bounty'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Target
-        faction = f" [{data.get('faction')}]" if data.get('faction') else ""
-        embed.add_field(
-            name="Target",
-            value=f"{data.get('player_name', 'Unknown')}{faction}",
-            inline=True
-        )
-
-        # Amount
-        amount = data.get('amount', 'Unknown')
-        embed.add_field(
-            name="Amount",
-            value=f"${amount:,}",
-            inline=True
-        )
-
-        # Combat log
-        combat_log = random.choice(cls.COMBAT_LOGS['bounty'])
-        embed.add_field(
-            name="Combat Log",
-            value=combat_log,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Bounty.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_admin(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build admin command embed"""
-        embed = discord.Embed(
-            title="⚙️ Admin Command",
-            color=cls.COLORS['admin'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Admin
-        admin = data.get('admin', 'Unknown')
-        embed.add_field(
-            name="Admin",
-            value=admin,
-            inline=True
-        )
-
-        # Command
-        command = data.get('command', 'Unknown')
-        embed.add_field(
-            name="Command",
-            value=command,
-            inline=True
-        )
-
-        # Target
-        target = data.get('target', 'Unknown')
-        embed.add_field(
-            name="Target",
-            value=target,
-            inline=True
-        )
-
-        # Details
-        details = data.get('details', 'None')
-        embed.add_field(
-            name="Details",
-            value=details,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://main.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_stats(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build comprehensive stats embed with all categories"""
-        embed = discord.Embed(
-            title=data.get('title', 'Player Statistics'),
-            description=data.get('description', 'Comprehensive combat statistics'),
-            color=cls.COLORS['profile'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Player name
-        if data.get('player_name'):
-            embed.add_field(
-                name="Operative",
-                value=data['player_name'],
-                inline=True
-            )
-
-        # Server info
-        if data.get('server_name'):
-            embed.add_field(
-                name="Theater",
-                value=data['server_name'],
-                inline=True
-            )
-
-        # Add spacer field for better layout
-        embed.add_field(name="\u200b", value="\u200b", inline=True)
-
-        # Core combat stats
-        if data.get('kills') is not None:
-            embed.add_field(
-                name="Eliminations",
-                value=f"{data['kills']:,}",
-                inline=True
-            )
-
-        if data.get('deaths') is not None:
-            embed.add_field(
-                name="Casualties",
-                value=f"{data['deaths']:,}",
-                inline=True
-            )
-
-        if data.get('kdr') is not None:
-            embed.add_field(
-                name="Efficiency Ratio",
-                value=data['kdr'],
-                inline=True
-            )
-
-        # Additional stats
-        if data.get('suicides') is not None:
-            embed.add_field(
-                name="Self-Terminations",
-                value=f"{data['suicides']:,}",
-                inline=True
-            )
-
-        if data.get('best_distance') is not None:
-            distance = data['best_distance']
-            if distance >= 1000:
-                distance_str = f"{distance/1000:.1f}km"
-            else:
-                distance_str = f"{distance:.0f}m"
-            embed.add_field(
-                name="Longest Kill",
-                value=distance_str,
-                inline=True
-            )
-
-        if data.get('best_streak') is not None:
-            embed.add_field(
-                name="Best Streak",
-                value=f"{data['best_streak']} kills",
-                inline=True
-            )
-
-        # Weapon and rivalry stats
-        if data.get('favorite_weapon'):
-            embed.add_field(
-                name="Preferred Weapon",
-                value=data['favorite_weapon'],
-                inline=True
-            )
-
-        if data.get('rival'):
-            rival_kills = data.get('rival_kills', 0)
-            embed.add_field(
-                name="Primary Rival",
-                value=f"{data['rival']} ({rival_kills} kills)",
-                inline=True
-            )
-
-        if data.get('nemesis'):
-            nemesis_deaths = data.get('nemesis_deaths', 0)
-            embed.add_field(
-                name="Nemesis",
-                value=f"{data['nemesis']} ({nemesis_deaths} deaths)",
-                inline=True
-            )
-
-        # Combat effectiveness footer
-        combat_msg = random.choice(cls.COMBAT_LOGS.get('kill', ['Statistics compiled from battlefield data.']))
-        embed.add_field(
-            name="Combat Analysis",
-            value=f"*{combat_msg}*",
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://main.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_comparison(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build comparison embed"""
-        embed = discord.Embed(
-            title="📊 Stat Comparison",
-            color=cls.COLORS['leaderboard'],
-            timestamp=datetime.now(ZoneInfo('UTC'))
-        )
-
-        # Player 1
-        player1 = data.get('player1', 'Unknown')
-        embed.add_field(
-            name="Player 1",
-            value=player1,
-            inline=True
-        )
-
-        # Player 2
-        player2 = data.get('player2', 'Unknown')
-        embed.add_field(
-            name="Player 2",
-            value=player2,
-            inline=True
-        )
-
-        # Stat
-        stat = data.get('stat', 'Kills')
-        embed.add_field(
-            name="Stat",
-            value=stat,
-            inline=True
-        )
-
-        # Value 1
-        value1 = data.get('value1', 'Unknown')
-        embed.add_field(
-            name="Value 1",
-            value=value1,
-            inline=True
-        )
-
-        # Value 2
-        value2 = data.get('value2', 'Unknown')
-        embed.add_field(
-            name="Value 2",
-            value=value2,
-            inline=True
-        )
-
-        # Winner
-        winner = data.get('winner', 'Unknown')
-        embed.add_field(
-            name="Winner",
-            value=winner,
-            inline=True
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Leaderboard.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        # Footer
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_player_connection(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build player connection embed"""
-        title = random.choice(cls.TITLE_POOLS['player_join'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['player_join'],
-            timestamp=data.get('timestamp') or datetime.now(ZoneInfo('UTC'))
-        )
-
-        connection_id = data.get('connection_id', 'Unknown')
-        embed.add_field(
-            name="Connection",
-            value=connection_id,
-            inline=True
-        )
-
-        # Military message
-        military_msg = random.choice(cls.MILITARY_MESSAGES['player_join'])
-        embed.add_field(
-            name="Status",
-            value=military_msg,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Connections.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_player_disconnection(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build player disconnection embed"""
-        title = random.choice(cls.TITLE_POOLS['player_leave'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['player_leave'],
-            timestamp=data.get('timestamp') or datetime.now(ZoneInfo('UTC'))
-        )
-
-        connection_id = data.get('connection_id', 'Unknown')
-        embed.add_field(
-            name="Connection",
-            value=connection_id,
-            inline=True
-        )
-
-        # Military message
-        military_msg = random.choice(cls.MILITARY_MESSAGES['player_leave'])
-        embed.add_field(
-            name="Status",
-            value=military_msg,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Connections.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_mission_event(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build mission event embed"""
-        title = random.choice(cls.TITLE_POOLS['mission_ready'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['mission_ready'],
-            timestamp=data.get('timestamp') or datetime.now(ZoneInfo('UTC'))
-        )
-
-        mission_name = data.get('mission_name', 'Unknown Mission')
-        state = data.get('state', 'READY')
-
-        embed.add_field(
-            name="Mission Zone",
-            value=mission_name,
-            inline=True
-        )
-
-        embed.add_field(
-            name="Status",
-            value=state.title(),
-            inline=True
-        )
-
-        # Military message
-        military_msg = random.choice(cls.MILITARY_MESSAGES['mission_ready'])
-        embed.add_field(
-            name="Tactical Update",
-            value=military_msg,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Mission.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_airdrop_event(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build airdrop event embed"""
-        title = random.choice(cls.TITLE_POOLS['airdrop'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['airdrop'],
-            timestamp=data.get('timestamp') or datetime.now(ZoneInfo('UTC'))
-        )
-
-        embed.add_field(
-            name="Status",
-            value="Incoming",
-            inline=True
-        )
-
-        embed.add_field(
-            name="Priority",
-            value="HIGH",
-            inline=True
-        )
-
-        # Military message
-        military_msg = random.choice(cls.MILITARY_MESSAGES['airdrop'])
-        embed.add_field(
-            name="Intelligence Report",
-            value=military_msg,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Airdrop.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_helicrash_event(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build helicopter crash event embed"""
-        title = random.choice(cls.TITLE_POOLS['helicrash'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['helicrash'],
-            timestamp=data.get('timestamp') or datetime.now(ZoneInfo('UTC'))
-        )
-
-        location = data.get('location', 'Unknown')
-        embed.add_field(
-            name="Crash Site",
-            value=location,
-            inline=True
-        )
-
-        embed.add_field(
-            name="Threat Level",
-            value="EXTREME",
-            inline=True
-        )
-
-        # Military message
-        military_msg = random.choice(cls.MILITARY_MESSAGES['helicrash'])
-        embed.add_field(
-            name="Operational Alert",
-            value=military_msg,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Helicrash.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod
-    def _build_trader_event(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build trader event embed"""
-        title = random.choice(cls.TITLE_POOLS['trader'])
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['trader'],
-            timestamp=data.get('timestamp') or datetime.now(ZoneInfo('UTC'))
-        )
-
-        location = data.get('location', 'Unknown')
-        embed.add_field(
-            name="Trading Post",
-            value=location,
-            inline=True
-        )
-
-        embed.add_field(
-            name="Status",
-            value="Open",
-            inline=True
-        )
-
-        # Tactical message
-        tactical_msg = random.choice(cls.TACTICAL_MESSAGES['trader'])
-        embed.add_field(
-            name="Market Update",
-            value=tactical_msg,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Trader.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
-
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
-
-    @classmethod  
-    def _build_vehicle_event(cls, data: Dict[str, Any]) -> tuple[discord.Embed, Optional[discord.File]]:
-        """Build vehicle event embed"""
-        action = data.get('action', 'spawn')
-        title = random.choice(cls.TITLE_POOLS['vehicle_spawn'])
-
-        embed = discord.Embed(
-            title=title,
-            color=cls.COLORS['vehicle_spawn'],
-            timestamp=data.get('timestamp') or datetime.now(ZoneInfo('UTC'))
-        )
-
-        vehicle_type = data.get('vehicle_type', 'Military Vehicle')
-        embed.add_field(
-            name="Vehicle Type",
-            value=vehicle_type,
-            inline=True
-        )
-
-        status = "Deployed" if action == 'spawn' else "Removed"
-        embed.add_field(
-            name="Status",
-            value=status,
-            inline=True
-        )
-
-        # Military message
-        military_msg = random.choice(cls.MILITARY_MESSAGES['vehicle_spawn'])
-        embed.add_field(
-            name="Logistics Update",
-            value=military_msg,
-            inline=False
-        )
-
-        # Thumbnail
-        thumbnail_url = data.get('thumbnail_url', 'attachment://Vehicle.png')
-        embed.set_thumbnail(url=thumbnail_url)
-
-        # Create file attachment
-        file_attachment = None
-        if thumbnail_url and thumbnail_url.startswith('attachment://'):
-            filename = thumbnail_url.replace('attachment://', '')
-            file_path = f'assets/{filename}'
-            try:
-                file_attachment = discord.File(file_path, filename=filename)
-            except FileNotFoundError:
-                pass
 
-        embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-        return embed, file_attachment
\ No newline at end of file
+# embed_type -> builder, one hash lookup per build instead of an if/elif chain.
+# Built after the class body so the bound classmethods exist; read-only view.
+_BUILDERS = MappingProxyType({
+    'killfeed': EmbedFactory._build_killfeed,
+    'suicide': EmbedFactory._build_suicide,
+    'fall': EmbedFactory._build_fall,
+    'slots': EmbedFactory._build_slots,
+    'roulette': EmbedFactory._build_roulette,
+    'blackjack': EmbedFactory._build_blackjack,
+    'profile': EmbedFactory._build_profile,
+    'bounty': EmbedFactory._build_bounty,
+    'admin': EmbedFactory._build_admin,
+    'comparison': EmbedFactory._build_comparison,
+    'stats': EmbedFactory._build_stats,
+    'leaderboard': EmbedFactory._build_leaderboard,
+    # LOG PARSER EVENT EMBEDS
+    'player_connection': EmbedFactory._build_player_connection,
+    'player_disconnection': EmbedFactory._build_player_disconnection,
+    'player_join': EmbedFactory._build_player_connection,
+    'player_leave': EmbedFactory._build_player_disconnection,
+    'mission_event': EmbedFactory._build_mission_event,
+    'airdrop_event': EmbedFactory._build_airdrop_event,
+    'helicrash_event': EmbedFactory._build_helicrash_event,
+    'trader_event': EmbedFactory._build_trader_event,
+    'vehicle_event': EmbedFactory._build_vehicle_event
+})
+
+# Bet / payout / balance fields shared by the slots, roulette and blackjack embeds
+_WAGER_FIELDS = (
+    FieldSpec('bet_amount', "Bet", formatter=_MONEY, truthy=True),
+    FieldSpec('winnings', "Winnings", formatter=_MONEY_POS, truthy=True),
+    FieldSpec('net_result', "Net Result", formatter=_signed_money),
+    FieldSpec('new_balance', "New Balance", formatter=_MONEY),
+)
+
+# Builder key -> styling bundle, so each builder resolves its constants with one lookup
+_SPECS = MappingProxyType({
+    'killfeed': EmbedTypeSpec(
+        EmbedFactory.COLORS['killfeed'], 'attachment://Killfeed.png',
+        EmbedFactory.TITLE_POOLS_UPPER['killfeed'], EmbedFactory.COMBAT_LOGS['kill']
+    ),
+    'suicide': EmbedTypeSpec(
+        EmbedFactory.COLORS['suicide'], 'attachment://main.png',
+        EmbedFactory.TITLE_POOLS['suicide'], EmbedFactory.COMBAT_LOGS['suicide']
+    ),
+    'fall': EmbedTypeSpec(
+        EmbedFactory.COLORS['fall'], 'attachment://main.png',
+        EmbedFactory.TITLE_POOLS['fall'], EmbedFactory.COMBAT_LOGS['fall']
+    ),
+    'bounty': EmbedTypeSpec(
+        EmbedFactory.COLORS['bounty'], 'attachment://Bounty.png',
+        EmbedFactory.TITLE_POOLS['bounty'], EmbedFactory.COMBAT_LOGS['bounty']
+    ),
+    'player_connection': EmbedTypeSpec(
+        EmbedFactory.COLORS['player_join'], 'attachment://Connections.png',
+        EmbedFactory.TITLE_POOLS['player_join'], EmbedFactory.MILITARY_MESSAGES['player_join'],
+        fields=(FieldSpec('connection_id', "Connection", default='Unknown'),),
+        flavor_name="Status", event_time=True
+    ),
+    'player_disconnection': EmbedTypeSpec(
+        EmbedFactory.COLORS['player_leave'], 'attachment://Connections.png',
+        EmbedFactory.TITLE_POOLS['player_leave'], EmbedFactory.MILITARY_MESSAGES['player_leave'],
+        fields=(FieldSpec('connection_id', "Connection", default='Unknown'),),
+        flavor_name="Status", event_time=True
+    ),
+    'mission_event': EmbedTypeSpec(
+        EmbedFactory.COLORS['mission_ready'], 'attachment://Mission.png',
+        EmbedFactory.TITLE_POOLS['mission_ready'], EmbedFactory.MILITARY_MESSAGES['mission_ready'],
+        fields=(
+            FieldSpec('mission_name', "Mission Zone", default='Unknown Mission'),
+            FieldSpec('state', "Status", formatter=str.title, default='READY'),
+        ),
+        flavor_name="Tactical Update", event_time=True
+    ),
+    'airdrop_event': EmbedTypeSpec(
+        EmbedFactory.COLORS['airdrop'], 'attachment://Airdrop.png',
+        EmbedFactory.TITLE_POOLS['airdrop'], EmbedFactory.MILITARY_MESSAGES['airdrop'],
+        fields=(
+            FieldSpec(None, "Status", default="Incoming"),
+            FieldSpec(None, "Priority", default="HIGH"),
+        ),
+        flavor_name="Intelligence Report", event_time=True
+    ),
+    'helicrash_event': EmbedTypeSpec(
+        EmbedFactory.COLORS['helicrash'], 'attachment://Helicrash.png',
+        EmbedFactory.TITLE_POOLS['helicrash'], EmbedFactory.MILITARY_MESSAGES['helicrash'],
+        fields=(
+            FieldSpec('location', "Crash Site", default='Unknown'),
+            FieldSpec(None, "Threat Level", default="EXTREME"),
+        ),
+        flavor_name="Operational Alert", event_time=True
+    ),
+    'trader_event': EmbedTypeSpec(
+        EmbedFactory.COLORS['trader'], 'attachment://Trader.png',
+        EmbedFactory.TITLE_POOLS['trader'], EmbedFactory.TACTICAL_MESSAGES['trader'],
+        fields=(
+            FieldSpec('location', "Trading Post", default='Unknown'),
+            FieldSpec(None, "Status", default="Open"),
+        ),
+        flavor_name="Market Update", event_time=True
+    ),
+    'vehicle_event': EmbedTypeSpec(
+        EmbedFactory.COLORS['vehicle_spawn'], 'attachment://Vehicle.png',
+        EmbedFactory.TITLE_POOLS['vehicle_spawn'], EmbedFactory.MILITARY_MESSAGES['vehicle_spawn'],
+        fields=(
+            FieldSpec('vehicle_type', "Vehicle Type", default='Military Vehicle'),
+            FieldSpec('action', "Status", formatter=_vehicle_status, default='spawn'),
+        ),
+        flavor_name="Logistics Update", event_time=True
+    ),
+    # Table-driven builders (_build_from_spec)
+    'slots': EmbedTypeSpec(
+        EmbedFactory.COLORS['slots'], 'attachment://Gamble.png',
+        flavor_pool=EmbedFactory.COMBAT_LOGS['gambling'],
+        title="🎰 Wasteland Slots",
+        fields=(
+            FieldSpec('slot_display', "Reels", inline=False, truthy=True),
+            FieldSpec('status', "Status", inline=False, truthy=True),
+        ) + _WAGER_FIELDS
+    ),
+    'roulette': EmbedTypeSpec(
+        EmbedFactory.COLORS['roulette'], 'attachment://Gamble.png',
+        flavor_pool=EmbedFactory.COMBAT_LOGS['gambling'],
+        title="🎯 Deadside Roulette",
+        fields=(
+            FieldSpec('status', "Status", inline=False, truthy=True),
+            FieldSpec('player_choice', "Player Pick", truthy=True),
+            FieldSpec('result', "Spin Result", truthy=True),
+        ) + _WAGER_FIELDS
+    ),
+    'blackjack': EmbedTypeSpec(
+        EmbedFactory.COLORS['blackjack'], 'attachment://Gamble.png',
+        flavor_pool=EmbedFactory.COMBAT_LOGS['gambling'],
+        title="🃏 Deadside Blackjack",
+        fields=(
+            FieldSpec('status', "Status", inline=False, truthy=True),
+            FieldSpec('player_hand', "Your Hand", truthy=True),
+            FieldSpec('dealer_hand', "Dealer Hand", truthy=True),
+        ) + _WAGER_FIELDS
+    ),
+    'profile': EmbedTypeSpec(
+        EmbedFactory.COLORS['profile'], 'attachment://main.png',
+        title="👤 Player Profile",
+        fields=(
+            FieldSpec('player_name', "Name", truthy=True),
+            FieldSpec('faction', "Faction", truthy=True),
+            FieldSpec('kills', "Kills", formatter=_INT),
+            FieldSpec('deaths', "Deaths", formatter=_INT),
+            FieldSpec('kdr', "KDR"),
+            FieldSpec('distance', "Distance", formatter=_DIST),
+            FieldSpec('playtime', "Playtime", truthy=True),
+            FieldSpec('bounty', "Bounty", formatter=_MONEY),
+        )
+    ),
+    'admin': EmbedTypeSpec(
+        EmbedFactory.COLORS['admin'], 'attachment://main.png',
+        title="⚙️ Admin Command",
+        fields=(
+            FieldSpec('admin', "Admin", default='Unknown'),
+            FieldSpec('command', "Command", default='Unknown'),
+            FieldSpec('target', "Target", default='Unknown'),
+            FieldSpec('details', "Details", inline=False, default='None'),
+        )
+    ),
+    'comparison': EmbedTypeSpec(
+        EmbedFactory.COLORS['leaderboard'], 'attachment://Leaderboard.png',
+        title="📊 Stat Comparison",
+        fields=(
+            FieldSpec('player1', "Player 1", default='Unknown'),
+            FieldSpec('player2', "Player 2", default='Unknown'),
+            FieldSpec('stat', "Stat", default='Kills'),
+            FieldSpec('value1', "Value 1", default='Unknown'),
+            FieldSpec('value2', "Value 2", default='Unknown'),
+            FieldSpec('winner', "Winner", default='Unknown'),
+        )
+    )
+})
+
+# Asset files behind the factory's default thumbnails, validated once by prewarm
+REQUIRED_ASSETS = frozenset(
+    [spec.thumbnail_file for spec in _SPECS.values() if spec.thumbnail_file]
+    + list(EmbedFactory.THUMBNAILS.values())
+)
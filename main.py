@@ -37,6 +37,7 @@ from bot.parsers.killfeed_parser import KillfeedParser
 from bot.parsers.historical_parser import HistoricalParser
 from bot.parsers.log_parser import LogParser
 from bot.parsers.intelligent_log_parser import IntelligentLogParser
+from bot.utils.embed_factory import EmbedFactory
 
 # Load environment variables (optional for Railway)
 load_dotenv()
@@ -510,13 +511,8 @@ class EmeraldKillfeedBot(commands.Bot):
                 await self.killfeed_parser.cleanup_sftp_connections()
 
             if hasattr(self, 'log_parser') and self.log_parser:
-                # Clean up log parser SFTP connections
-                for pool_key, conn in list(self.log_parser.sftp_pool.items()):
-                    try:
-                        conn.close()
-                    except:
-                        pass
-                self.log_parser.sftp_pool.clear()
+                # Clean up log parser SFTP connections and their pooled channels
+                self.log_parser.close_sftp_pool()
 
             logger.info("Cleaned up all SFTP connections")
 
@@ -600,6 +596,18 @@ class EmeraldKillfeedBot(commands.Bot):
             db_success = await self.setup_database()
             logger.info(f"📊 Database setup: {'✅ Success' if db_success else '❌ Failed'}")
 
+            # Keep asset bytes in memory so embed attachments are served without disk reads.
+            # Loaded in a worker thread before any parser is scheduled, so no embed build
+            # falls back to a blocking read on the event loop
+            try:
+                cached_assets = await EmbedFactory.prewarm()
+                logger.info("🖼️ Cached %d asset files for embeds", cached_assets)
+                missing_assets = EmbedFactory.missing_assets()
+                if missing_assets:
+                    logger.error(f"❌ Missing embed assets, their thumbnails will be skipped: {', '.join(missing_assets)}")
+            except Exception as e:
+                logger.warning(f"⚠️ Asset prewarm failed, assets will load on first use: {e}")
+
             # Start scheduler
             scheduler_success = self.setup_scheduler()
             logger.info(f"⏰ Scheduler setup: {'✅ Success' if scheduler_success else '❌ Failed'}")